@@ -536,6 +536,7 @@ def _clone_runtime_config(config: Optional[WebRuntimeConfig]) -> WebRuntimeConfi
         health_checks=tuple(config.health_checks),
         drain_timeout=config.drain_timeout,
         trust_forwarded_headers=config.trust_forwarded_headers,
+        max_request_body_size=config.max_request_body_size,
     )
 
 
@@ -6,6 +6,8 @@ Provides request body and response body encoding/decoding functionality.
 Supported formats:
 - JSON (application/json)
 - Form (application/x-www-form-urlencoded)
+- MessagePack (application/msgpack, requires ``msgpack``)
+- CBOR (application/cbor, requires ``cbor2``)
 - Extensible custom formats
 
 Author: Cullinan
@@ -14,7 +16,18 @@ Author: Cullinan
 from .base import BodyCodec, ResponseCodec
 from .errors import CodecError, DecodeError, EncodeError
 from .json_codec import JsonBodyCodec, JsonResponseCodec
+from .json_engine import (
+    JsonEngine,
+    get_json_engine,
+    set_json_engine,
+    reset_json_engine,
+    json_dumps,
+    json_loads,
+)
+from .json_stream import JsonArrayDecoder, iter_json_array
 from .form_codec import FormBodyCodec
+from .msgpack_codec import MsgpackBodyCodec, MsgpackResponseCodec
+from .cbor_codec import CborBodyCodec, CborResponseCodec
 from .registry import (
     CodecRegistry,
     get_codec_registry,
@@ -35,6 +48,22 @@ __all__ = [
     'JsonBodyCodec',
     'JsonResponseCodec',
     'FormBodyCodec',
+    'MsgpackBodyCodec',
+    'MsgpackResponseCodec',
+    'CborBodyCodec',
+    'CborResponseCodec',
+
+    # JSON engine
+    'JsonEngine',
+    'get_json_engine',
+    'set_json_engine',
+    'reset_json_engine',
+    'json_dumps',
+    'json_loads',
+
+    # Streaming JSON arrays
+    'JsonArrayDecoder',
+    'iter_json_array',
 
     # Registry
     'CodecRegistry',
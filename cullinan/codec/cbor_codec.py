@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""Cullinan CBOR Codec
+
+CBOR (RFC 8949) request body decoder and response encoder implementation.
+Requires the optional ``cbor2`` package (``pip install cullinan[cbor]``).
+
+Author: Cullinan
+"""
+
+import datetime
+from typing import Any, Dict, Optional
+
+from .base import BodyCodec, ResponseCodec
+from .errors import DecodeError, EncodeError
+from .json_codec import JsonBodyCodec
+from .json_engine import json_default
+
+
+def load_cbor2() -> Optional[Any]:
+    """Return the ``cbor2`` module, or ``None`` when it is not installed."""
+    try:
+        import cbor2
+    except ImportError:
+        return None
+    return cbor2
+
+
+def _require_cbor2(error_cls, **details) -> Any:
+    cbor2 = load_cbor2()
+    if cbor2 is None:
+        raise error_cls("CBOR support requires the 'cbor2' package", **details)
+    return cbor2
+
+
+class CborBodyCodec(BodyCodec):
+    """CBOR request body decoder
+
+    Supported Content-Types:
+    - application/cbor
+    """
+
+    content_types = ['application/cbor']
+    priority = 30
+
+    def decode(self, body: bytes, charset: str = 'utf-8') -> Dict[str, Any]:
+        """Decode a CBOR request body
+
+        Args:
+            body: Raw request body bytes
+            charset: Ignored (CBOR text strings are always UTF-8)
+
+        Returns:
+            Decoded dictionary (non-map values are wrapped as ``{'_value': ...}``)
+
+        Raises:
+            DecodeError: Decoding failed
+        """
+        if not body:
+            return {}
+        cbor2 = _require_cbor2(DecodeError, content_type='application/cbor')
+        try:
+            return JsonBodyCodec.as_dict(cbor2.loads(body))
+        except Exception as e:
+            raise DecodeError(
+                f"Invalid CBOR: {e}",
+                content_type='application/cbor',
+                body_preview=body
+            )
+
+    def encode(self, data: Dict[str, Any], charset: str = 'utf-8') -> bytes:
+        """Encode to CBOR
+
+        Args:
+            data: Dictionary to encode
+            charset: Ignored
+
+        Returns:
+            CBOR bytes
+        """
+        return _dumps(data)
+
+
+class CborResponseCodec(ResponseCodec):
+    """CBOR response encoder
+
+    ``datetime``, ``UUID`` and ``Decimal`` use CBOR's native tags (naive
+    datetimes are taken as UTC); dataclasses and other values are converted
+    the same way as for JSON responses.
+    """
+
+    content_type = 'application/cbor'
+    accept_types = ['application/cbor']
+    priority = 30
+
+    def encode(self, data: Any, charset: str = 'utf-8') -> bytes:
+        """Encode response data as CBOR
+
+        Args:
+            data: Response data
+            charset: Ignored
+
+        Returns:
+            CBOR bytes
+
+        Raises:
+            EncodeError: Serialization failed
+        """
+        return _dumps(data)
+
+    def get_content_type(self, charset: str = 'utf-8') -> str:
+        """Binary format: no charset parameter"""
+        return self.content_type
+
+
+def _default(encoder: Any, value: Any) -> None:
+    encoder.encode(json_default(value))
+
+
+def _dumps(data: Any) -> bytes:
+    cbor2 = _require_cbor2(EncodeError, data_type=type(data))
+    try:
+        return cbor2.dumps(data, default=_default, timezone=datetime.timezone.utc)
+    except Exception as e:
+        raise EncodeError(
+            f"Failed to encode as CBOR: {e}",
+            data_type=type(data)
+        )
@@ -6,11 +6,11 @@ JSON request body decoder and response encoder implementation.
 Author: Cullinan
 """
 
-import json
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 
 from .base import BodyCodec, ResponseCodec
 from .errors import DecodeError, EncodeError
+from .json_engine import get_json_engine, json_default, strict_json_default
 
 
 class JsonBodyCodec(BodyCodec):
@@ -42,14 +42,9 @@ class JsonBodyCodec(BodyCodec):
             return {}
 
         try:
-            decoded = body.decode(charset)
-            result = json.loads(decoded)
-
-            # Ensure we return a dict
-            if isinstance(result, dict):
-                return result
-            # Wrap non-dict values (e.g., JSON arrays or scalars)
-            return {'_value': result}
+            # Engines parse UTF-8 bytes directly; other charsets are decoded first
+            result = get_json_engine().loads(body if _is_utf8(charset) else body.decode(charset))
+            return self.as_dict(result)
 
         except UnicodeDecodeError as e:
             raise DecodeError(
@@ -57,13 +52,24 @@ class JsonBodyCodec(BodyCodec):
                 content_type='application/json',
                 body_preview=body
             )
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             raise DecodeError(
                 f"Invalid JSON: {e}",
                 content_type='application/json',
                 body_preview=body
             )
 
+    @staticmethod
+    def as_dict(value: Any) -> Dict[str, Any]:
+        """Return a decoded JSON value as the dictionary ``decode`` produces
+
+        Objects are returned as is; other values (arrays, scalars) are
+        wrapped as ``{'_value': value}``.
+        """
+        if isinstance(value, dict):
+            return value
+        return {'_value': value}
+
     def encode(self, data: Dict[str, Any], charset: str = 'utf-8') -> bytes:
         """Encode to JSON
 
@@ -73,9 +79,13 @@ class JsonBodyCodec(BodyCodec):
 
         Returns:
             JSON bytes
+
+        Raises:
+            EncodeError: ``data`` holds a value with no JSON representation
         """
         try:
-            return json.dumps(data, ensure_ascii=False).encode(charset)
+            # Strict: unknown objects are an error, not silently str()-ed
+            return _encode(data, charset, strict_json_default)
         except (TypeError, ValueError) as e:
             raise EncodeError(
                 f"Failed to encode as JSON: {e}",
@@ -107,15 +117,22 @@ class JsonResponseCodec(ResponseCodec):
             EncodeError: Serialization failed
         """
         try:
-            # Use default=str to handle non-serializable types
-            return json.dumps(
-                data,
-                ensure_ascii=False,
-                default=str
-            ).encode(charset)
+            # The engine handles dataclasses/datetimes/UUIDs and falls back to str()
+            return _encode(data, charset, json_default)
         except Exception as e:
             raise EncodeError(
                 f"Failed to encode response as JSON: {e}",
                 data_type=type(data)
             )
 
+
+
+def _is_utf8(charset: str) -> bool:
+    return charset.lower().replace('_', '-') in ('utf-8', 'utf8')
+
+
+def _encode(data: Any, charset: str, default: Callable[[Any], Any]) -> bytes:
+    encoded = get_json_engine().dumps(data, default)
+    if _is_utf8(charset):
+        return encoded
+    return encoded.decode('utf-8').encode(charset)
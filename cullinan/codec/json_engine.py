@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+"""Cullinan JSON Engine
+
+Single JSON encode/decode abstraction shared by the codecs, ``WebRequest``,
+``WebResponse`` and the dispatcher.
+
+The standard library ``json`` module is used by default and keeps its usual
+output (``{"key": "value"}`` spacing, no ``\\uXXXX`` escapes).  Set the
+``CULLINAN_JSON_ENGINE`` environment variable or call :func:`set_json_engine`
+to pick another backend; ``auto`` selects the fastest installed one
+(``orjson`` → ``msgspec`` → ``ujson`` → stdlib ``json``).  The third-party
+backends always write compact JSON (``{"key":"value"}``); pass
+``compact=True`` to :class:`StdlibJsonEngine` for the same from the stdlib.
+
+Every engine encodes the same values: dataclasses as objects,
+``datetime``/``date``/``time`` as ISO 8601, ``UUID``/``Decimal`` as strings,
+``Enum`` as its value, sets as arrays, and ``str()`` for anything else.
+
+Author: Cullinan
+"""
+
+import dataclasses
+import datetime
+import decimal
+import enum
+import json
+import logging
+import os
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+ENGINE_ENV_VAR = 'CULLINAN_JSON_ENGINE'
+
+
+def strict_json_default(obj: Any) -> Any:
+    """Convert values the JSON data model lacks into serializable ones
+
+    Raises:
+        TypeError: ``obj`` has no JSON representation
+    """
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, (uuid.UUID, decimal.Decimal)):
+        return str(obj)
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        return bytes(obj).decode('utf-8', errors='replace')
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+def json_default(obj: Any) -> Any:
+    """Like ``strict_json_default``, but falls back to ``str()`` instead of raising"""
+    try:
+        return strict_json_default(obj)
+    except TypeError:
+        return str(obj)
+
+
+class JsonEngine(ABC):
+    """JSON backend interface
+
+    ``dumps`` returns UTF-8 bytes and converts non-JSON values with
+    ``default`` (``json_default`` unless given; pass ``strict_json_default``
+    to raise ``TypeError`` instead); ``loads`` accepts bytes or str and raises
+    ``ValueError`` on malformed input (``json.JSONDecodeError`` and the
+    backends' own decode errors are all ``ValueError`` subclasses).
+    """
+
+    name: str = 'abstract'
+
+    @abstractmethod
+    def dumps(self, obj: Any, default: Callable[[Any], Any] = json_default) -> bytes:
+        """Encode ``obj`` as UTF-8 JSON bytes"""
+
+    @abstractmethod
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decode a JSON document"""
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} {self.name}>'
+
+
+class StdlibJsonEngine(JsonEngine):
+    """Standard library ``json`` (always available)
+
+    Args:
+        compact: Drop the spaces after ``,`` and ``:`` (matches the
+            third-party engines' output)
+    """
+
+    name = 'json'
+
+    def __init__(self, compact: bool = False) -> None:
+        self._separators = (',', ':') if compact else None
+        self._encoders: Dict[Callable[[Any], Any], json.JSONEncoder] = {}
+        self._decode = json.JSONDecoder().decode
+
+    def dumps(self, obj: Any, default: Callable[[Any], Any] = json_default) -> bytes:
+        encoder = self._encoders.get(default)
+        if encoder is None:
+            encoder = self._encoders[default] = json.JSONEncoder(
+                ensure_ascii=False, separators=self._separators, default=default,
+            )
+        return encoder.encode(obj).encode('utf-8')
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        if isinstance(data, (bytes, bytearray)):
+            data = data.decode('utf-8')
+        return self._decode(data)
+
+
+class OrjsonEngine(JsonEngine):
+    """``orjson`` — serializes dataclasses, datetimes and UUIDs natively"""
+
+    name = 'orjson'
+
+    def __init__(self, orjson: Any) -> None:
+        self._dumps = orjson.dumps
+        self._option = orjson.OPT_NON_STR_KEYS
+        self._loads = orjson.loads
+
+    def dumps(self, obj: Any, default: Callable[[Any], Any] = json_default) -> bytes:
+        return self._dumps(obj, default=default, option=self._option)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._loads(data)
+
+
+class MsgspecEngine(JsonEngine):
+    """``msgspec.json`` — serializes dataclasses, datetimes and UUIDs natively"""
+
+    name = 'msgspec'
+
+    def __init__(self, msgspec: Any) -> None:
+        self._encoder_type = msgspec.json.Encoder
+        self._encoders: Dict[Callable[[Any], Any], Callable[[Any], bytes]] = {}
+        self._decode = msgspec.json.Decoder().decode
+
+    def dumps(self, obj: Any, default: Callable[[Any], Any] = json_default) -> bytes:
+        encode = self._encoders.get(default)
+        if encode is None:
+            encode = self._encoders[default] = self._encoder_type(enc_hook=default).encode
+        return encode(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._decode(data)
+
+
+class UjsonEngine(JsonEngine):
+    """``ujson`` — fast, but non-JSON types go through ``default``"""
+
+    name = 'ujson'
+
+    def __init__(self, ujson: Any) -> None:
+        self._dumps = ujson.dumps
+        self._loads = ujson.loads
+
+    def dumps(self, obj: Any, default: Callable[[Any], Any] = json_default) -> bytes:
+        return self._dumps(obj, ensure_ascii=False, default=default).encode('utf-8')
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._loads(data)
+
+
+def _load_orjson() -> Optional[JsonEngine]:
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return OrjsonEngine(orjson)
+
+
+def _load_msgspec() -> Optional[JsonEngine]:
+    try:
+        import msgspec
+    except ImportError:
+        return None
+    return MsgspecEngine(msgspec)
+
+
+def _load_ujson() -> Optional[JsonEngine]:
+    try:
+        import ujson
+    except ImportError:
+        return None
+    return UjsonEngine(ujson)
+
+
+# ``auto`` selection order, fastest first
+_ENGINE_LOADERS: Dict[str, Callable[[], Optional[JsonEngine]]] = {
+    'orjson': _load_orjson,
+    'msgspec': _load_msgspec,
+    'ujson': _load_ujson,
+    'json': StdlibJsonEngine,
+}
+
+
+def load_json_engine(name: str) -> JsonEngine:
+    """Instantiate the engine called ``name`` (``'auto'`` picks the fastest installed)
+
+    Raises:
+        ValueError: Unknown engine name
+        ImportError: The backing package is not installed
+    """
+    key = name.strip().lower()
+    if key == 'stdlib':
+        key = 'json'
+    if key == 'auto':
+        return _fastest_engine()
+    loader = _ENGINE_LOADERS.get(key)
+    if loader is None:
+        raise ValueError(
+            f"Unknown JSON engine {name!r}; expected 'auto' or one of {', '.join(_ENGINE_LOADERS)}"
+        )
+    engine = loader()
+    if engine is None:
+        raise ImportError(f"JSON engine {name!r} is not installed")
+    return engine
+
+
+def _select_engine() -> JsonEngine:
+    requested = os.getenv(ENGINE_ENV_VAR, '').strip()
+    if requested:
+        try:
+            return load_json_engine(requested)
+        except (ValueError, ImportError) as exc:
+            logger.warning('%s=%s ignored: %s', ENGINE_ENV_VAR, requested, exc)
+    return StdlibJsonEngine()
+
+
+def _fastest_engine() -> JsonEngine:
+    for loader in _ENGINE_LOADERS.values():
+        engine = loader()
+        if engine is not None:
+            return engine
+    return StdlibJsonEngine()
+
+
+# Global engine
+_json_engine: Optional[JsonEngine] = None
+
+
+def get_json_engine() -> JsonEngine:
+    """Get the global JSON engine
+
+    Returns:
+        The selected JsonEngine (resolved on first use)
+    """
+    global _json_engine
+    if _json_engine is None:
+        _json_engine = _select_engine()
+        logger.debug('Using JSON engine: %s', _json_engine.name)
+    return _json_engine
+
+
+def set_json_engine(engine: Union[str, JsonEngine]) -> JsonEngine:
+    """Pin the global JSON engine
+
+    Args:
+        engine: An engine name (``'auto'``, ``'orjson'``, ``'msgspec'``,
+            ``'ujson'``, ``'json'``) or a JsonEngine instance
+
+    Returns:
+        The engine now in use
+    """
+    global _json_engine
+    _json_engine = load_json_engine(engine) if isinstance(engine, str) else engine
+    return _json_engine
+
+
+def reset_json_engine() -> None:
+    """Reset the global engine so it is re-selected on next use (for testing)"""
+    global _json_engine
+    _json_engine = None
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Encode ``obj`` with the global engine"""
+    return get_json_engine().dumps(obj)
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Decode ``data`` with the global engine"""
+    return get_json_engine().loads(data)
@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""Cullinan Streaming JSON Array Decoder
+
+Incrementally splits a top-level JSON array into its elements as body
+chunks arrive, so very large array bodies can be processed without
+buffering the whole payload.  Only the bytes of the element currently being
+scanned are kept; each completed element is decoded with the global JSON
+engine.
+
+Author: Cullinan
+"""
+
+import re
+from typing import Any, AsyncIterable, AsyncIterator, List, Optional
+
+from .errors import DecodeError
+from .json_engine import get_json_engine
+
+_WHITESPACE = b' \t\r\n'
+# Bytes that change nesting or end a top-level scalar
+_STRUCTURAL = re.compile(rb'["\[\]{},]')
+# Bytes that end or escape inside a string
+_STRING_SPECIAL = re.compile(rb'["\\]')
+
+# Scanner states
+_START = 0          # before '['
+_FIRST = 1          # after '[': element or ']'
+_VALUE = 2          # after ',': element required
+_SEPARATOR = 3      # after an element: ',' or ']'
+_ITEM = 4           # inside an element
+_END = 5            # after the closing ']'
+
+
+class JsonArrayDecoder:
+    """Incremental decoder for a top-level JSON array
+
+    Example:
+        decoder = JsonArrayDecoder()
+        for chunk in chunks:
+            for item in decoder.feed(chunk):
+                handle(item)
+        decoder.close()
+
+    Args:
+        max_item_size: Reject elements larger than this many bytes
+            (``None`` for no limit)
+    """
+
+    def __init__(self, max_item_size: Optional[int] = None) -> None:
+        self.max_item_size = max_item_size
+        self.count = 0
+        self._buffer = bytearray()
+        self._pos = 0
+        self._state = _START
+        self._item_start = 0
+        self._depth = 0
+        self._in_string = False
+        self._loads = get_json_engine().loads
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Consume a chunk and return the elements it completed
+
+        Raises:
+            DecodeError: The body is not a well-formed JSON array
+        """
+        buf = self._buffer
+        buf += chunk
+        items: List[Any] = []
+        size = len(buf)
+        i = self._pos
+
+        while i < size:
+            state = self._state
+            if state == _ITEM:
+                end = self._scan_item(buf, i, size)
+                limit = self.max_item_size
+                if limit is not None and (size if end < 0 else end) - self._item_start > limit:
+                    raise self._error(f"Array item [{self.count}] exceeds {limit} bytes")
+                if end < 0:
+                    i = -end - 1
+                    break
+                items.append(self._decode(buf, self._item_start, end))
+                self._state = _SEPARATOR
+                i = end
+                continue
+
+            byte = buf[i]
+            if byte in _WHITESPACE:
+                i += 1
+                continue
+            if state == _START:
+                if byte != 0x5B:  # '['
+                    raise self._error("Request body is not a JSON array", buf)
+                self._state = _FIRST
+            elif state == _END:
+                raise self._error("Unexpected data after the JSON array", buf)
+            elif state == _SEPARATOR:
+                if byte == 0x2C:  # ','
+                    self._state = _VALUE
+                elif byte == 0x5D:  # ']'
+                    self._state = _END
+                else:
+                    raise self._error(f"Expected ',' or ']' after array item [{self.count - 1}]", buf)
+            elif byte == 0x5D and state == _FIRST:
+                self._state = _END
+            elif byte in b',]':
+                raise self._error(f"Missing array item [{self.count}]", buf)
+            else:
+                self._state = _ITEM
+                self._item_start = i
+                self._depth = 0
+                self._in_string = False
+                continue
+            i += 1
+
+        # Drop everything before the element being scanned
+        if self._state == _ITEM:
+            consumed = self._item_start
+            self._item_start = 0
+        else:
+            consumed = min(i, size)
+        if consumed:
+            del buf[:consumed]
+        self._pos = i - consumed
+        return items
+
+    def close(self) -> None:
+        """Signal the end of the body
+
+        An empty body is accepted as an empty array.
+
+        Raises:
+            DecodeError: The array is incomplete
+        """
+        if self._state not in (_START, _END):
+            raise self._error("Unexpected end of JSON array", self._buffer)
+        if self._state == _START and self._buffer.strip(_WHITESPACE):
+            raise self._error("Request body is not a JSON array", self._buffer)
+
+    def _scan_item(self, buf: bytearray, i: int, size: int) -> int:
+        """Scan an element from ``i``
+
+        Returns the element's end offset, or ``-(resume offset) - 1`` when
+        more data is needed.
+        """
+        depth = self._depth
+        in_string = self._in_string
+        while True:
+            if in_string:
+                match = _STRING_SPECIAL.search(buf, i)
+                if match is None:
+                    i = max(i, size)
+                    break
+                if buf[match.start()] == 0x5C:  # backslash: skip the escaped byte
+                    i = match.start() + 2
+                    continue
+                in_string = False
+                i = match.end()
+                if depth == 0:
+                    return i
+                continue
+
+            match = _STRUCTURAL.search(buf, i)
+            if match is None:
+                i = size
+                break
+            byte = buf[match.start()]
+            if byte == 0x22:  # '"'
+                in_string = True
+                i = match.end()
+            elif byte in b'[{':
+                depth += 1
+                i = match.end()
+            elif depth == 0:
+                # ',' or ']' terminates a top-level scalar
+                return match.start()
+            elif byte == 0x2C:
+                i = match.end()
+            else:
+                depth -= 1
+                i = match.end()
+                if depth == 0:
+                    return i
+
+        self._depth = depth
+        self._in_string = in_string
+        return -i - 1
+
+    def _decode(self, buf: bytearray, start: int, end: int) -> Any:
+        index = self.count
+        self.count += 1
+        data = bytes(buf[start:end])
+        try:
+            return self._loads(data)
+        except ValueError as e:
+            raise self._error(f"Invalid JSON in array item [{index}]: {e}", data)
+
+    @staticmethod
+    def _error(message: str, body: Optional[bytes] = None) -> DecodeError:
+        return DecodeError(
+            message,
+            content_type='application/json',
+            body_preview=bytes(body) if body else None,
+        )
+
+
+async def iter_json_array(
+    chunks: AsyncIterable[bytes],
+    max_item_size: Optional[int] = None,
+) -> AsyncIterator[Any]:
+    """Yield the elements of a JSON array body as its chunks arrive
+
+    Args:
+        chunks: Body chunks, e.g. ``request.stream()``
+        max_item_size: Reject elements larger than this many bytes
+
+    Raises:
+        DecodeError: The body is not a well-formed JSON array
+    """
+    decoder = JsonArrayDecoder(max_item_size)
+    async for chunk in chunks:
+        for item in decoder.feed(chunk):
+            yield item
+    decoder.close()
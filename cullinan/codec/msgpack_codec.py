@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""Cullinan MessagePack Codec
+
+MessagePack request body decoder and response encoder implementation.
+Requires the optional ``msgpack`` package (``pip install cullinan[msgpack]``).
+
+Author: Cullinan
+"""
+
+from typing import Any, Dict, Optional
+
+from .base import BodyCodec, ResponseCodec
+from .errors import DecodeError, EncodeError
+from .json_codec import JsonBodyCodec
+from .json_engine import json_default
+
+
+def load_msgpack() -> Optional[Any]:
+    """Return the ``msgpack`` module, or ``None`` when it is not installed."""
+    try:
+        import msgpack
+    except ImportError:
+        return None
+    return msgpack
+
+
+def _require_msgpack(error_cls, **details) -> Any:
+    msgpack = load_msgpack()
+    if msgpack is None:
+        raise error_cls("MessagePack support requires the 'msgpack' package", **details)
+    return msgpack
+
+
+class MsgpackBodyCodec(BodyCodec):
+    """MessagePack request body decoder
+
+    Supported Content-Types:
+    - application/msgpack
+    - application/x-msgpack
+    - application/vnd.msgpack
+    """
+
+    content_types = ['application/msgpack', 'application/x-msgpack', 'application/vnd.msgpack']
+    priority = 30
+
+    def decode(self, body: bytes, charset: str = 'utf-8') -> Dict[str, Any]:
+        """Decode a MessagePack request body
+
+        Args:
+            body: Raw request body bytes
+            charset: Ignored (MessagePack strings are always UTF-8)
+
+        Returns:
+            Decoded dictionary (non-map values are wrapped as ``{'_value': ...}``)
+
+        Raises:
+            DecodeError: Unpacking failed
+        """
+        if not body:
+            return {}
+        msgpack = _require_msgpack(DecodeError, content_type='application/msgpack')
+        try:
+            return JsonBodyCodec.as_dict(msgpack.unpackb(body, raw=False))
+        except Exception as e:
+            raise DecodeError(
+                f"Invalid MessagePack: {e}",
+                content_type='application/msgpack',
+                body_preview=body
+            )
+
+    def encode(self, data: Dict[str, Any], charset: str = 'utf-8') -> bytes:
+        """Encode to MessagePack
+
+        Args:
+            data: Dictionary to encode
+            charset: Ignored
+
+        Returns:
+            MessagePack bytes
+        """
+        return _pack(data)
+
+
+class MsgpackResponseCodec(ResponseCodec):
+    """MessagePack response encoder
+
+    Dataclasses, datetimes, UUIDs and Decimals are converted the same way
+    as for JSON responses.
+    """
+
+    content_type = 'application/msgpack'
+    accept_types = ['application/msgpack', 'application/x-msgpack', 'application/vnd.msgpack']
+    priority = 30
+
+    def encode(self, data: Any, charset: str = 'utf-8') -> bytes:
+        """Encode response data as MessagePack
+
+        Args:
+            data: Response data
+            charset: Ignored
+
+        Returns:
+            MessagePack bytes
+
+        Raises:
+            EncodeError: Serialization failed
+        """
+        return _pack(data)
+
+    def get_content_type(self, charset: str = 'utf-8') -> str:
+        """Binary format: no charset parameter"""
+        return self.content_type
+
+
+def _pack(data: Any) -> bytes:
+    msgpack = _require_msgpack(EncodeError, data_type=type(data))
+    try:
+        return msgpack.packb(data, default=json_default, use_bin_type=True)
+    except Exception as e:
+        raise EncodeError(
+            f"Failed to encode as MessagePack: {e}",
+            data_type=type(data)
+        )
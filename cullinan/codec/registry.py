@@ -11,11 +11,20 @@ from typing import Any, Dict, List, Optional, Tuple, Type
 from .base import BodyCodec, ResponseCodec
 
 
+# Upper bound for the memoised lookup tables; header values are client
+# controlled, so unseen values stop being cached once the table is full.
+_MAX_CACHED_LOOKUPS = 512
+
+
 class CodecRegistry:
     """Codec registry
 
     Manages registration and selection of all BodyCodec and ResponseCodec instances.
 
+    Codecs are stateless, so each registered class is instantiated once and
+    shared.  ``Content-Type`` → body codec and ``Accept`` → response codec
+    lookups are memoised; registering or unregistering a codec clears them.
+
     Example:
         registry = get_codec_registry()
 
@@ -32,6 +41,10 @@ class CodecRegistry:
     def __init__(self):
         self._body_codecs: List[Type[BodyCodec]] = []
         self._response_codecs: List[Type[ResponseCodec]] = []
+        self._instances: Dict[type, Any] = {}
+        self._body_lookup: Dict[str, Optional[BodyCodec]] = {}
+        self._response_lookup: Dict[str, Optional[ResponseCodec]] = {}
+        self._negotiates_responses: Optional[bool] = None
 
     def register_body_codec(self, codec_class: Type[BodyCodec]) -> None:
         """Register a body codec
@@ -43,6 +56,7 @@ class CodecRegistry:
             self._body_codecs.append(codec_class)
             # Sort by priority (smaller number = higher priority)
             self._body_codecs.sort(key=lambda c: c.priority)
+            self._invalidate()
 
     def register_response_codec(self, codec_class: Type[ResponseCodec]) -> None:
         """Register a response codec
@@ -53,16 +67,44 @@ class CodecRegistry:
         if codec_class not in self._response_codecs:
             self._response_codecs.append(codec_class)
             self._response_codecs.sort(key=lambda c: c.priority)
+            self._invalidate()
 
     def unregister_body_codec(self, codec_class: Type[BodyCodec]) -> None:
         """Unregister a body codec"""
         if codec_class in self._body_codecs:
             self._body_codecs.remove(codec_class)
+            self._invalidate()
 
     def unregister_response_codec(self, codec_class: Type[ResponseCodec]) -> None:
         """Unregister a response codec"""
         if codec_class in self._response_codecs:
             self._response_codecs.remove(codec_class)
+            self._invalidate()
+
+    def _invalidate(self) -> None:
+        self._body_lookup.clear()
+        self._response_lookup.clear()
+        self._negotiates_responses = None
+
+    def negotiates_responses(self) -> bool:
+        """Whether ``Accept`` can select a response codec other than JSON.
+
+        Structured responses then depend on the ``Accept`` header and must
+        carry ``Vary: Accept``.
+        """
+        negotiates = self._negotiates_responses
+        if negotiates is None:
+            from .json_codec import JsonResponseCodec
+            negotiates = self._negotiates_responses = any(
+                not issubclass(codec_class, JsonResponseCodec) for codec_class in self._response_codecs
+            )
+        return negotiates
+
+    def _instance(self, codec_class: type) -> Any:
+        codec = self._instances.get(codec_class)
+        if codec is None:
+            codec = self._instances[codec_class] = codec_class()
+        return codec
 
     def get_body_codec(self, content_type: str) -> Optional[BodyCodec]:
         """Get a body codec instance by Content-Type
@@ -71,27 +113,71 @@ class CodecRegistry:
             content_type: HTTP Content-Type header
 
         Returns:
-            Codec instance, or None if no match
+            Shared codec instance, or None if no match
         """
+        key = content_type or ''
+        try:
+            return self._body_lookup[key]
+        except KeyError:
+            pass
+        codec = None
         for codec_class in self._body_codecs:
             if codec_class.supports(content_type):
-                return codec_class()
-        return None
+                codec = self._instance(codec_class)
+                break
+        if len(self._body_lookup) < _MAX_CACHED_LOOKUPS:
+            self._body_lookup[key] = codec
+        return codec
 
     def get_response_codec(self, accept: str = '*/*') -> Optional[ResponseCodec]:
         """Get a response codec instance by Accept type
 
+        Media ranges are tried by descending q-value, then specificity
+        (``type/subtype`` before ``type/*`` before ``*/*``), then header order;
+        within a range, codecs are tried by priority.  Ranges with ``q=0``
+        exclude the codecs they name.
+
         Args:
             accept: HTTP Accept header
 
         Returns:
-            Codec instance, or None if no match
+            Shared codec instance, or None if no match
         """
-        for codec_class in self._response_codecs:
-            if codec_class.supports_accept(accept):
-                return codec_class()
+        key = accept or ''
+        try:
+            return self._response_lookup[key]
+        except KeyError:
+            pass
+        codec = self._negotiate_response_codec(key)
+        if len(self._response_lookup) < _MAX_CACHED_LOOKUPS:
+            self._response_lookup[key] = codec
+        return codec
+
+    def _negotiate_response_codec(self, accept: str) -> Optional[ResponseCodec]:
+        ranges = parse_accept(accept) if accept.strip() else [('*/*', 1.0)]
+        excluded = set()
+        for media_range, q in ranges:
+            if q <= 0:
+                excluded.update(self._response_codecs_for(media_range))
+        for media_range, q in ranges:
+            if q <= 0:
+                continue
+            for codec_class in self._response_codecs_for(media_range):
+                if codec_class not in excluded:
+                    return self._instance(codec_class)
         return None
 
+    def _response_codecs_for(self, media_range: str) -> List[Type[ResponseCodec]]:
+        if media_range == '*/*':
+            return [c for c in self._response_codecs if c.supports_accept('*/*')]
+        if media_range.endswith('/*'):
+            prefix = media_range[:-1]
+            return [
+                c for c in self._response_codecs
+                if any(at.startswith(prefix) for at in c.accept_types)
+            ]
+        return [c for c in self._response_codecs if c.supports_accept(media_range)]
+
     def decode_body(
         self,
         body: bytes,
@@ -117,7 +203,7 @@ class CodecRegistry:
 
         # Fall back to JSON
         from .json_codec import JsonBodyCodec
-        return JsonBodyCodec().decode(body, charset)
+        return self._instance(JsonBodyCodec).decode(body, charset)
 
     def encode_response(
         self,
@@ -144,7 +230,7 @@ class CodecRegistry:
 
         # Fall back to JSON
         from .json_codec import JsonResponseCodec
-        default_codec = JsonResponseCodec()
+        default_codec = self._instance(JsonResponseCodec)
         return default_codec.encode(data, charset), default_codec.get_content_type(charset)
 
     def list_body_codecs(self) -> List[Type[BodyCodec]]:
@@ -156,6 +242,37 @@ class CodecRegistry:
         return list(self._response_codecs)
 
 
+def parse_accept(accept: str) -> List[Tuple[str, float]]:
+    """Parse an ``Accept`` header into ``(media_range, q)`` pairs, best first
+
+    Ordered by descending q-value, then specificity, then header order.
+    Media-type parameters other than ``q`` are dropped.
+    """
+    ranked = []
+    for order, item in enumerate(accept.split(',')):
+        media_range, *params = item.split(';')
+        media_range = media_range.strip().lower()
+        if not media_range:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if media_range == '*/*':
+            specificity = 0
+        elif media_range.endswith('/*'):
+            specificity = 1
+        else:
+            specificity = 2
+        ranked.append((-q, -specificity, order, media_range))
+    ranked.sort()
+    return [(media_range, -neg_q) for neg_q, _spec, _order, media_range in ranked]
+
+
 # Global registry instance
 _codec_registry: Optional[CodecRegistry] = None
 
@@ -175,6 +292,15 @@ def get_codec_registry() -> CodecRegistry:
         _codec_registry.register_body_codec(JsonBodyCodec)
         _codec_registry.register_body_codec(FormBodyCodec)
         _codec_registry.register_response_codec(JsonResponseCodec)
+        # Binary codecs are only offered when their optional package is installed
+        from .msgpack_codec import MsgpackBodyCodec, MsgpackResponseCodec, load_msgpack
+        from .cbor_codec import CborBodyCodec, CborResponseCodec, load_cbor2
+        if load_msgpack() is not None:
+            _codec_registry.register_body_codec(MsgpackBodyCodec)
+            _codec_registry.register_response_codec(MsgpackResponseCodec)
+        if load_cbor2() is not None:
+            _codec_registry.register_body_codec(CborBodyCodec)
+            _codec_registry.register_response_codec(CborResponseCodec)
     return _codec_registry
 
 
@@ -16,7 +16,7 @@ Author: Cullinan
 
 import asyncio
 import logging
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
 
 from cullinan._api_boundary import in_public_api_context
 from cullinan.core.semantic_rules import PublicAPISemanticWarning, warn_semantic_once
@@ -26,8 +26,14 @@ from cullinan.application.model import (
     release_runtime_request_context,
 )
 from cullinan.web.gateway.dispatcher import Dispatcher
-from cullinan.web.gateway.web_core import WebRequest, WebResponse
-from .base import WebAdapter
+from cullinan.web.gateway.web_core import (
+    FileResponse,
+    RequestBodyTooLarge,
+    StreamingResponse,
+    WebRequest,
+    WebResponse,
+)
+from .base import WebAdapter, normalize_global_headers
 
 logger = logging.getLogger(__name__)
 
@@ -59,8 +65,19 @@ class ASGIAdapter(WebAdapter):
         dispatcher: Dispatcher,
         global_headers: Optional[list] = None,
         runtime: Any = None,
+        max_body_size: Optional[int] = None,
     ) -> None:
+        """
+        Args:
+            dispatcher: The gateway dispatcher every request is funnelled to.
+            global_headers: Legacy ``[name, value]`` pairs added to every response.
+            runtime: Optional ``WebRuntime`` this adapter serves.
+            max_body_size: Maximum request body size in bytes; larger bodies
+                are rejected with 413.  Defaults to the runtime config's
+                ``max_request_body_size`` (unlimited when unset).
+        """
         super().__init__(dispatcher, runtime=runtime)
+        self._max_body_size: Optional[int] = max_body_size
         self._global_headers: list = global_headers or []
         self._asgi_app: Optional[Callable] = None
         self._request_adapter = ASGIRequestAdapter()
@@ -82,12 +99,25 @@ class ASGIAdapter(WebAdapter):
     def create_response_writer(self) -> DriverResponseWriter:
         return self._response_writer
 
+    @property
+    def max_body_size(self) -> Optional[int]:
+        if self._max_body_size is not None:
+            return self._max_body_size
+        config = getattr(self.runtime, 'config', None)
+        return getattr(config, 'max_request_body_size', None)
+
     def create_app(self) -> Callable:
-        """Create and return the ASGI 3.0 application callable."""
+        """Create and return the ASGI 3.0 application callable.
+
+        The request adapter and response writer are resolved here once and
+        shared by every request the app serves.
+        """
+        request_adapter = self.create_request_adapter()
+        response_writer = self.create_response_writer()
 
         async def asgi_app(scope: Scope, receive: Receive, send: Send) -> None:
             if scope['type'] == 'http':
-                await _handle_http(scope, receive, send, self)
+                await _handle_http(scope, receive, send, self, request_adapter, response_writer)
             elif scope['type'] == 'websocket':
                 await _handle_websocket(scope, receive, send)
             elif scope['type'] == 'lifespan':
@@ -161,6 +191,8 @@ async def _handle_http(
     receive: Receive,
     send: Send,
     adapter: ASGIAdapter,
+    request_adapter: DriverRequestAdapter,
+    response_writer: DriverResponseWriter,
 ) -> None:
     """Handle an ASGI HTTP request.
 
@@ -174,24 +206,48 @@ async def _handle_http(
         if runtime is not None:
             runtime.begin_request()
         binding = bind_runtime_request_context(runtime)
-        # 1. Read full body
-        body = b''
-        while True:
-            message = await receive()
-            body += message.get('body', b'')
-            if not message.get('more_body', False):
-                break
+        max_body_size = adapter.max_body_size
+
+        # 1. Reject oversized bodies up front when Content-Length says so
+        if max_body_size is not None:
+            declared = _declared_content_length(scope)
+            if declared is not None and declared > max_body_size:
+                await response_writer.write_response(
+                    WebResponse.error(413, str(RequestBodyTooLarge(max_body_size))),
+                    send,
+                )
+                return
 
-        # 2. Build WebRequest from ASGI scope
-        request = await adapter.create_request_adapter().build_request(scope, body)
+        # 2. Read the first body message; anything larger stays a lazy stream
+        message = await receive()
+        first_chunk = message.get('body', b'')
+        body_stream = None
+        if message.get('more_body', False):
+            body_stream = _receive_body_chunks(first_chunk, receive, max_body_size)
+            first_chunk = b''
+        elif max_body_size is not None and len(first_chunk) > max_body_size:
+            await response_writer.write_response(
+                WebResponse.error(413, str(RequestBodyTooLarge(max_body_size))),
+                send,
+            )
+            return
+
+        # 3. Build WebRequest from ASGI scope
+        request = await request_adapter.build_request(scope, first_chunk, body_stream=body_stream)
         if runtime is not None:
             request.attributes['runtime'] = runtime
 
-        # 3. Dispatch
+        # 4. Dispatch
         response = await adapter.dispatcher.dispatch(request)
 
-        # 4. Send response via ASGI
-        await adapter.create_response_writer().write_response(response, send)
+        # 5. Send response via ASGI; once the body is fully read, ``receive``
+        # is only used to notice clients that go away mid-stream.
+        await response_writer.write_response(
+            response,
+            send,
+            receive if request.body_loaded else None,
+            extensions=scope.get('extensions'),
+        )
 
     except Exception:
         logger.exception('Uncaught error in ASGI HTTP handler')
@@ -260,13 +316,54 @@ async def _handle_lifespan(scope: Scope, receive: Receive, send: Send) -> None:
             return
 
 
-def _build_request_from_scope(scope: Scope, body: bytes) -> WebRequest:
-    """Convert an ASGI scope + body into a ``WebRequest``."""
-    # Headers: list of [name_bytes, value_bytes]
-    headers: List[tuple] = []
-    for name_bytes, value_bytes in scope.get('headers', []):
-        headers.append((name_bytes.decode('latin-1'), value_bytes.decode('latin-1')))
+def _declared_content_length(scope: Scope) -> Optional[int]:
+    """Return the ``Content-Length`` request header as an int, if present and valid."""
+    for name, value in scope.get('headers', []):
+        if name.lower() == b'content-length':
+            try:
+                return int(value)
+            except ValueError:
+                return None
+    return None
+
+
+async def _receive_body_chunks(
+    first_chunk: bytes,
+    receive: Receive,
+    max_body_size: Optional[int],
+) -> AsyncIterator[bytes]:
+    """Yield request body chunks from ASGI ``http.request`` messages.
 
+    Raises:
+        RequestBodyTooLarge: As soon as the running total exceeds ``max_body_size``.
+    """
+    received = len(first_chunk)
+    if max_body_size is not None and received > max_body_size:
+        raise RequestBodyTooLarge(max_body_size)
+    if first_chunk:
+        yield first_chunk
+    while True:
+        message = await receive()
+        chunk = message.get('body', b'')
+        if chunk:
+            received += len(chunk)
+            if max_body_size is not None and received > max_body_size:
+                raise RequestBodyTooLarge(max_body_size)
+            yield chunk
+        if not message.get('more_body', False):
+            return
+
+
+def _build_request_from_scope(
+    scope: Scope,
+    body: bytes,
+    body_stream: Optional[AsyncIterator[bytes]] = None,
+) -> WebRequest:
+    """Convert an ASGI scope + body (or body stream) into a ``WebRequest``.
+
+    Headers are handed over as raw bytes; the request decodes them and
+    parses cookies only when the handler asks for them.
+    """
     # Query string
     query_string = scope.get('query_string', b'')
     if isinstance(query_string, bytes):
@@ -286,68 +383,98 @@ def _build_request_from_scope(scope: Scope, body: bytes) -> WebRequest:
     server_port = server[1] if server else 80
     scheme = scope.get('scheme', 'http')
 
-    full_url = f'{scheme}://{server_host}:{server_port}{path}'
-    if query_string:
-        full_url += f'?{query_string}'
-
-    # Cookies (parse from Cookie header)
-    cookies: Dict[str, str] = {}
-    cookie_header = ''
-    for name, value in headers:
-        if name.lower() == 'cookie':
-            cookie_header = value
-    if cookie_header:
-        for part in cookie_header.split(';'):
-            part = part.strip()
-            if '=' in part:
-                k, v = part.split('=', 1)
-                cookies[k.strip()] = v.strip()
-
-    return WebRequest(
+    return _ASGIWebRequest(
         method=scope.get('method', 'GET'),
         path=path,
-        headers=headers,
+        raw_headers=scope.get('headers', ()),
         body=body,
         query_string=query_string,
         client_ip=client_ip,
         scheme=scheme,
         server_host=server_host,
         server_port=server_port,
-        full_url=full_url,
-        cookies=cookies,
+        body_stream=body_stream,
     )
 
 
+class _ASGIWebRequest(WebRequest):
+    """``WebRequest`` whose lazily derived values match what the ASGI driver
+    has always produced: ``full_url`` carries the query string, and cookies
+    come from plain ``name=value`` splitting of the (last) ``Cookie`` header,
+    falling back to ``SimpleCookie`` when nothing splits.
+    """
+
+    def _build_full_url(self) -> str:
+        url = WebRequest._build_full_url(self)
+        return f'{url}?{self.query_string}' if self.query_string else url
+
+    @staticmethod
+    def _parse_cookie_header(cookie_header: Optional[str]) -> Dict[str, str]:
+        cookies: Dict[str, str] = {}
+        if cookie_header:
+            for part in cookie_header.split(';'):
+                part = part.strip()
+                if '=' in part:
+                    k, v = part.split('=', 1)
+                    cookies[k.strip()] = v.strip()
+        return cookies or WebRequest._parse_cookie_header(cookie_header)
+
+
 class ASGIRequestAdapter(DriverRequestAdapter):
-    async def build_request(self, scope: Scope, body: bytes) -> WebRequest:
-        return _build_request_from_scope(scope, body)
+    async def build_request(
+        self,
+        scope: Scope,
+        body: bytes,
+        body_stream: Optional[AsyncIterator[bytes]] = None,
+    ) -> WebRequest:
+        return _build_request_from_scope(scope, body, body_stream)
+
+
+def encode_header_block(global_headers: Optional[list]) -> List[List[bytes]]:
+    """Pre-encode legacy global headers into ready-to-send ASGI byte pairs."""
+    return [
+        [name.encode('latin-1'), value.encode('latin-1')]
+        for name, value in normalize_global_headers(global_headers)
+    ]
 
 
 class ASGIResponseWriter(DriverResponseWriter):
     def __init__(self, global_headers: Optional[list] = None) -> None:
         self._global_headers = global_headers or []
+        self._header_block = encode_header_block(self._global_headers)
 
-    async def write_response(self, response: WebResponse, send: Send) -> None:
-        await _send_response(send, response, self._global_headers)
+    async def write_response(
+        self,
+        response: WebResponse,
+        send: Send,
+        receive: Optional[Receive] = None,
+        *,
+        extensions: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        await _send_response(send, response, self._header_block, receive, extensions)
 
 
 async def _send_response(
     send: Send,
     response: WebResponse,
-    global_headers: list,
+    header_block: List[List[bytes]],
+    receive: Optional[Receive] = None,
+    extensions: Optional[Dict[str, Any]] = None,
 ) -> None:
-    """Send a ``WebResponse`` via ASGI ``send()``."""
-    # Build header list
-    raw_headers: List[List[bytes]] = []
+    """Send a ``WebResponse`` via ASGI ``send()``.
 
-    # Global headers (legacy)
-    for h in global_headers:
-        if isinstance(h, (list, tuple)) and len(h) >= 2:
-            raw_headers.append([str(h[0]).encode('latin-1'), str(h[1]).encode('latin-1')])
+    ``header_block`` holds the pre-encoded global headers (see
+    ``encode_header_block``); the response's own headers follow them.
+    """
+    raw_headers = header_block + _encode_headers(response)
 
-    # Response headers
-    for name, value in response.iter_headers(include_content_type=True):
-        raw_headers.append([name.encode('latin-1'), value.encode('latin-1')])
+    if isinstance(response, FileResponse) and response.zero_copy and extensions and not response.has_stream_filters:
+        if await _send_file_zero_copy(send, response, raw_headers, extensions):
+            return
+
+    if isinstance(response, StreamingResponse):
+        await _send_streaming_body(send, response, raw_headers, receive)
+        return
 
     body = b''
     try:
@@ -356,16 +483,11 @@ async def _send_response(
         logger.error('Failed to render response body: %s', exc)
         body = b'{"error":"Response serialization error","status":500}'
         response = WebResponse.error(500, 'Response serialization error')
-        raw_headers = [
-            [str(h[0]).encode('latin-1'), str(h[1]).encode('latin-1')]
-            for h in global_headers
-            if isinstance(h, (list, tuple)) and len(h) >= 2
-        ]
-        for name, value in response.iter_headers(include_content_type=True):
-            raw_headers.append([name.encode('latin-1'), value.encode('latin-1')])
+        raw_headers = header_block + _encode_headers(response)
 
-    # Content-Length
-    raw_headers.append([b'content-length', str(len(body)).encode('latin-1')])
+    # Content-Length (HEAD responses carry the real size themselves)
+    if not response.header_map.contains('Content-Length'):
+        raw_headers.append([b'content-length', str(len(body)).encode('latin-1')])
 
     await send({
         'type': 'http.response.start',
@@ -379,6 +501,130 @@ async def _send_response(
     })
 
 
+def _encode_headers(response: WebResponse) -> List[List[bytes]]:
+    return [
+        [name.encode('latin-1'), value.encode('latin-1')]
+        for name, value in response.iter_headers(include_content_type=True)
+    ]
+
+
+async def _send_streaming_body(
+    send: Send,
+    response: StreamingResponse,
+    raw_headers: List[List[bytes]],
+    receive: Optional[Receive] = None,
+) -> None:
+    """Send a ``StreamingResponse`` as one ``more_body=True`` message per chunk.
+
+    ``send`` only returns once the server accepted the chunk, so a slow
+    client throttles the producer.  When ``receive`` is given and the
+    response has ``stop_on_disconnect`` set, an ``http.disconnect`` cancels
+    the stream (closing the producer).
+    """
+    await send({
+        'type': 'http.response.start',
+        'status': response.status_code,
+        'headers': raw_headers,
+    })
+    pump = asyncio.ensure_future(_pump_chunks(send, response))
+    if receive is None or not response.stop_on_disconnect:
+        await pump
+        return
+
+    watcher = asyncio.ensure_future(_wait_for_disconnect(receive))
+    try:
+        done, _ = await asyncio.wait({pump, watcher}, return_when=asyncio.FIRST_COMPLETED)
+        if pump not in done and watcher.exception() is not None:
+            # receive() is unusable; keep streaming without disconnect detection.
+            await pump
+    finally:
+        for task in (pump, watcher):
+            if not task.done():
+                task.cancel()
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+    if pump.done() and not pump.cancelled():
+        pump.result()
+    else:
+        logger.debug('Client disconnected during streaming response')
+
+
+async def _send_file_zero_copy(
+    send: Send,
+    response: FileResponse,
+    raw_headers: List[List[bytes]],
+    extensions: Dict[str, Any],
+) -> bool:
+    """Hand a ``FileResponse`` to the server without reading it in Python.
+
+    Uses ``http.response.zerocopysend`` (the server ``sendfile()``s each
+    range) or, for whole files, ``http.response.pathsend``.  Returns ``False``
+    when the server offers neither, so the caller streams chunks instead.
+    """
+    if 'http.response.zerocopysend' in extensions:
+        handle = await asyncio.get_running_loop().run_in_executor(None, open, response.path, 'rb')
+        try:
+            await send({
+                'type': 'http.response.start',
+                'status': response.status_code,
+                'headers': raw_headers,
+            })
+            for segment in response.segments:
+                if isinstance(segment, bytes):
+                    await send({'type': 'http.response.body', 'body': segment, 'more_body': True})
+                else:
+                    offset, count = segment
+                    await send({
+                        'type': 'http.response.zerocopysend',
+                        'file': handle,
+                        'offset': offset,
+                        'count': count,
+                        'more_body': True,
+                    })
+            await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
+        finally:
+            handle.close()
+        return True
+
+    if 'http.response.pathsend' in extensions and response.is_whole_file:
+        await send({
+            'type': 'http.response.start',
+            'status': response.status_code,
+            'headers': raw_headers,
+        })
+        await send({'type': 'http.response.pathsend', 'path': response.path})
+        return True
+
+    return False
+
+
+async def _pump_chunks(send: Send, response: StreamingResponse) -> None:
+    try:
+        async for chunk in response.iter_chunks():
+            await send({
+                'type': 'http.response.body',
+                'body': chunk,
+                'more_body': True,
+            })
+    except Exception as exc:
+        # Headers are already on the wire; all we can do is end the body.
+        logger.error('Streaming response aborted: %s', exc)
+    await send({
+        'type': 'http.response.body',
+        'body': b'',
+        'more_body': False,
+    })
+
+
+async def _wait_for_disconnect(receive: Receive) -> None:
+    while True:
+        message = await receive()
+        if message.get('type') == 'http.disconnect':
+            return
+
+
 # ======================================================================
 # ASGI WebSocket handler
 # ======================================================================
@@ -8,7 +8,7 @@ Author: Cullinan
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, Iterable, List, Optional, Tuple
 
 from .driver import DriverCapabilities, DriverRequestAdapter, DriverResponseWriter, WebDriver
 from cullinan.web.gateway.dispatcher import Dispatcher
@@ -16,6 +16,20 @@ from cullinan.web.gateway.dispatcher import Dispatcher
 logger = logging.getLogger(__name__)
 
 
+def normalize_global_headers(global_headers: Optional[Iterable[Any]]) -> List[Tuple[str, str]]:
+    """Turn legacy ``[name, value]`` global headers into ``(str, str)`` pairs.
+
+    Adapters call this once at construction so response writing does not
+    re-validate and re-stringify the same headers for every response.
+    Malformed entries are skipped.
+    """
+    return [
+        (str(h[0]), str(h[1]))
+        for h in global_headers or ()
+        if isinstance(h, (list, tuple)) and len(h) >= 2
+    ]
+
+
 class WebAdapter(WebDriver, ABC):
     """Abstract base class for runtime-specific Web adapters.
 
@@ -15,6 +15,7 @@ from typing import Any, Dict, Optional
 
 import tornado.httpserver
 import tornado.ioloop
+import tornado.iostream
 import tornado.web
 import tornado.websocket
 
@@ -26,8 +27,8 @@ from cullinan.application.model import (
     release_runtime_request_context,
 )
 from cullinan.web.gateway.dispatcher import Dispatcher
-from cullinan.web.gateway.web_core import WebRequest, WebResponse
-from .base import WebAdapter
+from cullinan.web.gateway.web_core import StreamingResponse, WebRequest, WebResponse
+from .base import WebAdapter, normalize_global_headers
 
 logger = logging.getLogger(__name__)
 
@@ -45,11 +46,22 @@ class _CullinanTornadoHandler(tornado.web.RequestHandler):
     _dispatcher: Dispatcher = None  # type: ignore[assignment]
     _adapter: "TornadoAdapter" = None  # type: ignore[assignment]
     _global_headers: list = []
+    _request_adapter: "TornadoRequestAdapter" = None  # type: ignore[assignment]
+    _response_writer: "TornadoResponseWriter" = None  # type: ignore[assignment]
 
-    def initialize(self, dispatcher: Dispatcher, adapter: "TornadoAdapter", global_headers: list = None) -> None:  # type: ignore[override]
+    def initialize(  # type: ignore[override]
+        self,
+        dispatcher: Dispatcher,
+        adapter: "TornadoAdapter",
+        global_headers: list = None,
+        request_adapter: "TornadoRequestAdapter" = None,
+        response_writer: "TornadoResponseWriter" = None,
+    ) -> None:
         self._dispatcher = dispatcher
         self._adapter = adapter
         self._global_headers = global_headers or []
+        self._request_adapter = request_adapter or adapter.create_request_adapter()
+        self._response_writer = response_writer or adapter.create_response_writer()
 
     # Accept every HTTP method
     async def _handle(self) -> None:
@@ -65,11 +77,15 @@ class _CullinanTornadoHandler(tornado.web.RequestHandler):
             if runtime is not None:
                 runtime.begin_request()
             binding = bind_runtime_request_context(runtime)
-            request = self._adapter.create_request_adapter().build_request(self)
+            request = self._request_adapter.build_request(self)
             if runtime is not None:
                 request.attributes['runtime'] = runtime
             response = await self._dispatcher.dispatch(request)
-            self._adapter.create_response_writer().write_response(response, self)
+            writer = self._response_writer
+            if isinstance(response, StreamingResponse):
+                await writer.write_streaming_response(response, self)
+            else:
+                writer.write_response(response, self)
         except Exception:
             # If the response has not been started yet, write a generic 500.
             # If finish() was already called, silently swallow — the client
@@ -143,9 +159,8 @@ class _CullinanTornadoHandler(tornado.web.RequestHandler):
 
     def set_default_headers(self) -> None:
         """Apply global headers from the legacy HeaderRegistry."""
-        for h in getattr(self, '_global_headers', []):
-            if isinstance(h, (list, tuple)) and len(h) >= 2:
-                self.set_header(str(h[0]), str(h[1]))
+        for name, value in getattr(self, '_global_headers', []):
+            self.set_header(name, value)
 
 
 class TornadoAdapter(WebAdapter):
@@ -170,7 +185,8 @@ class TornadoAdapter(WebAdapter):
     ) -> None:
         super().__init__(dispatcher, runtime=runtime)
         self._settings: Dict[str, Any] = settings or {}
-        self._global_headers: list = global_headers or []
+        # Normalized once; handlers and the writer reuse the same pairs
+        self._global_headers: list = normalize_global_headers(global_headers)
         self._extra_handlers: list = extra_handlers or []
         self._http_server: Optional[tornado.httpserver.HTTPServer] = None
         self._app: Optional[tornado.web.Application] = None
@@ -182,7 +198,7 @@ class TornadoAdapter(WebAdapter):
             supports_http=True,
             supports_websocket=True,
             supports_streaming_request=False,
-            supports_streaming_response=False,
+            supports_streaming_response=True,
             supports_multipart=True,
         )
 
@@ -214,6 +230,8 @@ class TornadoAdapter(WebAdapter):
                 'dispatcher': self.dispatcher,
                 'adapter': self,
                 'global_headers': self._global_headers,
+                'request_adapter': self.create_request_adapter(),
+                'response_writer': self.create_response_writer(),
             })
         )
 
@@ -330,15 +348,50 @@ class TornadoRequestAdapter(DriverRequestAdapter):
 
 class TornadoResponseWriter(DriverResponseWriter):
     def __init__(self, global_headers: Optional[list] = None) -> None:
-        self._global_headers = global_headers or []
+        self._global_headers = normalize_global_headers(global_headers)
 
     def write_response(self, response: WebResponse, handler: _CullinanTornadoHandler) -> None:  # type: ignore[override]
         if handler._finished:
             return
 
-        for h in self._global_headers:
-            if isinstance(h, (list, tuple)) and len(h) >= 2:
-                handler.set_header(str(h[0]), str(h[1]))
+        self._apply_headers(response, handler)
+        body_bytes = response.render_body()
+        if body_bytes:
+            handler.write(body_bytes)
+        if not handler._finished:
+            handler.finish()
+
+    async def write_streaming_response(self, response: StreamingResponse, handler: _CullinanTornadoHandler) -> None:
+        """Write a ``StreamingResponse`` chunk by chunk, flushing after each one.
+
+        Tornado switches to chunked transfer encoding unless the response
+        declares a ``Content-Length`` (as ``FileResponse`` does).  A client
+        disconnect ends the stream early and closes the producer.
+        """
+        if handler._finished:
+            return
+
+        self._apply_headers(response, handler)
+        chunks = response.iter_chunks()
+        try:
+            async for chunk in chunks:
+                handler.write(chunk)
+                await handler.flush()
+        except tornado.iostream.StreamClosedError:
+            logger.debug('Client disconnected during streaming response')
+            return
+        except Exception as exc:
+            logger.error('Streaming response aborted: %s', exc)
+        finally:
+            # Close the producer (and its aclose()/close() hooks) immediately
+            # instead of leaving it to garbage collection after a disconnect.
+            await chunks.aclose()
+        if not handler._finished:
+            handler.finish()
+
+    def _apply_headers(self, response: WebResponse, handler: _CullinanTornadoHandler) -> None:
+        for name, value in self._global_headers:
+            handler.set_header(name, value)
 
         seen_headers = set()
         for name, value in response.iter_headers(include_content_type=True):
@@ -350,8 +403,3 @@ class TornadoResponseWriter(DriverResponseWriter):
                 seen_headers.add(lower)
 
         handler.set_status(response.status_code)
-        body_bytes = response.render_body()
-        if body_bytes:
-            handler.write(body_bytes)
-        if not handler._finished:
-            handler.finish()
@@ -13,7 +13,13 @@ from cullinan.web.controller import (
     set_missing_header_handler,
 )
 from cullinan.core import controller
-from cullinan.web.gateway import WebRequest, WebResponse
+from cullinan.web.gateway import (
+    EventSourceResponse,
+    ServerSentEvent,
+    StreamingResponse,
+    WebRequest,
+    WebResponse,
+)
 from cullinan.web.middleware import BodyDecoderMiddleware, Middleware, get_decoded_body, middleware, set_decoded_body
 from cullinan.web.params import (
     Auto,
@@ -41,6 +47,7 @@ __all__ = [
     "Body",
     "BodyDecoderMiddleware",
     "DynamicBody",
+    "EventSourceResponse",
     "File",
     "Handler",
     "Header",
@@ -51,7 +58,9 @@ __all__ = [
     "Path",
     "Query",
     "ResolveError",
+    "ServerSentEvent",
     "StaticFiles",
+    "StreamingResponse",
     "TypeConverter",
     "UNSET",
     "ValidationError",
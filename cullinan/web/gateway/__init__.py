@@ -13,8 +13,13 @@ Author: Cullinan
 """
 
 from .web_core import (
+    CachedFileResponse,
+    FileResponse,
     HeaderPolicy,
+    QueryParams,
+    RequestBodyTooLarge,
     ResponseCookie,
+    StreamingResponse,
     WebCookies,
     WebExchange,
     WebHeaders,
@@ -24,8 +29,16 @@ from .web_core import (
 from .route_types import RouteEntry, RouteMatch, RouteGroup, HTTP_METHODS
 from .router import Router
 from .dispatcher import Dispatcher
-from .invocation import HandlerMethod, ReturnValueHandler, ExceptionResolver
+from .invocation import (
+    HandlerMethod,
+    InvocationContext,
+    InvocationPlan,
+    ReturnValueHandler,
+    ExceptionResolver,
+    stream_request_body,
+)
 from .runtime import WebRuntime, WebRuntimeConfig, WebRuntimeState
+from .sse import EventSourceResponse, ServerSentEvent, last_event_id
 from .pipeline import (
     MiddlewarePipeline,
     GatewayMiddleware,
@@ -33,6 +46,7 @@ from .pipeline import (
     CORSMiddleware,
     RequestTimingMiddleware,
     AccessLogMiddleware,
+    CompressionMiddleware,
     LegacyMiddlewareBridge,
 )
 from .exception_handler import ExceptionHandler
@@ -49,11 +63,19 @@ __all__ = [
     # Request / Response
     'WebRequest',
     'WebResponse',
+    'StreamingResponse',
+    'FileResponse',
+    'CachedFileResponse',
+    'EventSourceResponse',
+    'ServerSentEvent',
+    'last_event_id',
     'WebHeaders',
+    'QueryParams',
     'WebCookies',
     'ResponseCookie',
     'WebExchange',
     'HeaderPolicy',
+    'RequestBodyTooLarge',
     # Routing
     'Router',
     'RouteEntry',
@@ -63,6 +85,9 @@ __all__ = [
     # Dispatch
     'Dispatcher',
     'HandlerMethod',
+    'InvocationPlan',
+    'InvocationContext',
+    'stream_request_body',
     'ReturnValueHandler',
     'ExceptionResolver',
     # Pipeline
@@ -72,6 +97,7 @@ __all__ = [
     'CORSMiddleware',
     'RequestTimingMiddleware',
     'AccessLogMiddleware',
+    'CompressionMiddleware',
     'LegacyMiddlewareBridge',
     # Exception handling
     'ExceptionHandler',
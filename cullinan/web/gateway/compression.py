@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""HTTP content-coding helpers shared by the gateway and static files.
+
+Provides ``Accept-Encoding`` negotiation and incremental encoders for
+``gzip`` (always available), ``br`` (optional ``brotli`` package) and
+``zstd`` (optional ``zstandard`` package).
+
+Author: Cullinan
+"""
+
+from __future__ import annotations
+
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+def load_brotli() -> Optional[Any]:
+    """Return the ``brotli`` module, or ``None`` when it is not installed."""
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+def load_zstandard() -> Optional[Any]:
+    """Return the ``zstandard`` module, or ``None`` when it is not installed."""
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+def accepted_encodings(header: Optional[str], supported: Sequence[str]) -> List[str]:
+    """Return the ``supported`` codings acceptable per ``Accept-Encoding``, best first.
+
+    Codings the client weighs equally keep the order of ``supported``;
+    ``q=0`` excludes a coding and ``*`` covers codings not named explicitly.
+    """
+    if not header:
+        return []
+    weights: Dict[str, float] = {}
+    for item in header.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name] = q
+    wildcard = weights.get("*")
+    ranked: List[Tuple[float, int, str]] = []
+    for order, encoding in enumerate(supported):
+        q = weights.get(encoding, wildcard)
+        if q:
+            ranked.append((-q, order, encoding))
+    return [encoding for _q, _order, encoding in sorted(ranked)]
+
+
+class StreamEncoder(ABC):
+    """Incremental encoder: ``compress`` + ``flush`` per chunk, ``finish`` at the end."""
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """Feed ``data``; returns whatever output is ready (may be empty)."""
+
+    @abstractmethod
+    def flush(self) -> bytes:
+        """Emit everything buffered so far so the client can decode it."""
+
+    @abstractmethod
+    def finish(self) -> bytes:
+        """Emit the remaining output and end the stream."""
+
+
+class _GzipEncoder(StreamEncoder):
+    def __init__(self, level: int) -> None:
+        self._obj = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._obj.flush(zlib.Z_FINISH)
+
+
+class _BrotliEncoder(StreamEncoder):
+    def __init__(self, brotli: Any, level: int) -> None:
+        self._obj = brotli.Compressor(quality=min(level, 11))
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.process(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush()
+
+    def finish(self) -> bytes:
+        return self._obj.finish()
+
+
+class _ZstdEncoder(StreamEncoder):
+    def __init__(self, zstandard: Any, level: int) -> None:
+        self._flush_block = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        self._obj = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush(self._flush_block)
+
+    def finish(self) -> bytes:
+        return self._obj.flush()
+
+
+def available_encoders(level: int = 6) -> Dict[str, Callable[[], StreamEncoder]]:
+    """Return encoder factories for every importable coding, preferred first."""
+    factories: Dict[str, Callable[[], StreamEncoder]] = {}
+    zstandard = load_zstandard()
+    if zstandard is not None:
+        factories["zstd"] = lambda: _ZstdEncoder(zstandard, level)
+    brotli = load_brotli()
+    if brotli is not None:
+        factories["br"] = lambda: _BrotliEncoder(brotli, level)
+    factories["gzip"] = lambda: _GzipEncoder(level)
+    return factories
@@ -18,19 +18,89 @@ Author: Cullinan
 """
 
 import inspect
-import json
 import logging
-from typing import Any, Callable, Dict, Optional, Tuple, Type
+from typing import Any, Callable, Dict, Optional, Type
 
-from .invocation import ExceptionResolver, HandlerMethod, ReturnValueHandler
+from cullinan.web.params.resolver import ResolveError
+
+from .invocation import (
+    ExceptionResolver,
+    InvocationContext,
+    InvocationPlan,
+    ReturnValueHandler,
+    is_streaming_handler,
+)
 from .router import Router
 from .pipeline import MiddlewarePipeline
 from .exception_handler import ExceptionHandler
-from .route_types import RouteMatch
+from .route_types import RouteEntry, RouteMatch
+from .sse import LAST_EVENT_ID_HEADER
 from .web_core import HeaderPolicy, WebRequest, WebResponse
 
 logger = logging.getLogger(__name__)
 
+# Convention-based parameter names that receive the parsed request body.
+_BODY_PARAM_NAMES = frozenset({'body', 'body_params'})
+# ``cullinan.web.params`` sources that never read the decoded body.
+_BODYLESS_SOURCES = frozenset({'path', 'query', 'header', 'raw_body', 'file'})
+_NO_FILES: Dict[str, Any] = {}
+# ``request.attributes`` key of the route matched before the pipeline ran.
+_ROUTE_MATCH_ATTR = '__cullinan_route_match__'
+
+
+def _param_extractor(resolve: Callable[..., Any]) -> Callable[[InvocationContext], Any]:
+    """Adapt a ``ParamResolver.compile_param`` function to an ``InvocationContext``."""
+    def extract(context: InvocationContext) -> Any:
+        request = context.request
+        return resolve(
+            context.path_params,
+            request.query_params,
+            context.body,
+            request.headers,
+            _NO_FILES,
+            request,
+        )
+    return extract
+
+
+def _convention_extractor(name: str) -> Callable[[InvocationContext], Any]:
+    """Build the extractor for a convention-named handler parameter.
+
+    Maps parameter names to request data:
+    - ``request`` / ``req``       → WebRequest
+    - ``url_params``              → path_params dict
+    - ``path_params``             → path_params dict
+    - ``query_params``            → query_params (read-only ``QueryParams``)
+    - ``body_params``             → parsed body dict
+    - ``headers``                 → headers dict
+    - ``request_body``            → raw body bytes
+    - ``body``                    → parsed body (JSON or form)
+    - ``last_event_id``           → ``Last-Event-ID`` header (SSE resume)
+    - Any name matching a path param → that param's value
+    - Otherwise                   → query param of that name, or None
+    """
+    if name in ('request', 'req'):
+        return lambda context: context.request
+    if name in ('url_params', 'path_params'):
+        return lambda context: context.path_params
+    if name == 'query_params':
+        return lambda context: context.request.query_params
+    if name in _BODY_PARAM_NAMES:
+        return lambda context: context.body
+    if name == 'headers':
+        return lambda context: dict(context.request.headers.items()) if context.request.headers else {}
+    if name == 'request_body':
+        return lambda context: context.request.body
+    if name == 'last_event_id':
+        return lambda context: context.request.header(LAST_EVENT_ID_HEADER)
+
+    def extract(context: InvocationContext) -> Any:
+        path_params = context.path_params
+        if name in path_params:
+            return path_params[name]
+        return context.request.query_params.get(name)
+    return extract
+
 
 class Dispatcher:
     """Central request dispatcher.
@@ -75,10 +145,37 @@ class Dispatcher:
             A ``WebResponse`` ready for the adapter to serialise.
         """
         try:
+            if not request.body_loaded:
+                await self._prepare_body(request)
             return await self.pipeline.execute(request, self._core_dispatch)
         except Exception as exc:
             return await self.exception_resolver.resolve(request, exc)
 
+    async def _prepare_body(self, request: WebRequest) -> None:
+        """Buffer a streamed body before middleware runs.
+
+        Middleware therefore sees ``request.body`` just as it does on Tornado.
+        Only a route marked with ``@stream_request_body`` gets the body
+        unread.  The match is stashed on the request so ``_core_dispatch``
+        does not route twice.
+        """
+        match = self.router.match(request.method, request.path)
+        if match is not None:
+            request.attributes[_ROUTE_MATCH_ATTR] = (request.method, request.path, match)
+            if is_streaming_handler(match.entry.handler, match.entry.metadata):
+                return
+        await request.bytes()
+
+    def _match(self, request: WebRequest) -> Optional[RouteMatch]:
+        """Route ``request``, reusing the pre-pipeline match unless middleware
+        changed the method or path since."""
+        stashed = request.attributes.pop(_ROUTE_MATCH_ATTR, None)
+        if stashed is not None:
+            method, path, match = stashed
+            if method == request.method and path == request.path:
+                return match
+        return self.router.match(request.method, request.path)
+
     # ------------------------------------------------------------------
     # Core dispatch logic (called inside the pipeline)
     # ------------------------------------------------------------------
@@ -90,7 +187,7 @@ class Dispatcher:
         already processed the request before it reaches here.
         """
         # 1. Route matching
-        match: Optional[RouteMatch] = self.router.match(request.method, request.path)
+        match: Optional[RouteMatch] = self._match(request)
         if match is None:
             # Try OPTIONS for CORS pre-flight (auto-allow if any route exists for this path)
             if request.method == 'OPTIONS':
@@ -106,8 +203,12 @@ class Dispatcher:
         if handler is None:
             return WebResponse.error(500, 'Route matched but no handler registered')
 
-        # 3. Resolve parameters and invoke handler
+        # 3. Resolve parameters and invoke handler; a body left unread for a
+        # streaming route is buffered here if middleware rewrote the request
+        # to a route that does not stream.
         try:
+            if not request.body_loaded and not is_streaming_handler(handler, entry.metadata):
+                await request.bytes()
             response = await self._invoke_handler(request, match)
         except Exception as exc:
             response = await self.exception_resolver.resolve(request, exc)
@@ -129,203 +230,171 @@ class Dispatcher:
         - Plain functions
         - Bound controller methods (via DI singleton lookup)
         - Both sync and async handlers
-        - Return types: WebResponse, dict, str, None
+        - Return types: WebResponse, dict, str, None, async generator (SSE)
         """
         entry = match.entry
         handler = entry.handler
         controller_cls = entry.controller_cls
-        handler_method = HandlerMethod(handler=handler, controller=controller_cls, route=entry)
+
+        plan: Optional[InvocationPlan] = entry.invocation_plan
+        if plan is None:
+            plan = self.compile_plan(entry)
 
         # Determine the actual callable and 'self' (if controller method)
-        controller_instance = None
-        if controller_cls is not None:
+        controller_instance = entry.controller_instance
+        if controller_instance is None and controller_cls is not None:
             controller_instance = self._get_controller_instance(controller_cls)
 
         # Build arguments from request + path params
-        args, kwargs = await self._resolve_params(
-            handler, request, match.path_params, controller_instance,
-        )
+        args = await self._resolve_args(plan, request, match.path_params)
 
         # Invoke
         if controller_instance is not None:
-            result = handler_method.handler(controller_instance, *args, **kwargs)
+            result = handler(controller_instance, *args)
         else:
-            result = handler_method.handler(*args, **kwargs)
+            result = handler(*args)
 
         if inspect.isawaitable(result):
             result = await result
 
         # Convert result → WebResponse
-        return self.return_value_handler.handle(result)
+        return self.return_value_handler.handle(result, request)
 
     # ------------------------------------------------------------------
-    # Parameter resolution
+    # Invocation plans
     # ------------------------------------------------------------------
 
-    async def _resolve_params(
-        self,
-        handler: Callable,
-        request: WebRequest,
-        path_params: Dict[str, str],
-        controller_instance: Optional[Any],
-    ) -> Tuple[list, dict]:
-        """Resolve function parameters from the request.
+    def compile_plans(self) -> int:
+        """Precompile the invocation plan of every registered route.
+
+        Called at warmup so that the first request of each route does not
+        pay for signature inspection.  Routes whose plan cannot be built
+        here are left to compile (and report the error) on first dispatch.
+
+        Returns:
+            Number of plans compiled.
+        """
+        count = 0
+        for entry in self.router.get_all_routes():
+            if entry.handler is None or entry.invocation_plan is not None:
+                continue
+            try:
+                self.compile_plan(entry)
+                count += 1
+            except Exception as exc:
+                logger.debug('Could not precompile invocation plan for %s %s: %s',
+                             entry.method, entry.path, exc)
+        return count
+
+    def compile_plan(self, entry: RouteEntry) -> InvocationPlan:
+        """Build the invocation plan for ``entry`` and attach it to the entry."""
+        plan = self._build_plan(entry.handler)
+        entry.bind_invocation_plan(plan)
+        return plan
+
+    @staticmethod
+    def _build_plan(handler: Callable) -> InvocationPlan:
+        """Inspect ``handler`` once and compile its argument extractors.
 
         Strategy:
         1. If the function uses the new ``cullinan.web.params`` annotation system
-           (Path, Query, Body, Header, etc.), delegate to ``ParamResolver``.
+           (Path, Query, Body, Header, etc.), compile one extractor per
+           parameter via ``ParamResolver.compile_param``.  A convention-based
+           plan is kept as fallback, mirroring the historical behaviour.
         2. Otherwise, use a convention-based approach matching parameter names
            to known sources (``url_params``, ``query_params``, ``body_params``,
            ``headers``, ``request_body``, ``request``).
-
-        Returns:
-            (positional_args, keyword_args)
         """
-        sig = inspect.signature(handler)
-        params = list(sig.parameters.values())
+        params = list(inspect.signature(handler).parameters.values())
 
         # Skip 'self' for bound methods
         if params and params[0].name == 'self':
             params = params[1:]
 
-        # Attempt new param system first
+        names = tuple(p.name for p in params)
+        convention = InvocationPlan(
+            names=names,
+            extractors=tuple(_convention_extractor(name) for name in names),
+            body_mode='parsed' if any(name in _BODY_PARAM_NAMES for name in names) else None,
+        )
+
         try:
             from cullinan.web.params import ParamResolver, DynamicBody
             analysis = ParamResolver.analyze_params(handler)
-            use_new = any(
-                cfg.get('param_spec') is not None
-                or cfg.get('type') is DynamicBody
-                or cfg.get('source') in ('path', 'query', 'body', 'header', 'file', 'auto')
-                for cfg in analysis.values()
-            )
-            if use_new:
-                return await self._resolve_new_params(
-                    handler, request, path_params, analysis, params,
-                )
         except Exception:
-            pass
+            return convention
 
-        # Convention-based fallback
-        return await self._resolve_convention_params(
-            request, path_params, params,
+        use_new = any(
+            cfg.get('param_spec') is not None
+            or cfg.get('type') is DynamicBody
+            or cfg.get('source') in ('path', 'query', 'body', 'header', 'file', 'auto')
+            for cfg in analysis.values()
         )
+        if not use_new:
+            return convention
 
-    async def _resolve_new_params(
-        self,
-        handler: Callable,
-        request: WebRequest,
-        path_params: Dict[str, str],
-        analysis: Dict[str, Dict],
-        params: list,
-    ) -> Tuple[list, dict]:
-        """Resolve using ``cullinan.web.params.ParamResolver``."""
-        from cullinan.web.params import ParamResolver
-
-        # Build data sources from WebRequest
-        query_dict = dict(request.query_params)
-        body_dict: Dict[str, Any] = {}
-        headers_dict: Dict[str, str] = dict(request.headers.items()) if request.headers else {}
-
-        if request.body:
-            try:
-                body_dict = json.loads(request.body.decode('utf-8'))
-                if not isinstance(body_dict, dict):
-                    body_dict = {}
-            except Exception:
-                body_dict = {}
-
-        resolved = ParamResolver.resolve(
-            func=handler,
-            request=request,
-            url_params=path_params,
-            query_params=query_dict,
-            body_data=body_dict,
-            headers=headers_dict,
-            files={},
+        try:
+            extractors = tuple(
+                _param_extractor(ParamResolver.compile_param(name, cfg))
+                for name, cfg in analysis.items()
+            )
+        except Exception:
+            return convention
+
+        needs_body = any(cfg.get('source') not in _BODYLESS_SOURCES for cfg in analysis.values())
+        return InvocationPlan(
+            names=tuple(analysis),
+            extractors=extractors,
+            body_mode='dict' if needs_body else None,
+            fallback=convention,
         )
 
-        # Build ordered arg list
-        sig = ParamResolver.get_signature(handler)
-        args: list = []
-        for name, p in sig.parameters.items():
-            if name == 'self':
-                continue
-            args.append(resolved.get(name))
-
-        return args, {}
+    # ------------------------------------------------------------------
+    # Parameter resolution
+    # ------------------------------------------------------------------
 
-    async def _resolve_convention_params(
+    async def _resolve_args(
         self,
+        plan: InvocationPlan,
         request: WebRequest,
         path_params: Dict[str, str],
-        params: list,
-    ) -> Tuple[list, dict]:
-        """Convention-based parameter resolution.
-
-        Maps parameter names to request data:
-        - ``request`` / ``req``       → WebRequest
-        - ``url_params``              → path_params dict
-        - ``path_params``             → path_params dict
-        - ``query_params``            → query_params dict
-        - ``body_params``             → parsed body dict
-        - ``headers``                 → headers dict
-        - ``request_body``            → raw body bytes
-        - ``body``                    → parsed body (JSON or form)
-        - Any name matching a path param → that param's value
-        - Otherwise                   → None
-        """
-        args: list = []
-        body_cache: Any = None
-        body_parsed = False
-
-        for p in params:
-            name = p.name
-
-            if name in ('request', 'req'):
-                args.append(request)
-            elif name == 'url_params' or name == 'path_params':
-                args.append(path_params)
-            elif name == 'query_params':
-                args.append(dict(request.query_params))
-            elif name == 'body_params':
-                if not body_parsed:
-                    body_cache = await self._parse_body(request)
-                    body_parsed = True
-                args.append(body_cache)
-            elif name == 'body':
-                if not body_parsed:
-                    body_cache = await self._parse_body(request)
-                    body_parsed = True
-                args.append(body_cache)
-            elif name == 'headers':
-                args.append(dict(request.headers.items()) if request.headers else {})
-            elif name == 'request_body':
-                args.append(request.body)
-            elif name in path_params:
-                args.append(path_params[name])
-            else:
-                # Try query param
-                qv = request.query_params.get(name)
-                if qv is not None:
-                    args.append(qv)
-                else:
-                    args.append(None)
-
-        return args, {}
+    ) -> list:
+        """Run ``plan`` against the request and return positional arguments."""
+        context = InvocationContext(request, path_params)
+        if plan.body_mode is not None and not request.body_loaded:
+            await request.bytes()
+        if plan.body_mode == 'dict':
+            context.body = self._decode_body_dict(request)
+        elif plan.body_mode == 'parsed':
+            context.body = await self._parse_body(request)
+
+        if plan.fallback is None:
+            return plan.run(context)
+        try:
+            return plan.run(context)
+        except ResolveError:
+            # Per-item errors of a List[Model] body are reported, not retried
+            raise
+        except Exception as exc:
+            logger.debug('Parameter resolution failed (%s); using convention-based fallback', exc)
+            return await self._resolve_args(plan.fallback, request, path_params)
+
+    @staticmethod
+    def _decode_body_dict(request: WebRequest) -> Dict[str, Any]:
+        """Return the request's shared decoded body for ``cullinan.web.params`` extractors."""
+        try:
+            return request.decoded_body()
+        except Exception:
+            return {}
 
     @staticmethod
     async def _parse_body(request: WebRequest) -> Any:
-        """Parse body as JSON or form data."""
-        if request.is_json:
-            try:
-                return await request.json()
-            except Exception:
-                return {}
+        """Parse body as JSON or form data (JSON is shared with ``request.json()``)."""
         if request.is_form:
             return await request.form()
-        if request.body:
+        if request.is_json or request.body:
             try:
-                return json.loads(request.body.decode('utf-8'))
+                return await request.json()
             except Exception:
                 return {}
         return {}
@@ -334,9 +403,41 @@ class Dispatcher:
     # Controller instance resolution
     # ------------------------------------------------------------------
 
+    def pin_controller_instances(self) -> int:
+        """Resolve every controller route's singleton once and pin it on the entry.
+
+        Called when the owning ``WebRuntime`` becomes ACTIVE so dispatch reads
+        ``RouteEntry.controller_instance`` instead of querying the registry.
+        All instances are resolved before any entry is updated.  Controllers
+        that cannot be resolved are left unpinned and keep the per-request
+        lookup.
+
+        Returns:
+            Number of routes pinned.
+        """
+        resolved: Dict[Type, Any] = {}
+        pins = []
+        for entry in self.router.get_all_routes():
+            controller_cls = entry.controller_cls
+            if controller_cls is None:
+                continue
+            if controller_cls not in resolved:
+                resolved[controller_cls] = self._lookup_controller_instance(controller_cls)
+            pins.append((entry, resolved[controller_cls]))
+
+        for entry, instance in pins:
+            entry.bind_controller_instance(instance)
+        return sum(1 for _, instance in pins if instance is not None)
+
+    def unpin_controller_instances(self) -> None:
+        """Release all pinned controller instances (e.g. when the runtime closes)."""
+        for entry in self.router.get_all_routes():
+            if entry.controller_instance is not None:
+                entry.bind_controller_instance(None)
+
     @staticmethod
-    def _get_controller_instance(controller_cls: Type) -> Any:
-        """Get the singleton controller instance from the IoC container."""
+    def _lookup_controller_instance(controller_cls: Type) -> Any:
+        """Look up the singleton controller instance; ``None`` if unavailable."""
         try:
             from cullinan.web.controller.registry import get_controller_registry
             registry = get_controller_registry()
@@ -354,6 +455,14 @@ class Dispatcher:
                 return ctx.try_get(controller_cls.__name__)
         except Exception:
             pass
+        return None
+
+    @classmethod
+    def _get_controller_instance(cls, controller_cls: Type) -> Any:
+        """Get the singleton controller instance from the IoC container."""
+        instance = cls._lookup_controller_instance(controller_cls)
+        if instance is not None:
+            return instance
 
         # Last resort: create a fresh instance
         logger.warning('Creating ad-hoc controller instance for %s', controller_cls.__name__)
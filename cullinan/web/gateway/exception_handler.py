@@ -11,7 +11,7 @@ import logging
 import traceback
 from typing import Any, Callable, Dict, Type
 
-from .web_core import WebRequest, WebResponse
+from .web_core import RequestBodyTooLarge, WebRequest, WebResponse
 
 logger = logging.getLogger(__name__)
 
@@ -135,10 +135,12 @@ class ExceptionHandler:
     ) -> WebResponse:
         """Built-in fallback: returns 500 with optional debug info."""
         from cullinan.support.exceptions import CullinanError
+        from cullinan.web.params.resolver import ResolveError
 
         # Map known framework exceptions to appropriate status codes
         status = 500
         message = 'Internal Server Error'
+        details = None
 
         if isinstance(exc, CullinanError):
             # Try to infer status from error_code
@@ -150,6 +152,13 @@ class ExceptionHandler:
             elif 'FORBIDDEN' in code or 'AUTH' in code:
                 status = 403
             message = exc.message
+        elif isinstance(exc, ResolveError):
+            status = 400
+            message = exc.message
+            details = exc.errors
+        elif isinstance(exc, RequestBodyTooLarge):
+            status = 413
+            message = str(exc)
         elif isinstance(exc, ValueError):
             status = 400
             message = str(exc)
@@ -174,6 +183,8 @@ class ExceptionHandler:
             'error': message,
             'status': status,
         }
+        if details:
+            payload['details'] = details
         if self._debug:
             payload['traceback'] = traceback.format_exception(
                 type(exc), exc, exc.__traceback__,
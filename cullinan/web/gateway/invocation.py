@@ -5,12 +5,41 @@ from __future__ import annotations
 
 import inspect
 from dataclasses import dataclass
-from typing import Any, Callable
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from cullinan.codec.json_codec import JsonResponseCodec
+from cullinan.codec.registry import get_codec_registry
 
 from .exception_handler import ExceptionHandler
+from .sse import EventSourceResponse
 from .web_core import WebRequest, WebResponse
 
 
+STREAM_REQUEST_BODY_ATTR = "__cullinan_stream_request_body__"
+
+
+def stream_request_body(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Mark a handler as consuming the request body incrementally.
+
+    The ``Dispatcher`` normally buffers a streamed request body before the
+    middleware pipeline runs, so ``request.body`` is usable in middleware and
+    handlers alike.  When the request's route is marked, the body is left
+    unread: middleware sees ``request.body_loaded`` as ``False`` and should
+    not touch ``request.body``, and the handler is expected to
+    ``async for chunk in request.stream()`` (or await ``request.bytes()``
+    itself).  Apply it directly to the function, beneath any route decorator.
+    """
+    setattr(func, STREAM_REQUEST_BODY_ATTR, True)
+    return func
+
+
+def is_streaming_handler(handler: Any, metadata: Optional[Dict[str, Any]] = None) -> bool:
+    """Whether a route handler opted into an unbuffered request body."""
+    if metadata and metadata.get("stream_request_body"):
+        return True
+    return bool(getattr(handler, STREAM_REQUEST_BODY_ATTR, False))
+
+
 @dataclass(frozen=True)
 class HandlerMethod:
     handler: Callable[..., Any]
@@ -22,21 +51,67 @@ class HandlerMethod:
         return getattr(self.handler, "__name__", self.handler.__class__.__name__)
 
 
+class InvocationContext:
+    """Per-request data handed to the extractors of an ``InvocationPlan``."""
+
+    __slots__ = ("request", "path_params", "body")
+
+    def __init__(self, request: WebRequest, path_params: Dict[str, str], body: Any = None) -> None:
+        self.request = request
+        self.path_params = path_params
+        self.body = body
+
+
+@dataclass(frozen=True)
+class InvocationPlan:
+    """Precompiled argument extraction for one route handler.
+
+    Built once per ``RouteEntry`` by ``Dispatcher.compile_plan``; running it
+    calls the extractors in order without inspecting the handler again.
+
+    Attributes:
+        names: Handler argument names, in call order (``self`` excluded).
+        extractors: One ``InvocationContext -> value`` callable per argument.
+        body_mode: How the body must be loaded into ``InvocationContext.body``
+            before the extractors run: ``None`` (not needed), ``"dict"``
+            (JSON object for ``cullinan.web.params``) or ``"parsed"``
+            (JSON / form body for convention-based handlers).
+        fallback: Plan used when this one fails (parameter-system plans fall
+            back to convention-based resolution).
+    """
+
+    names: Tuple[str, ...] = ()
+    extractors: Tuple[Callable[[InvocationContext], Any], ...] = ()
+    body_mode: Optional[str] = None
+    fallback: Optional["InvocationPlan"] = None
+
+    def run(self, context: InvocationContext) -> list:
+        return [extract(context) for extract in self.extractors]
+
+
 class ReturnValueHandler:
-    """Converts handler results into WebResponse objects."""
+    """Converts handler results into WebResponse objects.
+
+    Structured results (dicts, lists, dataclasses, other objects) are encoded
+    as JSON unless the request's ``Accept`` header selects another response
+    codec from the ``CodecRegistry`` (e.g. ``application/msgpack``).
+    """
 
-    def handle(self, result: Any) -> WebResponse:
+    def handle(self, result: Any, request: Optional[WebRequest] = None) -> WebResponse:
         if isinstance(result, WebResponse):
             return result
 
         if result is None:
             return WebResponse.no_content()
 
+        if inspect.isasyncgen(result):
+            return EventSourceResponse(result)
+
         if isinstance(result, tuple):
-            return self._handle_tuple(result)
+            return self._handle_tuple(result, request)
 
         if isinstance(result, (dict, list)):
-            return WebResponse.json(result)
+            return self._structured(result, request)
 
         if isinstance(result, str):
             return WebResponse.text(result)
@@ -51,18 +126,32 @@ class ReturnValueHandler:
                     response.add_header(str(header[0]), str(header[1]))
             return response
 
-        return WebResponse.json(result)
+        return self._structured(result, request)
+
+    def _structured(self, data: Any, request: Optional[WebRequest]) -> WebResponse:
+        registry = get_codec_registry()
+        if not registry.negotiates_responses():
+            return WebResponse.json(data)
+        accept = request.header("Accept") if request is not None else None
+        codec = registry.get_response_codec(accept) if accept else None
+        if codec is not None and not isinstance(codec, JsonResponseCodec):
+            response = WebResponse(body=codec.encode(data), content_type=codec.get_content_type())
+        else:
+            response = WebResponse.json(data)
+        # The encoding depends on Accept, so shared caches must key on it
+        response.set_header("Vary", "Accept")
+        return response
 
-    def _handle_tuple(self, values: tuple) -> WebResponse:
+    def _handle_tuple(self, values: tuple, request: Optional[WebRequest] = None) -> WebResponse:
         if len(values) == 1:
-            return self.handle(values[0])
+            return self.handle(values[0], request)
         if len(values) == 2:
             body, status = values
-            response = self.handle(body)
+            response = self.handle(body, request)
             response.status_code = int(status)
             return response
         body, status, headers = values[0], values[1], values[2]
-        response = self.handle(body)
+        response = self.handle(body, request)
         response.status_code = int(status)
         if isinstance(headers, dict):
             for name, value in headers.items():
@@ -10,9 +10,10 @@ Author: Cullinan
 
 import logging
 import time
-from typing import Any, Callable, Awaitable, List, Optional, Type
+from typing import Any, AsyncIterator, Callable, Awaitable, Iterable, List, Optional, Type
 
-from .web_core import WebRequest, WebResponse
+from .compression import StreamEncoder, accepted_encodings, available_encoders
+from .web_core import FileResponse, StreamingResponse, WebRequest, WebResponse
 
 logger = logging.getLogger(__name__)
 
@@ -208,6 +209,117 @@ class AccessLogMiddleware(GatewayMiddleware):
             )
 
 
+class CompressionMiddleware(GatewayMiddleware):
+    """Compresses response bodies according to the client's ``Accept-Encoding``.
+
+    Supports ``gzip`` always, plus ``br`` / ``zstd`` when the optional
+    ``brotli`` / ``zstandard`` packages are importable.  Streaming responses
+    are compressed incrementally, flushing after every chunk so SSE events
+    and partial exports still reach the client immediately.
+
+    Responses are left untouched when they are already encoded, are
+    ``FileResponse`` downloads (static files negotiate their own
+    precompressed variants), are smaller than ``minimum_size``, carry
+    ``Cache-Control: no-transform``, or have a media type outside
+    ``content_types``.  Every eligible media type gets
+    ``Vary: Accept-Encoding`` whether or not it was compressed.
+
+    Args:
+        minimum_size: Buffered bodies smaller than this many bytes are sent as is.
+        content_types: Allowed media types; entries ending in ``/`` match a
+            whole family (``"text/"``).
+        compresslevel: Compression level handed to every encoder.
+        encodings: Codings to offer, in preference order; defaults to every
+            importable one (``zstd``, ``br``, ``gzip``).
+    """
+
+    DEFAULT_CONTENT_TYPES = (
+        'text/',
+        'application/json',
+        'application/javascript',
+        'application/xml',
+        'application/problem+json',
+        'application/x-ndjson',
+        'image/svg+xml',
+    )
+
+    def __init__(
+        self,
+        minimum_size: int = 500,
+        content_types: Iterable[str] = DEFAULT_CONTENT_TYPES,
+        compresslevel: int = 6,
+        encodings: Optional[Iterable[str]] = None,
+    ) -> None:
+        factories = available_encoders(compresslevel)
+        if encodings is not None:
+            factories = {name: factories[name] for name in encodings if name in factories}
+        self._factories = factories
+        self._encodings = tuple(factories)
+        self._minimum_size = minimum_size
+        self._exact_types = frozenset(t for t in content_types if not t.endswith('/'))
+        self._type_prefixes = tuple(t for t in content_types if t.endswith('/'))
+
+    async def __call__(self, request: WebRequest, call_next: HandlerCallable) -> WebResponse:
+        resp = await call_next(request)
+        if resp.status_code < 200 or resp.status_code in (204, 304) or not self._is_compressible_type(resp):
+            return resp
+
+        _add_vary(resp, 'Accept-Encoding')
+        if (
+            request.method == 'HEAD'
+            or isinstance(resp, FileResponse)
+            or resp.get_header('Content-Encoding') is not None
+            or 'no-transform' in (resp.get_header('Cache-Control') or '').lower()
+        ):
+            return resp
+
+        encodings = accepted_encodings(request.header('Accept-Encoding'), self._encodings)
+        if not encodings:
+            return resp
+        encoding = encodings[0]
+        factory = self._factories[encoding]
+
+        if isinstance(resp, StreamingResponse):
+            resp.add_stream_filter(lambda stream: _compress_stream(stream, factory()))
+        else:
+            body = resp.render_body()
+            if len(body) < self._minimum_size:
+                return resp
+            encoder = factory()
+            # Pin the media type before the body turns into bytes.
+            resp.content_type = resp.content_type
+            resp.body = encoder.compress(body) + encoder.finish()
+
+        if resp.header_map.contains('Content-Length'):
+            resp.header_map.remove('Content-Length')
+        resp.set_header('Content-Encoding', encoding)
+        etag = resp.get_header('ETag')
+        if etag and not etag.startswith('W/'):
+            # The encoded bytes differ, so the validator can only be weak.
+            resp.set_header('ETag', f'W/{etag}')
+        return resp
+
+    def _is_compressible_type(self, resp: WebResponse) -> bool:
+        media_type = (resp.content_type or '').split(';', 1)[0].strip().lower()
+        return media_type in self._exact_types or media_type.startswith(self._type_prefixes)
+
+
+def _add_vary(resp: WebResponse, field: str) -> None:
+    current = resp.get_header('Vary')
+    if current is None:
+        resp.set_header('Vary', field)
+        return
+    values = {part.strip().lower() for part in current.split(',')}
+    if field.lower() not in values and '*' not in values:
+        resp.set_header('Vary', f'{current}, {field}')
+
+
+async def _compress_stream(stream: AsyncIterator[bytes], encoder: StreamEncoder) -> AsyncIterator[bytes]:
+    async for chunk in stream:
+        yield encoder.compress(chunk) + encoder.flush()
+    yield encoder.finish()
+
+
 class LegacyMiddlewareBridge(GatewayMiddleware):
     """Bridge that adapts legacy ``cullinan.web.middleware.Middleware`` instances
     into the new gateway pipeline.
@@ -224,6 +336,9 @@ class LegacyMiddlewareBridge(GatewayMiddleware):
         self._chain = legacy_chain
 
     async def __call__(self, request: WebRequest, call_next: HandlerCallable) -> WebResponse:
+        # The dispatcher has already buffered the body unless the route
+        # streams it (``@stream_request_body``), so sync middleware can read
+        # ``request.body`` whenever ``request.body_loaded`` is true.
         # Process request through legacy chain
         processed = self._chain.process_request(request)
         if processed is None:
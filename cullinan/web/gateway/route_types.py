@@ -25,6 +25,10 @@ class RouteEntry:
         controller_method_name: Name of the method on the controller class.
         param_names: Ordered list of path parameter names.
         metadata: Arbitrary metadata (e.g. ``tags``, ``summary`` for OpenAPI).
+        invocation_plan: Precompiled ``InvocationPlan`` attached by the
+                 ``Dispatcher`` at warmup (or on first dispatch).
+        controller_instance: Singleton controller pinned when the owning
+                 ``WebRuntime`` becomes ACTIVE (``None`` until then).
     """
     method: str
     path: str
@@ -34,6 +38,16 @@ class RouteEntry:
     controller_method_name: str = ''
     param_names: tuple = ()
     metadata: Dict[str, Any] = field(default_factory=dict)
+    invocation_plan: Optional[Any] = field(default=None, compare=False, repr=False)
+    controller_instance: Optional[Any] = field(default=None, compare=False, repr=False)
+
+    def bind_invocation_plan(self, plan: Any) -> None:
+        """Attach a precompiled invocation plan (the entry is otherwise immutable)."""
+        object.__setattr__(self, 'invocation_plan', plan)
+
+    def bind_controller_instance(self, instance: Optional[Any]) -> None:
+        """Pin (or with ``None``, release) the controller instance for this route."""
+        object.__setattr__(self, 'controller_instance', instance)
 
 
 @dataclass
@@ -8,11 +8,21 @@ Implements a radix-tree (prefix tree) based router with support for:
 - Wildcard:           /static/**
 - Per-method routing: GET /users  vs  POST /users
 
+Once registration is complete, ``Router.freeze()`` flattens the trie into a
+compiled, non-recursive matcher (see ``_CompiledNode``) that is used by
+``Router.match`` until the next ``add_route`` call.
+
+Fully static routes are additionally indexed by ``(method, path)`` so the
+common case is a single dict lookup, and an optional bounded LRU caches
+recent matches of parameterised routes.
+
 Author: Cullinan
 """
 
 import logging
 import re
+import threading
+from collections import OrderedDict
 from typing import Any, Callable, Dict, List, Optional, Type, Tuple
 
 from .route_types import RouteEntry, RouteMatch, HTTP_METHODS
@@ -49,6 +59,53 @@ class _TrieNode:
         self.entries: Optional[Dict[str, RouteEntry]] = None
 
 
+class _CompiledNode:
+    """Flattened, read-only view of a ``_TrieNode`` used by the compiled matcher.
+
+    Transitions point directly at other ``_CompiledNode`` objects and every
+    node knows which segment indices carry which path parameters, so a match
+    never has to copy or backtrack a params dict.
+    """
+
+    __slots__ = (
+        'children',       # static transitions: segment_key -> _CompiledNode
+        'param_child',    # parameter transition (or None)
+        'param_regex',    # compiled regex guarding the parameter transition
+        'wildcard',       # method -> RouteEntry for a ``/**`` catch-all (or None)
+        'entries',        # method -> RouteEntry for terminal matches (or None)
+        'param_slots',    # ((param_name, segment_index), ...) from the root
+    )
+
+    def __init__(self, param_slots: Tuple[Tuple[str, int], ...]) -> None:
+        self.children: Dict[str, '_CompiledNode'] = {}
+        self.param_child: Optional['_CompiledNode'] = None
+        self.param_regex: Optional[re.Pattern] = None
+        self.wildcard: Optional[Dict[str, RouteEntry]] = None
+        self.entries: Optional[Dict[str, RouteEntry]] = None
+        self.param_slots: Tuple[Tuple[str, int], ...] = param_slots
+
+
+def _compile_trie(root: _TrieNode) -> _CompiledNode:
+    """Flatten a trie into ``_CompiledNode`` objects without recursion."""
+    compiled_root = _CompiledNode(())
+    pending: List[Tuple[_TrieNode, _CompiledNode, int]] = [(root, compiled_root, 0)]
+    while pending:
+        node, target, depth = pending.pop()
+        target.entries = dict(node.entries) if node.entries else None
+        target.wildcard = dict(node.wildcard_entry) if node.wildcard_entry else None
+        for key, child in node.children.items():
+            compiled_child = _CompiledNode(target.param_slots)
+            target.children[key] = compiled_child
+            pending.append((child, compiled_child, depth + 1))
+        pchild = node.param_child
+        if pchild is not None:
+            compiled_child = _CompiledNode(target.param_slots + ((pchild.param_name, depth),))
+            target.param_child = compiled_child
+            target.param_regex = pchild.param_regex
+            pending.append((pchild, compiled_child, depth + 1))
+    return compiled_root
+
+
 class Router:
     """High-performance prefix-tree router.
 
@@ -61,22 +118,38 @@ class Router:
         match = router.match('GET', '/api/users/42')
         # match.entry.handler -> get_user
         # match.path_params  -> {'id': '42'}
+
+    Call ``router.freeze()`` once all routes are registered to switch
+    ``match`` to the compiled, iterative matcher.
     """
 
     def __init__(
         self,
         case_sensitive: bool = True,
         trailing_slash: bool = False,
+        match_cache_size: int = 0,
     ) -> None:
         """
         Args:
             case_sensitive: Whether route matching is case-sensitive.
             trailing_slash: If True, ``/foo`` and ``/foo/`` are treated as the same.
+            match_cache_size: Capacity of the LRU cache of recent
+                parameterised matches.  ``0`` disables the cache.
         """
+        if match_cache_size < 0:
+            raise ValueError('match_cache_size must be >= 0')
         self._root: _TrieNode = _TrieNode()
         self._case_sensitive: bool = case_sensitive
         self._trailing_slash: bool = trailing_slash
         self._all_routes: List[RouteEntry] = []
+        self._compiled: Optional[_CompiledNode] = None
+        # (method, canonical_path) -> RouteEntry for routes without params
+        self._static_index: Dict[Tuple[str, str], RouteEntry] = {}
+        self._match_cache_size: int = match_cache_size
+        self._match_cache: 'OrderedDict[Tuple[str, str], RouteMatch]' = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_hits: int = 0
+        self._cache_misses: int = 0
 
     # ------------------------------------------------------------------
     # Registration
@@ -111,6 +184,15 @@ class Router:
         if method != '*' and method not in HTTP_METHODS:
             raise ValueError(f'Unsupported HTTP method: {method}')
 
+        if self._compiled is not None:
+            # Late registration (e.g. OpenAPI endpoints) — fall back to the
+            # trie walk until the router is frozen again.
+            logger.debug('Route added to a frozen router; compiled matcher dropped')
+            self._compiled = None
+        if self._match_cache:
+            with self._cache_lock:
+                self._match_cache.clear()
+
         # Normalise path
         path = self._normalise_path(path)
 
@@ -128,6 +210,12 @@ class Router:
             metadata=metadata or {},
         )
 
+        if path_regex is None:
+            key = '/' + '/'.join(segments)
+            if not self._case_sensitive:
+                key = key.lower()
+            self._static_index[(method, key)] = entry
+
         # Insert into trie
         node = self._root
         for seg in segments:
@@ -167,6 +255,24 @@ class Router:
         logger.debug('Route registered: %s %s', method, path)
         return entry
 
+    # ------------------------------------------------------------------
+    # Compilation
+    # ------------------------------------------------------------------
+
+    def freeze(self) -> None:
+        """Compile the current route table into the iterative matcher.
+
+        Safe to call repeatedly; registering another route afterwards drops
+        the compiled matcher until ``freeze()`` is called again.
+        """
+        self._compiled = _compile_trie(self._root)
+        logger.debug('Router frozen with %d routes', len(self._all_routes))
+
+    @property
+    def is_frozen(self) -> bool:
+        """Whether ``match`` is currently served by the compiled matcher."""
+        return self._compiled is not None
+
     # ------------------------------------------------------------------
     # Matching
     # ------------------------------------------------------------------
@@ -182,13 +288,109 @@ class Router:
             A ``RouteMatch`` if found, else ``None``.
         """
         method = method.upper()
-        path = self._normalise_path(path)
-        segments = self._split_path(path)
 
-        params: Dict[str, str] = {}
-        result = self._match_node(self._root, segments, 0, method, params)
+        # 1. Exact hit on a fully static route — no normalisation, no walk.
+        static_index = self._static_index
+        if static_index:
+            key = path if self._case_sensitive else path.lower()
+            entry = static_index.get((method, key)) or static_index.get(('*', key))
+            if entry is not None:
+                return RouteMatch(entry=entry)
+
+        # 2. Recently matched parameterised route.
+        use_cache = self._match_cache_size > 0
+        if use_cache:
+            cache_key = (method, path)
+            with self._cache_lock:
+                cached = self._match_cache.get(cache_key)
+                if cached is not None:
+                    self._match_cache.move_to_end(cache_key)
+                    self._cache_hits += 1
+                else:
+                    self._cache_misses += 1
+            if cached is not None:
+                return RouteMatch(entry=cached.entry, path_params=dict(cached.path_params))
+
+        # 3. Full walk.
+        normalised = self._normalise_path(path)
+        segments = self._split_path(normalised)
+
+        compiled = self._compiled
+        if compiled is not None:
+            result = self._match_compiled(compiled, segments, method)
+        else:
+            params: Dict[str, str] = {}
+            result = self._match_node(self._root, segments, 0, method, params)
+
+        if use_cache and result is not None:
+            self._cache_store(cache_key, result)
         return result
 
+    def _cache_store(self, key: Tuple[str, str], result: RouteMatch) -> None:
+        snapshot = RouteMatch(entry=result.entry, path_params=dict(result.path_params))
+        with self._cache_lock:
+            cache = self._match_cache
+            cache[key] = snapshot
+            cache.move_to_end(key)
+            while len(cache) > self._match_cache_size:
+                cache.popitem(last=False)
+
+    def _match_compiled(
+        self,
+        root: _CompiledNode,
+        segments: List[str],
+        method: str,
+    ) -> Optional[RouteMatch]:
+        """Iterative walk over the compiled trie.
+
+        Explores transitions in the same priority order as ``_match_node``
+        (static, then parameter, then wildcard) using an explicit stack, and
+        materialises ``path_params`` only once a route has been found.
+        """
+        case_sensitive = self._case_sensitive
+        n = len(segments)
+        # Stack items: (node, segment_index, is_wildcard_attempt)
+        stack: List[Tuple[_CompiledNode, int, bool]] = [(root, 0, False)]
+        pop = stack.pop
+        push = stack.append
+
+        while stack:
+            node, idx, wildcard = pop()
+
+            if wildcard:
+                table = node.wildcard
+                entry = table.get(method) or table.get('*')
+                if entry is not None:
+                    params = {name: segments[i] for name, i in node.param_slots}
+                    params['_wildcard'] = '/'.join(segments[idx:])
+                    return RouteMatch(entry=entry, path_params=params)
+                continue
+
+            if idx == n:
+                entries = node.entries
+                if entries is not None:
+                    entry = entries.get(method) or entries.get('*')
+                    if entry is not None:
+                        params = {name: segments[i] for name, i in node.param_slots}
+                        return RouteMatch(entry=entry, path_params=params)
+                continue
+
+            seg = segments[idx]
+
+            # Pushed in reverse priority so the static branch is tried first.
+            if node.wildcard is not None:
+                push((node, idx, True))
+            pchild = node.param_child
+            if pchild is not None:
+                regex = node.param_regex
+                if regex is None or regex.match(seg):
+                    push((pchild, idx + 1, False))
+            child = node.children.get(seg if case_sensitive else seg.lower())
+            if child is not None:
+                push((child, idx + 1, False))
+
+        return None
+
     def _match_node(
         self,
         node: _TrieNode,
@@ -263,6 +465,27 @@ class Router:
         """Return total number of registered routes."""
         return len(self._all_routes)
 
+    def static_route_count(self) -> int:
+        """Return the number of routes served by the static exact-match index."""
+        return len(self._static_index)
+
+    def match_cache_stats(self) -> Dict[str, int]:
+        """Return LRU match-cache counters (``hits``, ``misses``, ``size``, ``capacity``)."""
+        with self._cache_lock:
+            return {
+                'hits': self._cache_hits,
+                'misses': self._cache_misses,
+                'size': len(self._match_cache),
+                'capacity': self._match_cache_size,
+            }
+
+    def clear_match_cache(self) -> None:
+        """Drop all cached matches and reset the hit/miss counters."""
+        with self._cache_lock:
+            self._match_cache.clear()
+            self._cache_hits = 0
+            self._cache_misses = 0
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -31,6 +31,7 @@ class WebRuntimeConfig:
     health_checks: Iterable[Callable[["WebRuntime"], None]] = field(default_factory=tuple)
     drain_timeout: float = 30.0
     trust_forwarded_headers: bool = False
+    max_request_body_size: Optional[int] = None
 
 
 class WebRuntime:
@@ -78,6 +79,8 @@ class WebRuntime:
 
     def warmup(self) -> None:
         self.state = WebRuntimeState.WARMING
+        self.router.freeze()
+        self.dispatcher.compile_plans()
         for check in self.config.warmup_checks:
             check(self)
 
@@ -92,6 +95,7 @@ class WebRuntime:
     def activate(self, *, prepare: bool = True) -> Optional["WebRuntime"]:
         if prepare and self.state not in {WebRuntimeState.WARMING, WebRuntimeState.ACTIVE}:
             self.prepare()
+        self.dispatcher.pin_controller_instances()
         with self._active_lock:
             previous = self.__class__._active_runtime
             if previous is not None and previous is not self and previous.state != WebRuntimeState.CLOSED:
@@ -116,6 +120,7 @@ class WebRuntime:
                 return
             self.state = WebRuntimeState.CLOSED
             callbacks = list(self._close_callbacks)
+        self.dispatcher.unpin_controller_instances()
         for callback in callbacks:
             callback(self)
 
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""Server-Sent Events (``text/event-stream``) responses.
+
+Controller methods that return an async generator are answered with an
+``EventSourceResponse``; each yielded item becomes one event::
+
+    @get_api(url='/jobs/{job_id}/events')
+    async def job_events(self, job_id, last_event_id):
+        async for status in self.jobs.watch(job_id, after=last_event_id):
+            yield ServerSentEvent(data=status.to_dict(), id=status.version)
+
+Events are pulled from the generator only after the previous one has been
+handed to the driver, so a slow client throttles the producer instead of
+growing a buffer.  While the producer is idle, comment pings keep
+intermediaries from closing the connection.
+
+Author: Cullinan
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from dataclasses import dataclass
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Optional, Union
+
+from cullinan.codec.json_engine import json_dumps
+
+from .web_core import HeaderInput, StreamingResponse, WebRequest, iterate_in_thread
+
+LAST_EVENT_ID_HEADER = "Last-Event-ID"
+
+# The only line terminators in the event-stream format; ``str.splitlines``
+# would also split on \x0b, \x0c, \x1c-\x1e, \x85 and \u2028/\u2029.
+_LINE_BREAK = re.compile(r"\r\n|\r|\n")
+
+
+@dataclass(frozen=True)
+class ServerSentEvent:
+    """A single SSE frame.
+
+    Attributes:
+        data: Event payload; ``dict`` / ``list`` values are JSON-encoded and
+            multi-line strings are split into several ``data:`` lines.
+        event: Optional event type (``addEventListener`` name on the client).
+        id: Optional event id, echoed back by the client as ``Last-Event-ID``
+            when it reconnects.
+        retry: Optional reconnection delay hint in milliseconds.
+        comment: Optional comment line (ignored by clients).
+
+    Raises:
+        ValueError: ``id`` or ``event`` contains a CR/LF (which would start a
+            new field), or ``id`` contains NUL (which clients ignore).
+    """
+
+    data: Any = None
+    event: Optional[str] = None
+    id: Optional[Union[str, int]] = None
+    retry: Optional[int] = None
+    comment: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        for field_name in ("id", "event"):
+            value = getattr(self, field_name)
+            if value is not None and ("\r" in str(value) or "\n" in str(value)):
+                raise ValueError(f"SSE {field_name} must not contain CR or LF: {value!r}")
+        if self.id is not None and "\0" in str(self.id):
+            raise ValueError(f"SSE id must not contain NUL: {self.id!r}")
+
+    def encode(self) -> bytes:
+        lines = []
+        if self.comment is not None:
+            lines.extend(f": {line}" for line in _LINE_BREAK.split(str(self.comment)))
+        if self.id is not None:
+            lines.append(f"id: {self.id}")
+        if self.event is not None:
+            lines.append(f"event: {self.event}")
+        if self.retry is not None:
+            lines.append(f"retry: {int(self.retry)}")
+        if self.data is not None:
+            if isinstance(self.data, (dict, list)):
+                payload = json_dumps(self.data).decode("utf-8")
+            elif isinstance(self.data, bytes):
+                payload = self.data.decode("utf-8")
+            else:
+                payload = str(self.data)
+            lines.extend(f"data: {line}" for line in _LINE_BREAK.split(payload))
+        return ("\n".join(lines) + "\n\n").encode("utf-8")
+
+
+_PING = b": ping\n\n"
+
+EventSource = Union[AsyncIterable[Any], Iterable[Any]]
+
+
+class EventSourceResponse(StreamingResponse):
+    """Streaming ``text/event-stream`` response.
+
+    Items produced by ``events`` may be ``ServerSentEvent`` instances,
+    ``str`` / ``bytes`` (sent as ``data``) or JSON-serialisable objects.
+
+    Args:
+        events: Sync or async iterable producing the events.  Sync
+            iterators are advanced in a worker thread.
+        ping_interval: Seconds of producer inactivity after which a comment
+            ping is sent; ``None`` or ``0`` disables heartbeats.
+        retry: Reconnection delay (ms) announced before the first event.
+    """
+
+    DEFAULT_PING_INTERVAL: float = 15.0
+
+    def __init__(
+        self,
+        events: EventSource,
+        status_code: int = 200,
+        headers: Optional[HeaderInput] = None,
+        *,
+        ping_interval: Optional[float] = DEFAULT_PING_INTERVAL,
+        retry: Optional[int] = None,
+    ) -> None:
+        self.ping_interval = ping_interval
+        self.retry = retry
+        super().__init__(
+            self._encode_events(events),
+            status_code=status_code,
+            headers=headers,
+            content_type="text/event-stream; charset=utf-8",
+        )
+        if not self._headers.contains("Cache-Control"):
+            self._headers.set("Cache-Control", "no-cache")
+        # Ask reverse proxies (nginx) not to buffer the stream.
+        if not self._headers.contains("X-Accel-Buffering"):
+            self._headers.set("X-Accel-Buffering", "no")
+
+    async def _encode_events(self, events: EventSource) -> AsyncIterator[bytes]:
+        if self.retry is not None:
+            yield ServerSentEvent(retry=self.retry).encode()
+
+        iterator = _as_async_iterator(events)
+        pending: Optional[asyncio.Future] = None
+        try:
+            while True:
+                if pending is None:
+                    pending = asyncio.ensure_future(_next_item(iterator))
+                if self.ping_interval:
+                    done, _ = await asyncio.wait({pending}, timeout=self.ping_interval)
+                    if not done:
+                        yield _PING
+                        continue
+                else:
+                    await asyncio.wait({pending})
+                try:
+                    item = pending.result()
+                except StopAsyncIteration:
+                    break
+                finally:
+                    pending = None
+                yield self._encode_item(item)
+        finally:
+            if pending is not None:
+                pending.cancel()
+                try:
+                    await pending
+                except (asyncio.CancelledError, Exception):
+                    pass
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    def _encode_item(self, item: Any) -> bytes:
+        if isinstance(item, ServerSentEvent):
+            return item.encode()
+        return ServerSentEvent(data=item).encode()
+
+
+def last_event_id(request: WebRequest) -> Optional[str]:
+    """Return the ``Last-Event-ID`` a reconnecting EventSource client sent, if any."""
+    return request.header(LAST_EVENT_ID_HEADER)
+
+
+def _as_async_iterator(events: EventSource) -> AsyncIterator[Any]:
+    if hasattr(events, "__aiter__"):
+        return events.__aiter__()
+    if isinstance(events, (list, tuple)):
+        return _iterate_sequence(events)
+    # Blocking sync producers are advanced off the event loop
+    return iterate_in_thread(events)
+
+
+async def _iterate_sequence(events: Iterable[Any]) -> AsyncIterator[Any]:
+    for item in events:
+        yield item
+
+
+async def _next_item(iterator: AsyncIterator[Any]) -> Any:
+    return await iterator.__anext__()
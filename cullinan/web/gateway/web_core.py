@@ -3,11 +3,33 @@
 
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass
+import asyncio
+import os
+from dataclasses import dataclass, is_dataclass
 from http.cookies import SimpleCookie
-from typing import Any, Dict, Iterator, List, Mapping, MutableMapping, Optional, Sequence, Tuple, Union
-from urllib.parse import parse_qs
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+from types import MappingProxyType
+from urllib.parse import parse_qs, parse_qsl
+
+from cullinan.codec.errors import DecodeError
+from cullinan.codec.json_codec import JsonBodyCodec
+from cullinan.codec.json_engine import json_dumps, json_loads
+from cullinan.codec.registry import get_codec_registry
 
 
 HeaderInput = Union[
@@ -17,15 +39,31 @@ HeaderInput = Union[
 ]
 
 
+class RequestBodyTooLarge(ValueError):
+    """Raised when a request body exceeds the configured maximum size (HTTP 413)."""
+
+    status_code = 413
+
+    def __init__(self, limit: int) -> None:
+        super().__init__(f"Request body exceeds the maximum size of {limit} bytes")
+        self.limit = limit
+
+
 class WebHeaders:
-    """Case-insensitive multi-value HTTP headers preserving insertion order."""
+    """Case-insensitive multi-value HTTP headers preserving insertion order.
+
+    ``_items`` keeps every header in insertion order; ``_index`` maps each
+    lowercased name to its values so lookups do not scan the whole list.
+    """
 
     def __init__(self, initial: Optional[HeaderInput] = None) -> None:
         self._items: List[Tuple[str, str]] = []
+        self._index: Dict[str, List[str]] = {}
         if initial is None:
             return
         if isinstance(initial, WebHeaders):
             self._items = list(initial._items)
+            self._index = {lower: list(values) for lower, values in initial._index.items()}
         elif isinstance(initial, Mapping):
             for name, value in initial.items():
                 self.add(name, value)
@@ -33,34 +71,58 @@ class WebHeaders:
             for name, value in initial:
                 self.add(name, value)
 
+    @classmethod
+    def from_raw(cls, raw: Iterable[Tuple[bytes, bytes]]) -> "WebHeaders":
+        """Build headers from raw ``(name, value)`` byte pairs, e.g. an ASGI scope."""
+        headers = cls()
+        items = headers._items
+        index = headers._index
+        for name_bytes, value_bytes in raw:
+            name = name_bytes.decode("latin-1")
+            value = value_bytes.decode("latin-1")
+            items.append((name, value))
+            values = index.get(name.lower())
+            if values is None:
+                index[name.lower()] = [value]
+            else:
+                values.append(value)
+        return headers
+
     def add(self, name: str, value: Any) -> "WebHeaders":
-        self._items.append((str(name), self._stringify(value)))
+        name = str(name)
+        value = self._stringify(value)
+        self._items.append((name, value))
+        values = self._index.get(name.lower())
+        if values is None:
+            self._index[name.lower()] = [value]
+        else:
+            values.append(value)
         return self
 
     def set(self, name: str, value: Any) -> "WebHeaders":
         lower = name.lower()
-        self._items = [(k, v) for k, v in self._items if k.lower() != lower]
-        self._items.append((str(name), self._stringify(value)))
+        if lower in self._index:
+            self._discard(lower)
+        name = str(name)
+        value = self._stringify(value)
+        self._items.append((name, value))
+        self._index[lower] = [value]
         return self
 
     def get(self, name: str, default: Optional[str] = None) -> Optional[str]:
-        lower = name.lower()
-        for key, value in reversed(self._items):
-            if key.lower() == lower:
-                return value
-        return default
+        values = self._index.get(name.lower())
+        return values[-1] if values else default
 
     def get_all(self, name: str) -> List[str]:
-        lower = name.lower()
-        return [value for key, value in self._items if key.lower() == lower]
+        return list(self._index.get(name.lower(), ()))
 
     def remove(self, name: str) -> None:
         lower = name.lower()
-        self._items = [(k, v) for k, v in self._items if k.lower() != lower]
+        if self._index.pop(lower, None) is not None:
+            self._discard(lower)
 
     def contains(self, name: str) -> bool:
-        lower = name.lower()
-        return any(key.lower() == lower for key, _ in self._items)
+        return name.lower() in self._index
 
     def items(self) -> List[Tuple[str, str]]:
         return list(self._items)
@@ -104,6 +166,10 @@ class WebHeaders:
     def __repr__(self) -> str:
         return f"WebHeaders({self._items!r})"
 
+    def _discard(self, lower: str) -> None:
+        # Mutate in place so the remaining headers keep their order
+        self._items[:] = [(k, v) for k, v in self._items if k.lower() != lower]
+
     @staticmethod
     def _stringify(value: Any) -> str:
         if isinstance(value, bytes):
@@ -111,6 +177,61 @@ class WebHeaders:
         return str(value)
 
 
+class QueryParams(dict):
+    """Immutable query-string parameters.
+
+    The mapping holds the last value of each name (the long-standing
+    ``request.query_params`` semantics); ``get_first``, ``get_all`` and
+    ``multi`` expose every value in order.  It is built in one pass and can
+    be shared with handlers and the parameter resolver without copying.
+    """
+
+    __slots__ = ("_multi",)
+
+    def __init__(self, pairs: Iterable[Tuple[str, str]] = ()) -> None:
+        multi: Dict[str, List[str]] = {}
+        for name, value in pairs:
+            values = multi.get(name)
+            if values is None:
+                multi[name] = [value]
+            else:
+                values.append(value)
+        super().__init__({name: values[-1] for name, values in multi.items()})
+        self._multi = multi
+
+    @classmethod
+    def parse(cls, query_string: str) -> "QueryParams":
+        return cls(parse_qsl(query_string, keep_blank_values=True))
+
+    def get_first(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        values = self._multi.get(name)
+        return values[0] if values else default
+
+    def get_all(self, name: str) -> List[str]:
+        return list(self._multi.get(name, ()))
+
+    @property
+    def multi(self) -> Mapping[str, List[str]]:
+        """Read-only ``name -> [values]`` view."""
+        return MappingProxyType(self._multi)
+
+    def items_multi(self) -> List[Tuple[str, str]]:
+        return [(name, value) for name, values in self._multi.items() for value in values]
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("QueryParams is immutable")
+
+    __setitem__ = __delitem__ = _immutable  # type: ignore[assignment]
+    update = setdefault = pop = popitem = clear = _immutable  # type: ignore[assignment]
+    __ior__ = _immutable  # type: ignore[assignment]
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (QueryParams, (self.items_multi(),))
+
+    def __repr__(self) -> str:
+        return f"QueryParams({self.items_multi()!r})"
+
+
 @dataclass
 class ResponseCookie:
     name: str
@@ -169,7 +290,13 @@ class WebCookies:
 
 
 class WebRequest:
-    """Transport-agnostic HTTP request."""
+    """Transport-agnostic HTTP request.
+
+    Drivers may pass ``raw_headers`` (``(name, value)`` byte pairs) instead of
+    ``headers``; they are decoded on first access.  Unless ``cookies`` is
+    given, the ``Cookie`` header is parsed on first access, and unless
+    ``full_url`` is given it is derived from the request when read.
+    """
 
     def __init__(
         self,
@@ -186,30 +313,62 @@ class WebRequest:
         cookies: Optional[Mapping[str, str]] = None,
         raw_path: Optional[str] = None,
         attributes: Optional[MutableMapping[str, Any]] = None,
+        body_stream: Optional[AsyncIterator[bytes]] = None,
+        raw_headers: Optional[Iterable[Tuple[bytes, bytes]]] = None,
     ) -> None:
         self.method = method.upper()
         self.path = path
         self.raw_path = raw_path or path
         self.query_string = query_string
-        self._headers = WebHeaders(headers)
-        self.cookies = WebCookies(cookies or self._parse_cookie_header(self._headers.get("cookie")))
+        self._raw_headers = raw_headers
+        self._headers: Optional[WebHeaders] = None if raw_headers is not None else WebHeaders(headers)
+        self._cookies: Optional[WebCookies] = WebCookies(cookies) if cookies else None
         self.path_params: Dict[str, str] = {}
         self.attributes: MutableMapping[str, Any] = attributes or {}
-        self.body = body if isinstance(body, bytes) else body.encode("utf-8") if isinstance(body, str) else b""
+        # ``_body`` stays ``None`` while a streamed body has not been read yet.
+        self._body: Optional[bytes] = None if body_stream is not None else self._coerce_body(body)
+        self._body_stream: Optional[AsyncIterator[bytes]] = body_stream
         self.client_ip = client_ip
         self.scheme = scheme
         self.server_host = server_host
         self.server_port = server_port
-        self.full_url = full_url or f"{scheme}://{server_host}:{server_port}{path}"
-        self._query_params: Optional[Dict[str, str]] = None
-        self._query_params_multi: Optional[Dict[str, List[str]]] = None
+        self._full_url: Optional[str] = full_url or None
+        self._query_params: Optional[QueryParams] = None
         self._json_cache: Any = _SENTINEL
+        self._decoded_cache: Any = _SENTINEL
         self._form_cache: Any = _SENTINEL
         self._text_cache: Any = _SENTINEL
 
     @property
     def headers(self) -> WebHeaders:
-        return self._headers
+        headers = self._headers
+        if headers is None:
+            headers = self._headers = WebHeaders.from_raw(self._raw_headers or ())
+            self._raw_headers = None
+        return headers
+
+    @property
+    def cookies(self) -> WebCookies:
+        if self._cookies is None:
+            self._cookies = WebCookies(self._parse_cookie_header(self.headers.get("cookie")))
+        return self._cookies
+
+    @cookies.setter
+    def cookies(self, value: WebCookies) -> None:
+        self._cookies = value
+
+    @property
+    def full_url(self) -> str:
+        if self._full_url is None:
+            return self._build_full_url()
+        return self._full_url
+
+    @full_url.setter
+    def full_url(self, value: str) -> None:
+        self._full_url = value or None
+
+    def _build_full_url(self) -> str:
+        return f"{self.scheme}://{self.server_host}:{self.server_port}{self.path}"
 
     @property
     def content_type(self) -> Optional[str]:
@@ -235,27 +394,68 @@ class WebRequest:
         return f"{self.server_host}:{self.server_port}"
 
     @property
-    def query_params(self) -> Dict[str, str]:
-        if self._query_params is None:
-            self._parse_query_string()
-        return self._query_params or {}
+    def query_params(self) -> QueryParams:
+        """Query parameters, parsed on first access (last value per name)."""
+        params = self._query_params
+        if params is None:
+            params = self._query_params = QueryParams.parse(self.query_string)
+        return params
 
     @property
-    def query_params_multi(self) -> Dict[str, List[str]]:
-        if self._query_params_multi is None:
-            self._parse_query_string()
-        return self._query_params_multi or {}
+    def query_params_multi(self) -> Mapping[str, List[str]]:
+        return self.query_params.multi
 
-    def _parse_query_string(self) -> None:
-        raw = parse_qs(self.query_string, keep_blank_values=True)
-        self._query_params_multi = {k: list(v) for k, v in raw.items()}
-        self._query_params = {k: v[-1] for k, v in raw.items()}
+    @property
+    def body(self) -> bytes:
+        if self._body is None:
+            raise RuntimeError(
+                "Request body is streamed and has not been read yet; "
+                "await request.bytes() or iterate request.stream() first"
+            )
+        return self._body
+
+    @body.setter
+    def body(self, value: Union[bytes, str, None]) -> None:
+        self._body = self._coerce_body(value)
+        self._body_stream = None
+        self._json_cache = _SENTINEL
+        self._decoded_cache = _SENTINEL
+        self._form_cache = _SENTINEL
+        self._text_cache = _SENTINEL
+
+    @property
+    def body_loaded(self) -> bool:
+        """Whether the full body is available synchronously via ``body``."""
+        return self._body is not None
+
+    async def stream(self) -> AsyncIterator[bytes]:
+        """Iterate over the request body chunks as they arrive.
+
+        A streamed body can be iterated only once and is not retained; use
+        ``bytes()`` instead to buffer it.
+        """
+        if self._body is not None:
+            if self._body:
+                yield self._body
+            return
+        source = self._body_stream
+        if source is None:
+            raise RuntimeError("Request body stream has already been consumed")
+        self._body_stream = None
+        async for chunk in source:
+            yield chunk
 
     async def bytes(self) -> bytes:
-        return self.body
+        if self._body is None:
+            buffer = bytearray()
+            async for chunk in self.stream():
+                buffer += chunk
+            self._body = bytes(buffer)
+        return self._body
 
     async def text(self, encoding: Optional[str] = None) -> str:
         if self._text_cache is _SENTINEL:
+            body = await self.bytes()
             encodings = [encoding] if encoding else []
             encodings.extend(["utf-8", "latin-1"])
             last_error: Optional[Exception] = None
@@ -263,7 +463,7 @@ class WebRequest:
                 if candidate is None:
                     continue
                 try:
-                    self._text_cache = self.body.decode(candidate)
+                    self._text_cache = body.decode(candidate)
                     break
                 except UnicodeDecodeError as exc:
                     last_error = exc
@@ -274,19 +474,60 @@ class WebRequest:
         return self._text_cache
 
     async def json(self) -> Any:
+        await self.bytes()
+        return self._json_value()
+
+    def decoded_body(self) -> Dict[str, Any]:
+        """Return the body decoded by the ``CodecRegistry`` codec for its Content-Type.
+
+        The body is decoded at most once per request and the result (or the
+        ``DecodeError``) is cached, so middleware, parameter binding and
+        ``json()`` share one parse.  JSON bodies reuse the ``json()`` value;
+        non-object JSON is wrapped as ``{"_value": ...}`` like
+        ``JsonBodyCodec``.  The body must already be loaded.
+        """
+        if self._decoded_cache is _SENTINEL:
+            try:
+                self._decoded_cache = self._decode_body()
+            except DecodeError as exc:
+                self._decoded_cache = _DecodeFailure(exc)
+        if isinstance(self._decoded_cache, _DecodeFailure):
+            raise self._decoded_cache.error
+        return self._decoded_cache
+
+    def _decode_body(self) -> Dict[str, Any]:
+        if not self.body:
+            return {}
+        content_type = self.content_type or ""
+        charset = _content_charset(content_type)
+        codec = get_codec_registry().get_body_codec(content_type)
+        if codec is None or isinstance(codec, JsonBodyCodec):
+            # Share the ``json()`` parse; other charsets go through the codec.
+            if charset in ("utf-8", "utf8"):
+                try:
+                    return JsonBodyCodec.as_dict(self._json_value())
+                except ValueError as exc:
+                    raise DecodeError(str(exc), content_type="application/json", body_preview=self.body) from exc
+            codec = codec or JsonBodyCodec()
+        return codec.decode(self.body, charset)
+
+    def _json_value(self) -> Any:
         if self._json_cache is _SENTINEL:
-            if not self.body:
+            body = self.body
+            if not body:
                 self._json_cache = None
             else:
                 try:
-                    self._json_cache = json.loads(await self.text())
-                except (UnicodeDecodeError, json.JSONDecodeError) as exc:
-                    raise ValueError(f"Invalid JSON body: {exc}") from exc
+                    self._json_cache = json_loads(body)
+                except ValueError as exc:
+                    self._json_cache = _DecodeFailure(ValueError(f"Invalid JSON body: {exc}"))
+        if isinstance(self._json_cache, _DecodeFailure):
+            raise self._json_cache.error
         return self._json_cache
 
     async def form(self) -> Dict[str, str]:
         if self._form_cache is _SENTINEL:
-            if not self.body:
+            if not await self.bytes():
                 self._form_cache = {}
             else:
                 raw = parse_qs(await self.text(), keep_blank_values=True)
@@ -306,6 +547,14 @@ class WebRequest:
         lower = ct.lower()
         return "application/x-www-form-urlencoded" in lower or "multipart/form-data" in lower
 
+    @staticmethod
+    def _coerce_body(body: Union[bytes, str, None]) -> bytes:
+        if isinstance(body, bytes):
+            return body
+        if isinstance(body, str):
+            return body.encode("utf-8")
+        return b""
+
     @staticmethod
     def _parse_cookie_header(cookie_header: Optional[str]) -> Dict[str, str]:
         if not cookie_header:
@@ -391,7 +640,7 @@ class WebResponse:
             return self._content_type
         if self._headers.contains("Content-Type"):
             return self._headers.get("Content-Type") or ""
-        if isinstance(self._body, (dict, list)):
+        if _is_json_body(self._body):
             return "application/json"
         if isinstance(self._body, bytes):
             return "application/octet-stream"
@@ -450,8 +699,8 @@ class WebResponse:
             return self._body
         if isinstance(self._body, str):
             return self._body.encode("utf-8")
-        if isinstance(self._body, (dict, list)):
-            return json.dumps(self._body, ensure_ascii=False, default=str).encode("utf-8")
+        if _is_json_body(self._body):
+            return json_dumps(self._body)
         return str(self._body).encode("utf-8")
 
     def freeze(self) -> None:
@@ -522,6 +771,338 @@ class WebResponse:
         return f"<WebResponse [{self.status_code}] {self.content_type}>"
 
 
+ChunkSource = Union[Iterable[Union[bytes, str]], AsyncIterable[Union[bytes, str]]]
+StreamFilter = Callable[[AsyncIterator[bytes]], AsyncIterator[bytes]]
+
+
+class StreamingResponse(WebResponse):
+    """Response whose body is produced incrementally by an iterator.
+
+    ``content`` may be a sync or async iterable yielding ``bytes`` (``str``
+    chunks are UTF-8 encoded).  Sync iterators are advanced in a worker
+    thread, so a blocking producer does not stall the event loop.  Drivers
+    send each chunk as soon as it is produced instead of rendering the whole
+    body first, so no ``Content-Length`` is emitted.
+
+    Usage::
+
+        async def export():
+            async for row in fetch_rows():
+                yield row.to_csv_line()
+
+        return StreamingResponse(export(), content_type="text/csv")
+
+    Attributes:
+        stop_on_disconnect: When ``True`` drivers that can observe a client
+            disconnect cancel the stream (and close the producer) early.
+    """
+
+    stop_on_disconnect: bool = True
+
+    def __init__(
+        self,
+        content: ChunkSource,
+        status_code: int = 200,
+        headers: Optional[HeaderInput] = None,
+        content_type: Optional[str] = None,
+    ) -> None:
+        super().__init__(
+            body=content,
+            status_code=status_code,
+            headers=headers,
+            content_type=content_type or "application/octet-stream",
+        )
+        self._consumed = False
+        self._stream_filters: List[StreamFilter] = []
+
+    def add_stream_filter(self, stream_filter: "StreamFilter") -> None:
+        """Wrap the outgoing chunk stream, e.g. to compress it incrementally.
+
+        ``stream_filter`` receives the current chunk iterator and returns a
+        new one.  Filters apply in registration order.
+        """
+        self._check_mutable()
+        self._stream_filters.append(stream_filter)
+
+    @property
+    def has_stream_filters(self) -> bool:
+        return bool(self._stream_filters)
+
+    async def iter_chunks(self) -> AsyncIterator[bytes]:
+        """Yield encoded body chunks; the underlying iterator is consumed once.
+
+        Callers that stop early should ``aclose()`` the returned iterator so
+        the producer is closed right away.
+        """
+        if self._consumed:
+            raise RuntimeError(f"{type(self).__name__} body has already been consumed")
+        self._consumed = True
+        streams = [self._source_chunks()]
+        for stream_filter in self._stream_filters:
+            streams.append(stream_filter(streams[-1]))
+        try:
+            async for chunk in streams[-1]:
+                if chunk:
+                    yield chunk
+        finally:
+            # Closing early (``aclose()``) must reach the producer's cleanup
+            for stream in reversed(streams):
+                aclose = getattr(stream, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+
+    async def _source_chunks(self) -> AsyncIterator[bytes]:
+        source = self._body
+        if hasattr(source, "__aiter__"):
+            try:
+                async for chunk in source:
+                    if chunk:
+                        yield self._encode_chunk(chunk)
+            finally:
+                aclose = getattr(source, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+        elif isinstance(source, (list, tuple)):
+            for chunk in source:
+                if chunk:
+                    yield self._encode_chunk(chunk)
+        else:
+            chunks = iterate_in_thread(source or ())
+            try:
+                async for chunk in chunks:
+                    if chunk:
+                        yield self._encode_chunk(chunk)
+            finally:
+                await chunks.aclose()
+
+    def render_body(self) -> bytes:
+        raise RuntimeError("StreamingResponse cannot be rendered at once; use iter_chunks()")
+
+    @staticmethod
+    def _encode_chunk(chunk: Union[bytes, str]) -> bytes:
+        if isinstance(chunk, str):
+            return chunk.encode("utf-8")
+        return bytes(chunk)
+
+    def __repr__(self) -> str:
+        return f"<StreamingResponse [{self.status_code}] {self.content_type}>"
+
+
+FileSegment = Union[bytes, Tuple[int, int]]
+
+
+class FileResponse(StreamingResponse):
+    """Response that streams a file (or byte ranges of it) from disk.
+
+    The body is described as segments: ``(offset, length)`` tuples read from
+    ``path`` and literal ``bytes`` (multipart framing).  Drivers may hand the
+    file ranges to the server for zero-copy transmission; otherwise
+    ``iter_chunks()`` reads ``chunk_size`` bytes at a time off the event loop,
+    so large downloads never sit in memory whole.  ``Content-Length`` is
+    always known up front.
+    """
+
+    DEFAULT_CHUNK_SIZE: int = 64 * 1024
+    # A file body is finite; finish it rather than racing disconnect events.
+    stop_on_disconnect = False
+    # Whether drivers may hand ``path`` to the server (sendfile / pathsend).
+    zero_copy = True
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        status_code: int = 200,
+        headers: Optional[HeaderInput] = None,
+        content_type: Optional[str] = None,
+        *,
+        offset: int = 0,
+        length: Optional[int] = None,
+        file_size: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        super().__init__((), status_code=status_code, headers=headers, content_type=content_type)
+        self.path = os.fspath(path)
+        self.file_size = os.path.getsize(self.path) if file_size is None else int(file_size)
+        if length is None:
+            length = self.file_size - offset
+        self.chunk_size = int(chunk_size)
+        self._segments: List[FileSegment] = [(int(offset), int(length))]
+        self._headers.set("Content-Length", str(self.content_length))
+
+    @classmethod
+    def byteranges(
+        cls,
+        path: Union[str, "os.PathLike[str]"],
+        ranges: Sequence[Tuple[int, int]],
+        *,
+        file_size: int,
+        part_content_type: str,
+        boundary: str,
+        headers: Optional[HeaderInput] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> "FileResponse":
+        """Build a ``206 multipart/byteranges`` response for ``(offset, length)`` ranges."""
+        response = cls(
+            path,
+            status_code=206,
+            headers=headers,
+            content_type=f"multipart/byteranges; boundary={boundary}",
+            offset=0,
+            length=0,
+            file_size=file_size,
+            chunk_size=chunk_size,
+        )
+        segments: List[FileSegment] = []
+        for offset, length in ranges:
+            part_header = (
+                f"--{boundary}\r\n"
+                f"Content-Type: {part_content_type}\r\n"
+                f"Content-Range: bytes {offset}-{offset + length - 1}/{file_size}\r\n\r\n"
+            )
+            segments.append(part_header.encode("latin-1"))
+            segments.append((offset, length))
+            segments.append(b"\r\n")
+        segments.append(f"--{boundary}--\r\n".encode("latin-1"))
+        response._segments = segments
+        response._headers.set("Content-Length", str(response.content_length))
+        return response
+
+    @property
+    def segments(self) -> List[FileSegment]:
+        return list(self._segments)
+
+    @property
+    def content_length(self) -> int:
+        return sum(len(seg) if isinstance(seg, bytes) else seg[1] for seg in self._segments)
+
+    @property
+    def is_whole_file(self) -> bool:
+        return self._segments == [(0, self.file_size)]
+
+    async def _source_chunks(self) -> AsyncIterator[bytes]:
+        handle = await _run_blocking(open, self.path, "rb")
+        try:
+            for segment in self._segments:
+                if isinstance(segment, bytes):
+                    yield segment
+                    continue
+                offset, remaining = segment
+                await _run_blocking(handle.seek, offset)
+                while remaining > 0:
+                    chunk = await _run_blocking(handle.read, min(self.chunk_size, remaining))
+                    if not chunk:
+                        break
+                    remaining -= len(chunk)
+                    yield chunk
+        finally:
+            handle.close()
+
+    def render_body(self) -> bytes:
+        """Read the whole body synchronously (for tests and in-process callers).
+
+        Stream filters are not applied; use ``iter_chunks()`` for the bytes
+        a driver would send.
+        """
+        parts: List[bytes] = []
+        with open(self.path, "rb") as handle:
+            for segment in self._segments:
+                if isinstance(segment, bytes):
+                    parts.append(segment)
+                else:
+                    handle.seek(segment[0])
+                    parts.append(handle.read(segment[1]))
+        return b"".join(parts)
+
+    def __repr__(self) -> str:
+        return f"<FileResponse [{self.status_code}] {self.path}>"
+
+
+class CachedFileResponse(FileResponse):
+    """``FileResponse`` whose bytes are already in memory.
+
+    Returned for hot static assets served from the in-memory cache, so
+    middleware treats cached and uncached files alike.  The body comes from
+    ``data`` (the bytes read from ``path``); the file is not opened again and
+    drivers do not use zero-copy transmission.
+    """
+
+    zero_copy = False
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        data: bytes,
+        status_code: int = 200,
+        headers: Optional[HeaderInput] = None,
+        content_type: Optional[str] = None,
+        *,
+        offset: int = 0,
+        length: Optional[int] = None,
+        chunk_size: int = FileResponse.DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        super().__init__(
+            path,
+            status_code=status_code,
+            headers=headers,
+            content_type=content_type,
+            offset=offset,
+            length=length,
+            file_size=len(data),
+            chunk_size=chunk_size,
+        )
+        self.data = data
+
+    async def _source_chunks(self) -> AsyncIterator[bytes]:
+        for segment in self._segments:
+            if isinstance(segment, bytes):
+                yield segment
+                continue
+            offset, length = segment
+            end = offset + length
+            while offset < end:
+                yield self.data[offset:min(offset + self.chunk_size, end)]
+                offset += self.chunk_size
+
+    def render_body(self) -> bytes:
+        return b"".join(
+            segment if isinstance(segment, bytes) else self.data[segment[0]:segment[0] + segment[1]]
+            for segment in self._segments
+        )
+
+
+async def iterate_in_thread(iterable: Iterable[Any]) -> AsyncIterator[Any]:
+    """Yield the items of a sync iterable, advancing it in a worker thread.
+
+    A sync producer may block (file reads, DB cursors); pulling each item
+    off the event loop keeps other connections served meanwhile.  The
+    iterable's ``close()`` runs when iteration ends or is closed early.
+    """
+    iterator = iter(iterable)
+    try:
+        while True:
+            item = await _run_blocking(next, iterator, _SENTINEL)
+            if item is _SENTINEL:
+                return
+            yield item
+    finally:
+        close = getattr(iterable, "close", None)
+        if close is not None:
+            try:
+                close()
+            except ValueError:
+                # Cancelled while ``next`` still runs in the worker thread;
+                # it is closed when garbage collected instead.
+                pass
+
+
+async def _run_blocking(func: Any, *args: Any) -> Any:
+    to_thread = getattr(asyncio, "to_thread", None)
+    if to_thread is not None:  # Python 3.9+
+        return await to_thread(func, *args)
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(None, func, *args)
+
+
 @dataclass
 class WebExchange:
     request: WebRequest
@@ -530,8 +1111,65 @@ class WebExchange:
     driver_meta: Optional[Dict[str, Any]] = None
 
 
+class _SecurityHeaders(dict):
+    """``dict`` that drops its ``HeaderPolicy``'s precomputed headers on edit."""
+
+    __slots__ = ("_policy",)
+
+    def __init__(self, headers: Any = (), policy: Optional["HeaderPolicy"] = None) -> None:
+        super().__init__(headers)
+        self._policy = policy
+
+    def _changed(self) -> None:
+        policy = getattr(self, "_policy", None)
+        if policy is not None:
+            policy._compiled = None
+
+    def __setitem__(self, name: str, value: str) -> None:
+        super().__setitem__(name, value)
+        self._changed()
+
+    def __delitem__(self, name: str) -> None:
+        super().__delitem__(name)
+        self._changed()
+
+    def __ior__(self, other: Any) -> "_SecurityHeaders":
+        super().__ior__(other)
+        self._changed()
+        return self
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self._changed()
+
+    def setdefault(self, name: str, default: Any = None) -> Any:
+        value = super().setdefault(name, default)
+        self._changed()
+        return value
+
+    def pop(self, *args: Any) -> Any:
+        value = super().pop(*args)
+        self._changed()
+        return value
+
+    def popitem(self) -> Tuple[str, str]:
+        item = super().popitem()
+        self._changed()
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
+
+
 class HeaderPolicy:
-    """Applies stable response header defaults."""
+    """Applies stable response header defaults.
+
+    The header values are computed once and reused for every response.
+    Reassigning any attribute, or editing ``default_security_headers`` in
+    place, recomputes them.  The mapping passed in is copied, so later edits
+    to the caller's own dict have no effect.
+    """
 
     def __init__(
         self,
@@ -543,7 +1181,7 @@ class HeaderPolicy:
         allow_credentials: bool = False,
         trust_forwarded_headers: bool = False,
     ) -> None:
-        self.default_security_headers = dict(
+        self.default_security_headers = (
             default_security_headers
             or {
                 "X-Content-Type-Options": "nosniff",
@@ -557,21 +1195,44 @@ class HeaderPolicy:
         self.allow_credentials = allow_credentials
         self.trust_forwarded_headers = trust_forwarded_headers
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "default_security_headers":
+            value = _SecurityHeaders(value or {}, self)
+        super().__setattr__(name, value)
+        if name != "_compiled":
+            super().__setattr__("_compiled", None)
+
+    def set_security_header(self, name: str, value: str) -> None:
+        """Add or replace one default security header."""
+        self.default_security_headers[name] = value
+
+    def remove_security_header(self, name: str) -> None:
+        """Drop one default security header (no-op when absent)."""
+        self.default_security_headers.pop(name, None)
+
     def apply(self, request: WebRequest, response: WebResponse) -> WebResponse:
-        for name, value in self.default_security_headers.items():
+        defaults, overrides = self._compiled or self._compile()
+        for name, value in defaults:
             if response.get_header(name) is None:
-                response.set_header(name, value)
+                response.add_header(name, value)
+        for name, value in overrides:
+            response.set_header(name, value)
+        return response
 
+    def _compile(self) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+        """Build ``(defaults, overrides)``: headers added when absent / always set."""
+        defaults = [(str(name), str(value)) for name, value in self.default_security_headers.items()]
+        overrides: List[Tuple[str, str]] = []
         if self.allow_origins is not None:
-            response.set_header("Access-Control-Allow-Origin", self.allow_origins)
+            overrides.append(("Access-Control-Allow-Origin", str(self.allow_origins)))
         if self.allow_methods is not None:
-            response.set_header("Access-Control-Allow-Methods", self.allow_methods)
+            overrides.append(("Access-Control-Allow-Methods", str(self.allow_methods)))
         if self.allow_headers is not None:
-            response.set_header("Access-Control-Allow-Headers", self.allow_headers)
+            overrides.append(("Access-Control-Allow-Headers", str(self.allow_headers)))
         if self.allow_credentials:
-            response.set_header("Access-Control-Allow-Credentials", "true")
-
-        return response
+            overrides.append(("Access-Control-Allow-Credentials", "true"))
+        self._compiled = (defaults, overrides)
+        return self._compiled
 
 
 class _Sentinel:
@@ -579,3 +1240,24 @@ class _Sentinel:
 
 
 _SENTINEL = _Sentinel()
+
+
+def _is_json_body(body: Any) -> bool:
+    return isinstance(body, (dict, list)) or (is_dataclass(body) and not isinstance(body, type))
+
+
+class _DecodeFailure:
+    """Cached body decode error, re-raised on every access."""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
+
+def _content_charset(content_type: str) -> str:
+    for param in content_type.split(";")[1:]:
+        name, _, value = param.partition("=")
+        if name.strip().lower() == "charset":
+            return value.strip().strip("\"'").lower() or "utf-8"
+    return "utf-8"
@@ -67,7 +67,12 @@ class BodyDecoderMiddleware(Middleware):
         if not self.enabled:
             return handler
 
-        request = handler.request
+        # The gateway bridge passes the ``WebRequest`` itself
+        request = getattr(handler, 'request', handler)
+
+        # @stream_request_body 路由的请求体留给 handler 逐块读取，不在此解码
+        if not getattr(request, 'body_loaded', True):
+            return handler
 
         # 检查请求体大小
         body = request.body
@@ -76,6 +81,8 @@ class BodyDecoderMiddleware(Middleware):
                 f"Request body too large: {len(body)} bytes > {self.max_body_size} bytes"
             )
             if not self.fail_silently:
+                if handler is request:
+                    return None
                 handler.set_status(413)
                 handler.write({"error": "Request body too large"})
                 handler.finish()
@@ -90,12 +97,15 @@ class BodyDecoderMiddleware(Middleware):
         # 检测字符编码
         charset = self._detect_charset(content_type)
 
-        # 解码
+        # 解码 (WebRequest 自带按请求缓存的解码结果，与参数绑定共享同一次解析)
         try:
-            from cullinan.codec import get_codec_registry
+            if callable(getattr(request, 'decoded_body', None)):
+                decoded = request.decoded_body()
+            else:
+                from cullinan.codec import get_codec_registry
 
-            registry = get_codec_registry()
-            decoded = registry.decode_body(body or b'', content_type, charset)
+                registry = get_codec_registry()
+                decoded = registry.decode_body(body or b'', content_type, charset)
 
             # 存储到 request 对象
             setattr(request, '_decoded_body', decoded)
@@ -108,6 +118,8 @@ class BodyDecoderMiddleware(Middleware):
         except Exception as e:
             logger.warning(f"Failed to decode request body: {e}")
             if not self.fail_silently:
+                if handler is request:
+                    return None
                 handler.set_status(400)
                 handler.write({"error": f"Request body decode failed: {e}"})
                 handler.finish()
@@ -33,6 +33,7 @@
 
 编排:
 - ParamResolver: 参数解析编排器
+- stream_models: 流式解析 JSON 数组请求体
 
 Author: Cullinan
 """
@@ -43,8 +44,9 @@ from .converter import TypeConverter, ConversionError
 from .auto import Auto, AutoType
 from .dynamic import DynamicBody, SafeAccessor, EMPTY
 from .validator import ParamValidator, ValidationError
-from .model import ModelResolver, ModelError
+from .model import ModelDecoder, ModelResolver, ModelError
 from .resolver import ParamResolver, ResolveError
+from .stream import stream_models
 from .file_info import FileInfo, FileList
 from .dataclass_validators import (
     field_validator,
@@ -101,6 +103,7 @@ __all__ = [
 
     # 模型
     'ModelResolver',
+    'ModelDecoder',
     'ModelError',
 
     # 文件
@@ -132,5 +135,6 @@ __all__ = [
     # 编排
     'ParamResolver',
     'ResolveError',
+    'stream_models',
 ]
 
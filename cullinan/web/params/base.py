@@ -38,6 +38,11 @@ class _UNSET:
 # 全局 UNSET 单例
 UNSET = _UNSET()
 
+# 影响校验器的属性，重新赋值时清除校验器缓存
+_CONSTRAINT_ATTRS = frozenset((
+    'name', 'required', 'ge', 'le', 'gt', 'lt', 'min_length', 'max_length', 'regex',
+))
+
 
 class Param:
     """参数标记基类
@@ -75,7 +80,7 @@ class Param:
     __slots__ = (
         'name', 'type_', 'required', 'default', 'description', 'alias',
         'ge', 'le', 'gt', 'lt', 'min_length', 'max_length', 'regex',
-        '_validators'
+        '_validators', '_compiled_validator'
     )
 
     # 参数来源标识 (子类重写)
@@ -141,6 +146,15 @@ class Param:
 
         # 延迟构建验证器
         self._validators = None
+        # ParamValidator.compile 的缓存: (参数名, 校验函数)
+        self._compiled_validator = None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name in _CONSTRAINT_ATTRS:
+            # 约束变化后，缓存的校验器不再有效
+            object.__setattr__(self, '_validators', None)
+            object.__setattr__(self, '_compiled_validator', None)
 
     @property
     def source(self) -> str:
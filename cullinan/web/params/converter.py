@@ -3,11 +3,28 @@
 
 类型转换器，将请求参数转换为目标类型。
 
+转换函数按目标类型登记在注册表中；``List[int]``、``Optional[T]`` 等
+参数化类型首次使用时编译为转换函数并缓存，之后每次转换只需一次字典查找。
+
 Author: Cullinan
 """
 
+import collections.abc
+import datetime
+import decimal
+import enum
 import json
-from typing import Any, Type
+import sys
+import uuid
+from typing import Annotated, Any, Callable, Dict, Literal, Type, TypeVar, Union, get_args, get_origin
+
+if sys.version_info >= (3, 10):
+    from types import UnionType as _UnionType
+else:  # pragma: no cover - Python 3.9
+    _UnionType = Union
+
+# 转换函数: (value) -> converted
+Converter = Callable[[Any], Any]
 
 
 class ConversionError(Exception):
@@ -39,6 +56,14 @@ class TypeConverter:
 
     将请求中的原始值转换为目标类型。
 
+    支持的目标类型:
+    - str / int / float / bool / bytes / list / dict / set / frozenset / tuple
+    - datetime / date / time（ISO 8601，datetime 也接受时间戳）
+    - UUID / Decimal / Enum（按值或成员名）
+    - List[T] / Set[T] / FrozenSet[T] / Tuple[...] / Dict[K, V]
+    - Optional[T] / Union[...] / Literal[...] / Annotated[T, ...]
+    - 其他类型：调用 ``target_type(value)``
+
     Example:
         converter = TypeConverter()
 
@@ -46,6 +71,10 @@ class TypeConverter:
         result = converter.convert("123", int)  # -> 123
         result = converter.convert("true", bool)  # -> True
         result = converter.convert("1,2,3", list)  # -> ["1", "2", "3"]
+        result = converter.convert("1,2,3", List[int])  # -> [1, 2, 3]
+
+        # 自定义转换
+        TypeConverter.register(Point, lambda value: Point(*map(float, value.split(','))))
     """
 
     # 布尔值真值字符串
@@ -63,6 +92,12 @@ class TypeConverter:
         'off', 'Off', 'OFF'
     })
 
+    # 已注册的转换函数 {目标类型: 转换函数}
+    _converters: Dict[Any, Converter] = {}
+
+    # 已编译的转换函数 {目标类型（含参数化泛型）: 转换函数}
+    _resolved: Dict[Any, Converter] = {}
+
     @classmethod
     def convert(cls, value: Any, target_type: Type) -> Any:
         """将值转换为目标类型
@@ -77,40 +112,213 @@ class TypeConverter:
         Raises:
             ConversionError: 转换失败
         """
-        if value is None:
-            return None
-
-        # 如果已经是目标类型，直接返回
-        if isinstance(value, target_type):
+        if value is None or type(value) is target_type:
             return value
 
         try:
-            if target_type is str:
-                return cls._to_str(value)
-            elif target_type is int:
-                return cls._to_int(value)
-            elif target_type is float:
-                return cls._to_float(value)
-            elif target_type is bool:
-                return cls._to_bool(value)
-            elif target_type is list:
-                return cls._to_list(value)
-            elif target_type is dict:
-                return cls._to_dict(value)
-            elif target_type is bytes:
-                return cls._to_bytes(value)
-            else:
-                # 尝试直接调用目标类型构造函数
-                return target_type(value)
+            converter = cls._resolved[target_type]
+        except (KeyError, TypeError):
+            converter = cls.get_converter(target_type)
+
+        try:
+            return converter(value)
         except ConversionError:
             raise
         except Exception as e:
             raise ConversionError(
-                f"Cannot convert {type(value).__name__} to {target_type.__name__}: {e}",
+                f"Cannot convert {type(value).__name__} to {_type_name(target_type)}: {e}",
                 value=value,
                 target_type=target_type
             )
 
+    @classmethod
+    def get_converter(cls, target_type: Any) -> Converter:
+        """获取目标类型的转换函数（首次调用时编译并缓存）
+
+        返回的函数不处理 None，失败时可能抛出任意异常；
+        ``convert`` 会将其包装为 ConversionError。
+
+        Args:
+            target_type: 目标类型（可为参数化泛型）
+
+        Returns:
+            ``(value) -> converted``
+        """
+        try:
+            return cls._resolved[target_type]
+        except KeyError:
+            pass
+        except TypeError:
+            # 不可哈希的类型参数（如 Literal[[1]]），不缓存
+            return cls._compile(target_type)
+        converter = cls._compile(target_type)
+        cls._resolved[target_type] = converter
+        return converter
+
+    @classmethod
+    def register(cls, target_type: Any, converter: Converter) -> None:
+        """注册自定义转换函数
+
+        注册后 ``List[target_type]``、``Optional[target_type]`` 等泛型
+        也会使用该函数转换元素。已是 ``target_type`` 实例的值不会传入。
+
+        Args:
+            target_type: 目标类型
+            converter: ``(value) -> converted``，失败时抛出异常
+        """
+        cls._converters[target_type] = _exact_converter(target_type, converter)
+        cls._resolved.clear()
+
+    @classmethod
+    def unregister(cls, target_type: Any) -> bool:
+        """注销转换函数
+
+        Args:
+            target_type: 目标类型
+
+        Returns:
+            True 如果成功注销
+        """
+        if cls._converters.pop(target_type, None) is None:
+            return False
+        cls._resolved.clear()
+        return True
+
+    @classmethod
+    def reset(cls) -> None:
+        """恢复内置转换函数并清空编译缓存（用于测试）"""
+        cls._converters = dict(_BUILTIN_CONVERTERS)
+        cls._resolved.clear()
+
+    @classmethod
+    def _compile(cls, target_type: Any) -> Converter:
+        """为目标类型生成转换函数"""
+        converter = cls._converters.get(target_type) if _hashable(target_type) else None
+        if converter is not None:
+            return converter
+
+        origin = get_origin(target_type)
+        args = get_args(target_type)
+
+        if origin is Annotated:
+            return cls.get_converter(args[0])
+        if origin in (Union, _UnionType):
+            return cls._union_converter(args)
+        if origin is Literal:
+            return cls._literal_converter(args)
+        if origin is tuple:
+            return cls._tuple_converter(args)
+        if origin in _SEQUENCE_ORIGINS:
+            return cls._sequence_converter(_SEQUENCE_ORIGINS[origin], args)
+        if origin in _MAPPING_ORIGINS:
+            return cls._mapping_converter(args)
+        if origin is not None:
+            # 其他参数化类型按其原始类型转换
+            return cls.get_converter(origin)
+
+        # Any / TypeVar 原样返回；须先于 isinstance(type) 判断，
+        # 因为 Python 3.11+ 中 typing.Any 本身是一个类
+        if target_type is Any or isinstance(target_type, TypeVar):
+            return _identity
+
+        if isinstance(target_type, type):
+            if issubclass(target_type, enum.Enum):
+                return _enum_converter(target_type)
+            # 尝试直接调用目标类型构造函数
+            return _exact_converter(target_type, target_type)
+
+        # 其他无法转换的注解，原样返回
+        return _identity
+
+    @classmethod
+    def _union_converter(cls, args: tuple) -> Converter:
+        """Optional[T] / Union[A, B]：依次尝试各成员类型"""
+        members = [a for a in args if a is not type(None)]
+        if len(members) == 1:
+            return cls.get_converter(members[0])
+
+        classes = tuple(m for m in members if isinstance(m, type))
+        converters = [cls.get_converter(m) for m in members]
+
+        def convert_union(value):
+            if classes and isinstance(value, classes):
+                return value
+            errors = []
+            for converter in converters:
+                try:
+                    return converter(value)
+                except Exception as e:
+                    errors.append(str(e))
+            raise ConversionError(
+                f"No matching type in {_type_name(Union[tuple(members)])}: {'; '.join(errors)}",
+                value=value
+            )
+        return convert_union
+
+    @classmethod
+    def _literal_converter(cls, args: tuple) -> Converter:
+        """Literal[...]：值须等于某个字面量（先按字面量的类型转换）"""
+        options = [(option, cls.get_converter(type(option))) for option in args]
+
+        def convert_literal(value):
+            for option in args:
+                if value == option and type(value) is type(option):
+                    return option
+            for option, converter in options:
+                try:
+                    if converter(value) == option:
+                        return option
+                except Exception:
+                    continue
+            raise ConversionError(
+                f"{value!r} is not one of {', '.join(repr(option) for option in args)}",
+                value=value
+            )
+        return convert_literal
+
+    @classmethod
+    def _tuple_converter(cls, args: tuple) -> Converter:
+        """Tuple[T, ...] 或定长 Tuple[A, B]"""
+        to_list = cls._to_list
+        if not args or args == ((),):
+            return lambda value: tuple(to_list(value))
+        if len(args) == 2 and args[1] is Ellipsis:
+            item = cls.get_converter(args[0])
+            return lambda value: tuple([item(v) for v in to_list(value)])
+
+        items = [cls.get_converter(a) for a in args]
+
+        def convert_tuple(value):
+            values = to_list(value)
+            if len(values) != len(items):
+                raise ConversionError(
+                    f"Expected {len(items)} items, got {len(values)}",
+                    value=value
+                )
+            return tuple([convert(v) for convert, v in zip(items, values)])
+        return convert_tuple
+
+    @classmethod
+    def _sequence_converter(cls, container: type, args: tuple) -> Converter:
+        """List[T] / Set[T] / FrozenSet[T]：先拆分为列表再逐项转换"""
+        to_list = cls._to_list
+        if not args:
+            return lambda value: container(to_list(value))
+        item = cls.get_converter(args[0])
+        if container is list:
+            return lambda value: [item(v) for v in to_list(value)]
+        return lambda value: container([item(v) for v in to_list(value)])
+
+    @classmethod
+    def _mapping_converter(cls, args: tuple) -> Converter:
+        """Dict[K, V]"""
+        to_dict = cls._to_dict
+        if len(args) != 2:
+            return to_dict
+        key = cls.get_converter(args[0])
+        val = cls.get_converter(args[1])
+        return lambda value: {key(k): val(v) for k, v in to_dict(value).items()}
+
     @classmethod
     def _to_str(cls, value: Any) -> str:
         """转换为字符串"""
@@ -255,3 +463,152 @@ class TypeConverter:
         except (ConversionError, Exception):
             return False
 
+
+
+def _type_name(target_type: Any) -> str:
+    if get_origin(target_type) is None and hasattr(target_type, '__name__'):
+        return target_type.__name__
+    return repr(target_type).replace('typing.', '')
+
+
+def _hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _exact_converter(target_type: Any, converter: Converter) -> Converter:
+    """已是目标类型的值直接返回，否则调用转换函数"""
+    if not isinstance(target_type, type):
+        return converter
+
+    def convert_exact(value):
+        if isinstance(value, target_type):
+            return value
+        return converter(value)
+    return convert_exact
+
+
+def _enum_converter(enum_class: Type[enum.Enum]) -> Converter:
+    """Enum：按值匹配，其次按值的字符串形式或成员名匹配（查询参数均为字符串）"""
+    by_text = {str(member.value): member for member in enum_class}
+    by_text.update(enum_class.__members__)
+
+    def convert_enum(value):
+        if isinstance(value, enum_class):
+            return value
+        try:
+            return enum_class(value)
+        except ValueError:
+            member = by_text.get(value.strip()) if isinstance(value, str) else None
+            if member is None:
+                raise ConversionError(
+                    f"{value!r} is not a valid {enum_class.__name__}; "
+                    f"expected one of {', '.join(repr(str(m.value)) for m in enum_class)}",
+                    value=value,
+                    target_type=enum_class
+                )
+            return member
+    return convert_enum
+
+
+def _iso_text(value: Any) -> str:
+    """ISO 8601 文本（兼容 Python 3.9/3.10 不支持的 ``Z`` 后缀）"""
+    text = value.decode('ascii') if isinstance(value, bytes) else str(value)
+    text = text.strip()
+    if text[-1:] in ('Z', 'z'):
+        text = text[:-1] + '+00:00'
+    return text
+
+
+def _to_datetime(value: Any) -> datetime.datetime:
+    if isinstance(value, datetime.datetime):
+        return value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return datetime.datetime.fromtimestamp(value, tz=datetime.timezone.utc)
+    if isinstance(value, datetime.date):
+        return datetime.datetime(value.year, value.month, value.day)
+    return datetime.datetime.fromisoformat(_iso_text(value))
+
+
+def _to_date(value: Any) -> datetime.date:
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    text = _iso_text(value)
+    if len(text) > 10:
+        return datetime.datetime.fromisoformat(text).date()
+    return datetime.date.fromisoformat(text)
+
+
+def _to_time(value: Any) -> datetime.time:
+    if isinstance(value, datetime.datetime):
+        return value.timetz()
+    if isinstance(value, datetime.time):
+        return value
+    return datetime.time.fromisoformat(_iso_text(value))
+
+
+def _to_uuid(value: Any) -> uuid.UUID:
+    if isinstance(value, uuid.UUID):
+        return value
+    if isinstance(value, bytes) and len(value) == 16:
+        return uuid.UUID(bytes=value)
+    if isinstance(value, int) and not isinstance(value, bool):
+        return uuid.UUID(int=value)
+    return uuid.UUID(_iso_text(value))
+
+
+def _to_decimal(value: Any) -> decimal.Decimal:
+    if isinstance(value, decimal.Decimal):
+        return value
+    if isinstance(value, float):
+        # repr 保留最短精确表示，避免二进制浮点误差 (0.1 -> Decimal('0.1'))
+        return decimal.Decimal(repr(value))
+    if isinstance(value, str):
+        value = value.strip()
+    return decimal.Decimal(value)
+
+
+# 泛型原始类型 → 容器类型
+_SEQUENCE_ORIGINS = {
+    list: list,
+    set: set,
+    frozenset: frozenset,
+    collections.abc.Sequence: list,
+    collections.abc.MutableSequence: list,
+    collections.abc.Iterable: list,
+    collections.abc.Collection: list,
+    collections.abc.Set: frozenset,
+    collections.abc.MutableSet: set,
+}
+
+_MAPPING_ORIGINS = (dict, collections.abc.Mapping, collections.abc.MutableMapping)
+
+# 内置转换函数（均自行处理已是目标类型的值）
+_BUILTIN_CONVERTERS: Dict[Any, Converter] = {
+    str: TypeConverter._to_str,
+    int: TypeConverter._to_int,
+    float: TypeConverter._to_float,
+    bool: TypeConverter._to_bool,
+    list: TypeConverter._to_list,
+    dict: TypeConverter._to_dict,
+    bytes: TypeConverter._to_bytes,
+    set: lambda value: set(TypeConverter._to_list(value)),
+    frozenset: lambda value: frozenset(TypeConverter._to_list(value)),
+    tuple: lambda value: tuple(TypeConverter._to_list(value)),
+    datetime.datetime: _to_datetime,
+    datetime.date: _to_date,
+    datetime.time: _to_time,
+    uuid.UUID: _to_uuid,
+    decimal.Decimal: _to_decimal,
+}
+
+TypeConverter.reset()
@@ -7,9 +7,10 @@ Author: Cullinan
 """
 
 import dataclasses
-from typing import Any, Dict, Type, get_type_hints, Union
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar, get_args, get_origin, get_type_hints, Union
 
-from .converter import TypeConverter, ConversionError
+from .converter import TypeConverter, _UnionType
 
 
 class ModelError(Exception):
@@ -44,6 +45,253 @@ class ModelError(Exception):
         }
 
 
+# 标量转换函数: (value, target_type) -> converted
+ScalarConverter = Callable[[Any, Type], Any]
+
+_SEQUENCE_ORIGINS = (list, tuple, set, frozenset)
+
+
+class _FieldPlan:
+    """单个字段的预编译解析计划"""
+
+    __slots__ = ('name', 'convert', 'required', 'optional')
+
+    def __init__(self, name: str, convert: Callable[[Any], Any], required: bool, optional: bool):
+        self.name = name
+        self.convert = convert
+        self.required = required
+        self.optional = optional
+
+
+class ModelDecoder:
+    """预编译的 dataclass 解码器
+
+    首次遇到模型时生成并缓存：字段类型提示、Optional 拆解、转换函数、
+    嵌套模型解码器均只计算一次，之后每次解码只需逐字段调用转换函数。
+    未提供的字段交给 dataclass 构造函数填充默认值 / default_factory。
+
+    支持嵌套 dataclass、``Optional[Model]`` 以及 ``List[Model]`` 等
+    dataclass 序列（包括自引用模型）。
+
+    通过 ``ModelResolver.get_decoder`` 或 ``get_model_decoder`` 获取实例。
+    """
+
+    __slots__ = ('_model_ref', 'fields')
+
+    def __init__(self, model_class: Type):
+        # 弱引用模型类：解码器作为缓存值时不会让键（模型类）永远存活
+        self._model_ref = weakref.ref(model_class)
+        self.fields: Tuple[_FieldPlan, ...] = ()
+
+    @property
+    def model_class(self) -> Type:
+        return self._model_ref()
+
+    def __call__(self, data: Optional[Dict[str, Any]]) -> Any:
+        """解码字典为模型实例
+
+        Raises:
+            ModelError: 字段缺失 / 转换失败 / 构造失败
+        """
+        if data is None:
+            data = {}
+        kwargs = {}
+        field_errors = None
+        for plan in self.fields:
+            name = plan.name
+            if name in data:
+                raw_value = data[name]
+                try:
+                    kwargs[name] = plan.convert(raw_value)
+                except Exception as e:
+                    if field_errors is None:
+                        field_errors = []
+                    field_errors.append({'field': name, 'error': str(e), 'value': raw_value})
+            elif plan.optional:
+                kwargs[name] = None
+            elif plan.required:
+                if field_errors is None:
+                    field_errors = []
+                field_errors.append({
+                    'field': name,
+                    'error': f"Field '{name}' is required",
+                    'value': None
+                })
+
+        if field_errors:
+            raise ModelError(
+                f"Failed to resolve model {self.model_class.__name__}",
+                model_class=self.model_class,
+                field_errors=field_errors
+            )
+
+        model_class = self.model_class
+        try:
+            return model_class(**kwargs)
+        except Exception as e:
+            raise ModelError(
+                f"Failed to create {model_class.__name__}: {e}",
+                model_class=model_class
+            )
+
+    def __repr__(self) -> str:
+        return f"<ModelDecoder {self.model_class.__name__} fields={len(self.fields)}>"
+
+
+# 模型类 -> {标量转换函数: 解码器}；模型类被回收后缓存项随之释放
+_decoder_cache: 'weakref.WeakKeyDictionary[Type, Dict[ScalarConverter, ModelDecoder]]' = weakref.WeakKeyDictionary()
+
+
+def _cached_decoder(model_class: Type, convert: ScalarConverter) -> Optional[ModelDecoder]:
+    decoders = _decoder_cache.get(model_class)
+    return decoders.get(convert) if decoders is not None else None
+
+
+def get_model_decoder(model_class: Type, convert: Optional[ScalarConverter] = None) -> ModelDecoder:
+    """获取（必要时编译）模型的解码器
+
+    Args:
+        model_class: dataclass 类
+        convert: 标量类型转换函数，默认 ``TypeConverter.convert``
+
+    Returns:
+        缓存的 ModelDecoder
+    """
+    if convert is None:
+        convert = TypeConverter.convert
+    decoder = _cached_decoder(model_class, convert)
+    if decoder is None:
+        compiling: Dict[Type, ModelDecoder] = {}
+        decoder = _compile_model(model_class, convert, compiling)
+        # 整棵模型树编译完成后再发布，其他线程不会看到未完成的解码器
+        for cls, compiled in compiling.items():
+            _decoder_cache.setdefault(cls, {}).setdefault(convert, compiled)
+    return decoder
+
+
+def clear_model_decoders() -> None:
+    """清空解码器缓存
+
+    模型处理器注册表变更时自动调用，释放绑定在旧处理器转换函数上的解码器；
+    模型类被重新定义或测试时也可手动调用。
+    """
+    _decoder_cache.clear()
+
+
+def _is_model(tp: Any) -> bool:
+    return dataclasses.is_dataclass(tp) and isinstance(tp, type)
+
+
+def _split_optional(tp: Any) -> Tuple[Any, bool]:
+    """返回 (去掉 None 后的类型, 是否 Optional)"""
+    if get_origin(tp) in (Union, _UnionType):
+        args = get_args(tp)
+        if type(None) in args:
+            non_none = [a for a in args if a is not type(None)]
+            return (non_none[0] if len(non_none) == 1 else tp), True
+    return tp, False
+
+
+def _compile_model(model_class: Type, convert: ScalarConverter, compiling: Dict[Type, ModelDecoder]) -> ModelDecoder:
+    decoder = ModelDecoder(model_class)
+    compiling[model_class] = decoder
+    try:
+        type_hints = get_type_hints(model_class)
+    except Exception:
+        type_hints = {}
+
+    plans = []
+    for field in dataclasses.fields(model_class):
+        if not field.init:
+            continue
+        field_type, optional = _split_optional(type_hints.get(field.name, field.type))
+        has_default = (
+            field.default is not dataclasses.MISSING
+            or field.default_factory is not dataclasses.MISSING
+        )
+        plans.append(_FieldPlan(
+            name=field.name,
+            convert=_compile_converter(field_type, optional, convert, compiling),
+            required=not has_default,
+            # 无默认值的 Optional 字段缺省为 None
+            optional=optional and not has_default,
+        ))
+    decoder.fields = tuple(plans)
+    return decoder
+
+
+def _nested_decoder(model_class: Type, convert: ScalarConverter, compiling: Dict[Type, ModelDecoder]) -> ModelDecoder:
+    decoder = compiling.get(model_class) or _cached_decoder(model_class, convert)
+    if decoder is None:
+        decoder = _compile_model(model_class, convert, compiling)
+    return decoder
+
+
+def _compile_converter(
+    field_type: Any,
+    optional: bool,
+    convert: ScalarConverter,
+    compiling: Dict[Type, ModelDecoder],
+) -> Callable[[Any], Any]:
+    # Python 3.11+ 中 typing.Any 是类，须在 isinstance(type) 判断之前处理
+    if field_type is Any or isinstance(field_type, TypeVar):
+        return _identity
+
+    if _is_model(field_type):
+        return _model_converter(_nested_decoder(field_type, convert, compiling), optional)
+
+    origin = get_origin(field_type)
+    args = get_args(field_type)
+    if origin in _SEQUENCE_ORIGINS and args:
+        item_type, item_optional = _split_optional(args[0])
+        if _is_model(item_type):
+            item_convert = _model_converter(_nested_decoder(item_type, convert, compiling), item_optional)
+            return _sequence_converter(origin, item_convert)
+
+    # TypeConverter 支持 List[int]、Dict[str, int] 等泛型；自定义转换函数只接收类
+    if isinstance(field_type, type) or (convert == TypeConverter.convert and origin is not None):
+        def convert_scalar(value, _convert=convert, _type=field_type):
+            return _convert(value, _type)
+        return convert_scalar
+
+    # 其他无法转换的注解原样透传
+    return _identity
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _model_converter(decoder: ModelDecoder, optional: bool) -> Callable[[Any], Any]:
+    # 经由解码器取模型类，闭包不直接引用（可能是自引用的）模型类
+    def convert_model(value):
+        if isinstance(value, dict):
+            return decoder(value)
+        model_class = decoder.model_class
+        if isinstance(value, model_class):
+            return value
+        if value is None and optional:
+            return None
+        raise ModelError(f"Cannot convert {type(value).__name__} to {model_class.__name__}")
+    return convert_model
+
+
+def _sequence_converter(origin: type, item_convert: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    def convert_sequence(value):
+        if value is None:
+            return None
+        if not isinstance(value, (list, tuple)):
+            raise ModelError(f"Expected a list, got {type(value).__name__}")
+        items: List[Any] = []
+        for index, item in enumerate(value):
+            try:
+                items.append(item_convert(item))
+            except ModelError as e:
+                raise ModelError(f"[{index}] {e}", model_class=e.model_class, field_errors=e.field_errors)
+        return items if origin is list else origin(items)
+    return convert_sequence
+
+
 class ModelResolver:
     """模型解析器
 
@@ -51,7 +299,7 @@ class ModelResolver:
 
     Features:
     - 自动类型转换
-    - 支持嵌套 dataclass
+    - 支持嵌套 dataclass 及 List[dataclass]
     - 支持默认值
     - 支持可选字段 (Optional)
 
@@ -82,143 +330,40 @@ class ModelResolver:
         return dataclasses.is_dataclass(obj) and isinstance(obj, type)
 
     @classmethod
-    def resolve(cls, model_class: Type, data: Dict[str, Any]) -> Any:
-        """将字典数据解析为模型实例
+    def get_decoder(cls, model_class: Type) -> ModelDecoder:
+        """获取模型的预编译解码器（首次调用时编译并缓存）
 
         Args:
             model_class: dataclass 类
-            data: 请求数据字典
 
         Returns:
-            dataclass 实例
+            ModelDecoder
 
         Raises:
-            ModelError: 解析失败
+            ModelError: 不是 dataclass
         """
         if not cls.is_dataclass(model_class):
             raise ModelError(
                 f"{model_class} is not a dataclass",
                 model_class=model_class
             )
-
-        if data is None:
-            data = {}
-
-        # 获取字段信息
-        fields = dataclasses.fields(model_class)
-        type_hints = get_type_hints(model_class)
-
-        # 构建参数
-        kwargs = {}
-        field_errors = []
-
-        for field in fields:
-            field_name = field.name
-            field_type = type_hints.get(field_name, field.type)
-
-            # 检查是否有值
-            if field_name in data:
-                raw_value = data[field_name]
-
-                try:
-                    # 解析嵌套 dataclass
-                    if cls.is_dataclass(field_type):
-                        if isinstance(raw_value, dict):
-                            kwargs[field_name] = cls.resolve(field_type, raw_value)
-                        elif isinstance(raw_value, field_type):
-                            kwargs[field_name] = raw_value
-                        else:
-                            raise ModelError(
-                                f"Cannot convert {type(raw_value).__name__} to {field_type.__name__}"
-                            )
-                    else:
-                        # 处理 Optional 类型
-                        actual_type = cls._unwrap_optional(field_type)
-                        if raw_value is None:
-                            kwargs[field_name] = None
-                        elif actual_type is not None:
-                            kwargs[field_name] = TypeConverter.convert(raw_value, actual_type)
-                        else:
-                            kwargs[field_name] = raw_value
-
-                except (ConversionError, ModelError) as e:
-                    field_errors.append({
-                        'field': field_name,
-                        'error': str(e),
-                        'value': raw_value
-                    })
-            else:
-                # 没有提供值
-                if field.default is not dataclasses.MISSING:
-                    # 有默认值，使用默认值
-                    kwargs[field_name] = field.default
-                elif field.default_factory is not dataclasses.MISSING:
-                    # 有默认工厂，调用工厂
-                    kwargs[field_name] = field.default_factory()
-                elif cls._is_optional(field_type):
-                    # Optional 类型，设为 None
-                    kwargs[field_name] = None
-                else:
-                    # 必填字段缺失
-                    field_errors.append({
-                        'field': field_name,
-                        'error': f"Field '{field_name}' is required",
-                        'value': None
-                    })
-
-        if field_errors:
-            raise ModelError(
-                f"Failed to resolve model {model_class.__name__}",
-                model_class=model_class,
-                field_errors=field_errors
-            )
-
-        try:
-            return model_class(**kwargs)
-        except Exception as e:
-            raise ModelError(
-                f"Failed to create {model_class.__name__}: {e}",
-                model_class=model_class
-            )
+        return get_model_decoder(model_class)
 
     @classmethod
-    def _is_optional(cls, type_hint) -> bool:
-        """检查类型是否是 Optional
+    def resolve(cls, model_class: Type, data: Dict[str, Any]) -> Any:
+        """将字典数据解析为模型实例
 
         Args:
-            type_hint: 类型提示
+            model_class: dataclass 类
+            data: 请求数据字典
 
         Returns:
-            是否是 Optional
-        """
-        # Optional[X] 等价于 Union[X, None]
-        origin = getattr(type_hint, '__origin__', None)
-        if origin is Union:
-            args = getattr(type_hint, '__args__', ())
-            return type(None) in args
-        return False
-
-    @classmethod
-    def _unwrap_optional(cls, type_hint) -> Type:
-        """从 Optional[X] 中提取 X
-
-        Args:
-            type_hint: 类型提示
+            dataclass 实例
 
-        Returns:
-            内部类型，如果不是 Optional 返回原类型
+        Raises:
+            ModelError: 解析失败
         """
-        origin = getattr(type_hint, '__origin__', None)
-        if origin is Union:
-            args = getattr(type_hint, '__args__', ())
-            # 过滤掉 NoneType
-            non_none = [a for a in args if a is not type(None)]
-            if len(non_none) == 1:
-                return non_none[0]
-        # 不是 Optional，返回原类型（如果是基本类型）
-        if isinstance(type_hint, type):
-            return type_hint
-        return None
+        return cls.get_decoder(model_class)(data)
 
     @classmethod
     def to_dict(cls, instance: Any) -> Dict[str, Any]:
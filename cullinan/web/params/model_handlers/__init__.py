@@ -52,6 +52,7 @@ class ModelHandlerRegistry:
             self._handlers.append(handler)
             # 按优先级降序排序
             self._handlers.sort(key=lambda h: h.priority, reverse=True)
+            _invalidate_handler_caches()
 
     def unregister(self, handler: ModelHandler) -> bool:
         """注销处理器
@@ -64,6 +65,7 @@ class ModelHandlerRegistry:
         """
         if handler in self._handlers:
             self._handlers.remove(handler)
+            _invalidate_handler_caches()
             return True
         return False
 
@@ -79,6 +81,7 @@ class ModelHandlerRegistry:
         for handler in self._handlers[:]:
             if handler.name == name:
                 self._handlers.remove(handler)
+                _invalidate_handler_caches()
                 return True
         return False
 
@@ -168,6 +171,16 @@ class ModelHandlerRegistry:
         """重置注册表（用于测试）"""
         self._handlers.clear()
         self._initialized = False
+        _invalidate_handler_caches()
+
+
+def _invalidate_handler_caches() -> None:
+    """处理器变更后，ParamResolver 缓存的参数分析（含 model_handler）与
+    绑定在旧处理器转换函数上的模型解码器随之失效"""
+    from ..model import clear_model_decoders
+    from ..resolver import ParamResolver
+    ParamResolver.clear_cache()
+    clear_model_decoders()
 
 
 # 全局注册表实例
@@ -192,6 +205,7 @@ def reset_model_handler_registry() -> None:
     if _registry is not None:
         _registry.reset()
     _registry = None
+    _invalidate_handler_caches()
 
 
 # 导出
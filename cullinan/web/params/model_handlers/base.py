@@ -7,7 +7,7 @@ Author: Cullinan
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Type
+from typing import Any, Dict, Iterable, List, Type
 
 
 class ModelHandler(ABC):
@@ -53,6 +53,36 @@ class ModelHandler(ABC):
         """
         pass
 
+    def resolve_many(self, model_class: Type, items: Iterable[Any]) -> List[Any]:
+        """批量解析数组元素为模型实例列表
+
+        逐个元素调用 ``resolve``，收集全部元素的错误后统一抛出；错误详情中
+        的 ``index`` 为出错元素的下标。子类可覆盖以复用预编译结果。
+
+        Args:
+            model_class: 模型类
+            items: 元素序列（如 JSON 数组解码后的 list）
+
+        Returns:
+            模型实例列表
+
+        Raises:
+            ModelHandlerError: 任一元素解析失败
+        """
+        results = []
+        errors = []
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                errors.append(item_type_error(index, item))
+                continue
+            try:
+                results.append(self.resolve(model_class, item))
+            except ModelHandlerError as e:
+                errors.extend(indexed_errors(index, e.message, e.errors))
+        if errors:
+            raise batch_error(model_class, errors, self.name)
+        return results
+
     @abstractmethod
     def to_dict(self, instance: Any) -> Dict[str, Any]:
         """将模型实例转换为字典
@@ -119,3 +149,28 @@ class ModelHandlerError(Exception):
             'handler': self.handler_name,
         }
 
+
+def indexed_errors(index: int, message: str, errors: list) -> list:
+    """为单个数组元素的错误详情加上 ``index``（无字段详情时保留整体消息）"""
+    if not errors:
+        return [{'index': index, 'error': message}]
+    return [
+        {'index': index, **error} if isinstance(error, dict) else {'index': index, 'error': str(error)}
+        for error in errors
+    ]
+
+
+def batch_error(model_class: Type, errors: list, handler_name: str = None) -> ModelHandlerError:
+    """构造批量解析失败的错误（``errors`` 已带 ``index``）"""
+    failed = len({error['index'] for error in errors})
+    return ModelHandlerError(
+        f"Failed to resolve {failed} {model_class.__name__} item(s)",
+        model_class=model_class,
+        errors=errors,
+        handler_name=handler_name,
+    )
+
+
+def item_type_error(index: int, item: Any) -> dict:
+    """数组元素不是对象时的错误详情"""
+    return {'index': index, 'error': f"Expected an object, got {type(item).__name__}", 'value': item}
@@ -7,9 +7,10 @@ Author: Cullinan
 """
 
 import dataclasses
-from typing import Any, Dict, Type, get_type_hints, Union
+from typing import Any, Dict, Iterable, List, Type
 
-from .base import ModelHandler, ModelHandlerError
+from ..model import ModelError, get_model_decoder
+from .base import ModelHandler, ModelHandlerError, batch_error, indexed_errors, item_type_error
 
 
 class DataclassHandler(ModelHandler):
@@ -19,9 +20,11 @@ class DataclassHandler(ModelHandler):
 
     Features:
     - 自动类型转换
-    - 支持嵌套 dataclass
+    - 支持嵌套 dataclass 及 List[dataclass]
+    - 批量解析 JSON 数组（``resolve_many``）
     - 支持默认值
     - 支持 Optional 类型
+    - 每个模型的解码器只编译一次（见 ``ModelDecoder``）
     """
 
     priority = 10  # 低于第三方库，作为兜底
@@ -42,94 +45,46 @@ class DataclassHandler(ModelHandler):
                 handler_name=self.name,
             )
 
-        if data is None:
-            data = {}
-
-        # 获取字段信息
-        fields = dataclasses.fields(model_class)
-        type_hints = {}
         try:
-            type_hints = get_type_hints(model_class)
-        except Exception:
-            pass
-
-        # 构建参数
-        kwargs = {}
-        field_errors = []
-
-        for field in fields:
-            field_name = field.name
-            field_type = type_hints.get(field_name, field.type)
-
-            # 检查是否有值
-            if field_name in data:
-                raw_value = data[field_name]
-
-                try:
-                    # 解析嵌套 dataclass
-                    if self.can_handle(field_type):
-                        if isinstance(raw_value, dict):
-                            kwargs[field_name] = self.resolve(field_type, raw_value)
-                        elif isinstance(raw_value, field_type):
-                            kwargs[field_name] = raw_value
-                        else:
-                            raise ModelHandlerError(
-                                f"Cannot convert {type(raw_value).__name__} to {field_type.__name__}"
-                            )
-                    else:
-                        # 处理 Optional 类型
-                        actual_type = self._unwrap_optional(field_type)
-                        if raw_value is None:
-                            kwargs[field_name] = None
-                        elif actual_type is not None:
-                            kwargs[field_name] = self._convert_value(raw_value, actual_type)
-                        else:
-                            kwargs[field_name] = raw_value
-
-                except ModelHandlerError as e:
-                    field_errors.append({
-                        'field': field_name,
-                        'error': str(e),
-                        'value': raw_value
-                    })
-                except Exception as e:
-                    field_errors.append({
-                        'field': field_name,
-                        'error': str(e),
-                        'value': raw_value
-                    })
-            else:
-                # 没有提供值
-                if field.default is not dataclasses.MISSING:
-                    kwargs[field_name] = field.default
-                elif field.default_factory is not dataclasses.MISSING:
-                    kwargs[field_name] = field.default_factory()
-                elif self._is_optional(field_type):
-                    kwargs[field_name] = None
-                else:
-                    field_errors.append({
-                        'field': field_name,
-                        'error': f"Field '{field_name}' is required",
-                        'value': None
-                    })
-
-        if field_errors:
+            return get_model_decoder(model_class, self._convert_value)(data)
+        except ModelError as e:
+            if e.field_errors:
+                raise ModelHandlerError(
+                    f"Failed to resolve dataclass {model_class.__name__}",
+                    model_class=model_class,
+                    errors=e.field_errors,
+                    handler_name=self.name,
+                )
             raise ModelHandlerError(
-                f"Failed to resolve dataclass {model_class.__name__}",
+                e.message,
                 model_class=model_class,
-                errors=field_errors,
                 handler_name=self.name,
             )
 
-        try:
-            return model_class(**kwargs)
-        except Exception as e:
+    def resolve_many(self, model_class: Type, items: Iterable[Any]) -> List[Any]:
+        """批量解析为 dataclass 实例列表（整个数组共用一个解码器）"""
+        if not self.can_handle(model_class):
             raise ModelHandlerError(
-                f"Failed to create {model_class.__name__}: {e}",
+                f"{model_class} is not a dataclass",
                 model_class=model_class,
                 handler_name=self.name,
             )
 
+        decoder = get_model_decoder(model_class, self._convert_value)
+        results = []
+        errors = []
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                errors.append(item_type_error(index, item))
+                continue
+            try:
+                results.append(decoder(item))
+            except ModelError as e:
+                errors.extend(indexed_errors(index, e.message, e.field_errors))
+        if errors:
+            raise batch_error(model_class, errors, self.name)
+        return results
+
     def to_dict(self, instance: Any) -> Dict[str, Any]:
         """将 dataclass 实例转换为字典"""
         if not dataclasses.is_dataclass(instance):
@@ -147,26 +102,6 @@ class DataclassHandler(ModelHandler):
                 result[field.name] = value
         return result
 
-    def _is_optional(self, type_hint) -> bool:
-        """检查类型是否是 Optional"""
-        origin = getattr(type_hint, '__origin__', None)
-        if origin is Union:
-            args = getattr(type_hint, '__args__', ())
-            return type(None) in args
-        return False
-
-    def _unwrap_optional(self, type_hint) -> Type:
-        """从 Optional[X] 中提取 X"""
-        origin = getattr(type_hint, '__origin__', None)
-        if origin is Union:
-            args = getattr(type_hint, '__args__', ())
-            non_none = [a for a in args if a is not type(None)]
-            if len(non_none) == 1:
-                return non_none[0]
-        if isinstance(type_hint, type):
-            return type_hint
-        return None
-
     def _convert_value(self, value: Any, target_type: Type) -> Any:
         """基本类型转换"""
         if value is None:
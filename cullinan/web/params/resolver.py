@@ -7,7 +7,8 @@ Author: Cullinan
 """
 
 import inspect
-from typing import Any, Callable, Dict, Optional, Union, get_args, get_origin, get_type_hints
+import weakref
+from typing import Any, Callable, Dict, Optional, Tuple, Type, Union, get_args, get_origin, get_type_hints
 
 from .base import Param, UNSET
 from .types import File, RawBody
@@ -17,7 +18,7 @@ from .dynamic import DynamicBody
 from .validator import ParamValidator, ValidationError
 from .model import ModelError
 from .file_info import FileInfo, FileList
-from .model_handlers import get_model_handler_registry
+from .model_handlers import ModelHandler, ModelHandlerError, get_model_handler_registry
 
 
 class ResolveError(Exception):
@@ -41,6 +42,29 @@ class ResolveError(Exception):
         }
 
 
+def _model_list_target(annotation: Any) -> Optional[Tuple[Type, ModelHandler]]:
+    """``List[Model]`` 返回 (Model, 模型处理器)，其他类型返回 None"""
+    if get_origin(annotation) is not list:
+        return None
+    args = get_args(annotation)
+    if len(args) != 1:
+        return None
+    handler = get_model_handler_registry().get_handler(args[0])
+    if handler is None:
+        return None
+    return args[0], handler
+
+
+def _body_array(body_data: Any) -> Any:
+    """取出整个请求体作为数组（解码层把非对象请求体包装为 ``{'_value': ...}``）"""
+    if isinstance(body_data, dict):
+        if not body_data:
+            return None
+        if len(body_data) == 1 and '_value' in body_data:
+            return body_data['_value']
+    return body_data
+
+
 class ParamResolver:
     """参数解析编排器
 
@@ -52,6 +76,7 @@ class ParamResolver:
     - 自动类型转换
     - 参数校验
     - dataclass / DynamicBody 支持
+    - List[Model] 批量绑定 JSON 数组
 
     Example:
         @post_api(url="/users")
@@ -65,8 +90,13 @@ class ParamResolver:
         # ParamResolver 会自动解析 name 和 age 参数
     """
 
-    # 签名缓存
-    _signature_cache: Dict[Callable, inspect.Signature] = {}
+    # 签名缓存（弱引用，函数被回收后自动移除）
+    _signature_cache: 'weakref.WeakKeyDictionary[Callable, inspect.Signature]' = weakref.WeakKeyDictionary()
+
+    # 参数分析缓存 {func: params_config}（弱引用）
+    _analysis_cache: 'weakref.WeakKeyDictionary[Callable, Dict[str, dict]]' = weakref.WeakKeyDictionary()
+    _analysis_hits: int = 0
+    _analysis_misses: int = 0
 
     @classmethod
     def _get_header_value(cls, headers: Dict[str, str], key: str) -> Optional[str]:
@@ -88,6 +118,11 @@ class ParamResolver:
         if key in headers:
             return headers[key]
 
+        # Multi-value header containers (WebHeaders, HTTPHeaders) are already
+        # case-insensitive: a miss above is final
+        if hasattr(headers, 'get_all'):
+            return None
+
         # Try case-insensitive match
         key_lower = key.lower()
         for header_key, header_value in headers.items():
@@ -106,13 +141,21 @@ class ParamResolver:
         Returns:
             函数签名
         """
-        if func not in cls._signature_cache:
-            cls._signature_cache[func] = inspect.signature(func)
-        return cls._signature_cache[func]
+        try:
+            return cls._signature_cache[func]
+        except KeyError:
+            sig = cls._signature_cache[func] = inspect.signature(func)
+            return sig
+        except TypeError:
+            # 不支持弱引用的可调用对象
+            return inspect.signature(func)
 
     @classmethod
     def analyze_params(cls, func: Callable) -> Dict[str, dict]:
-        """分析函数参数配置
+        """分析函数参数配置 (带缓存)
+
+        结果按函数对象缓存（弱引用），``clear_cache`` 或模型处理器注册表
+        变更时失效。返回的配置为共享的缓存对象，调用方不应修改。
 
         Args:
             func: 控制器方法
@@ -120,6 +163,25 @@ class ParamResolver:
         Returns:
             参数配置字典 {param_name: {source, type, param_spec, ...}}
         """
+        try:
+            params_config = cls._analysis_cache.get(func)
+        except TypeError:
+            # 不支持弱引用的可调用对象，不缓存
+            return cls._analyze_params(func)
+        if params_config is not None:
+            cls._analysis_hits += 1
+            return params_config
+
+        cls._analysis_misses += 1
+        params_config = cls._analyze_params(func)
+        # 绑定方法每次访问都是新对象，缓存其底层函数无意义且会立即失效
+        if not inspect.ismethod(func):
+            cls._analysis_cache[func] = params_config
+        return params_config
+
+    @classmethod
+    def _analyze_params(cls, func: Callable) -> Dict[str, dict]:
+        """分析函数参数配置 (无缓存)"""
         sig = cls.get_signature(func)
         type_hints = {}
         try:
@@ -158,6 +220,7 @@ class ParamResolver:
 
             if annotation is inspect.Parameter.empty:
                 annotation = None
+            model_list = _model_list_target(annotation)
 
             # 优先检查默认值是否是 Param 实例（支持简化语法）
             # 例如: sign: str = Header(alias="X-Hub-Signature-256")
@@ -175,6 +238,8 @@ class ParamResolver:
                 # 使用参数名作为 name（如果未指定）
                 if param_spec.name is None:
                     param_spec.name = name
+                cls._bind_model_list(config, _model_list_target(config['type']))
+                config['validator'] = ParamValidator.compile(param_spec, name)
 
             # 检查默认值是否是 DynamicBody 实例
             # 例如: body: DynamicBody = DynamicBody()
@@ -195,6 +260,8 @@ class ParamResolver:
                 # 使用参数名作为 name（如果未指定）
                 if param_spec.name is None:
                     param_spec.name = name
+                cls._bind_model_list(config, _model_list_target(config['type']))
+                config['validator'] = ParamValidator.compile(param_spec, name)
 
             # 检查是否是 DynamicBody (或其子类)
             elif (annotation is DynamicBody
@@ -222,6 +289,12 @@ class ParamResolver:
                 config['required'] = handler.is_required_by_default()
                 config['model_handler'] = handler
 
+            # 检查是否是模型列表 List[Model]（整个请求体为 JSON 数组）
+            elif model_list is not None:
+                config['source'] = 'body'
+                config['type'] = annotation
+                cls._bind_model_list(config, model_list)
+
             # 检查是否是 AutoType
             elif (annotation is AutoType
                   or (isinstance(annotation, type)
@@ -248,6 +321,12 @@ class ParamResolver:
 
         return params_config
 
+    @staticmethod
+    def _bind_model_list(config: dict, target: Optional[Tuple[Type, ModelHandler]]) -> None:
+        """为 ``List[Model]`` 参数记录元素模型与处理器"""
+        if target is not None:
+            config['model_list'], config['model_list_handler'] = target
+
     @classmethod
     def resolve(
         cls,
@@ -301,6 +380,8 @@ class ParamResolver:
                     'error': str(e),
                     'type': type(e).__name__,
                 })
+            except ResolveError as e:
+                errors.extend(e.errors)
 
         if errors:
             raise ResolveError(
@@ -324,6 +405,9 @@ class ParamResolver:
     ) -> Any:
         """解析单个参数
 
+        委托给 ``compile_param`` 编译出的取值函数（首次使用时编译并缓存在
+        参数配置中），来源分支逻辑只有这一份实现。
+
         Args:
             name: 参数名
             config: 参数配置
@@ -333,61 +417,28 @@ class ParamResolver:
         Returns:
             解析后的值
         """
-        source = config['source']
+        extract = config.get('extractor')
+        if extract is None:
+            extract = config['extractor'] = cls.compile_param(name, config)
+        return extract(url_params, query_params, body_data, headers, files, request)
+
+    @classmethod
+    def _coerce_value(cls, name: str, config: dict, raw_value: Any) -> Any:
+        """处理缺省值、类型转换与参数校验
+
+        Args:
+            name: 参数名
+            config: 参数配置
+            raw_value: 从数据源取得的原始值
+
+        Returns:
+            转换并校验后的值
+        """
         target_type = config['type']
         required = config['required']
         default = config['default']
         param_spec = config.get('param_spec')
 
-        # 获取别名
-        alias = name
-        if param_spec and param_spec.alias:
-            alias = param_spec.alias
-
-        # 根据来源获取原始值
-        raw_value = None
-
-        if source == 'path':
-            raw_value = url_params.get(alias) or url_params.get(name)
-        elif source == 'query':
-            raw_value = query_params.get(alias) or query_params.get(name)
-        elif source == 'body':
-            # 特殊处理 DynamicBody 和模型类型
-            if target_type is DynamicBody:
-                return DynamicBody(body_data)
-            elif config.get('model_handler'):
-                # 使用注册的模型处理器
-                return config['model_handler'].resolve(target_type, body_data)
-            else:
-                raw_value = body_data.get(alias) or body_data.get(name)
-        elif source == 'header':
-            # HTTP headers are case-insensitive, use lowercase matching
-            raw_value = cls._get_header_value(headers, alias) or cls._get_header_value(headers, name)
-        elif source == 'raw_body':
-            # 返回原始二进制请求体
-            if request is not None and hasattr(request, 'body'):
-                return request.body if request.body else b''
-            return b''
-        elif source == 'file':
-            raw_value = files.get(alias) or files.get(name)
-            # 处理文件参数
-            if raw_value is not None:
-                return cls._resolve_file_param(raw_value, param_spec, name)
-        elif source == 'auto':
-            # Auto 类型：依次查找各来源
-            raw_value = (
-                url_params.get(name) or
-                query_params.get(name) or
-                body_data.get(name)
-            )
-        else:
-            # 未知来源：尝试从多处获取
-            raw_value = (
-                url_params.get(name) or
-                query_params.get(name) or
-                body_data.get(name)
-            )
-
         # 处理 None 值
         if raw_value is None:
             if default is not UNSET:
@@ -408,6 +459,8 @@ class ParamResolver:
                 converted = DynamicBody(raw_value)
             else:
                 converted = raw_value
+        elif config.get('model_list') is not None:
+            converted = cls._resolve_model_list(name, config, raw_value)
         elif config.get('model_handler'):
             # 使用注册的模型处理器
             if isinstance(raw_value, dict):
@@ -417,16 +470,129 @@ class ParamResolver:
         else:
             converted = TypeConverter.convert(raw_value, target_type)
 
-        # 参数校验
-        if param_spec:
+        # 参数校验（约束已在分析阶段编译为单个校验函数）
+        validator = config.get('validator')
+        if validator is not None:
+            validator(converted)
+        elif param_spec:
             ParamValidator.validate_param(param_spec, converted, name)
 
         return converted
 
+    @classmethod
+    def _resolve_model_list(cls, name: str, config: dict, raw_value: Any) -> list:
+        """将 JSON 数组一次性解析为模型实例列表
+
+        Args:
+            name: 参数名
+            config: 参数配置（含 ``model_list`` / ``model_list_handler``）
+            raw_value: 解码后的数组
+
+        Returns:
+            模型实例列表
+
+        Raises:
+            ValidationError: 值不是数组
+            ResolveError: 元素解析失败，``errors`` 汇总所有元素的错误（带 index）
+        """
+        model_class = config['model_list']
+        if not isinstance(raw_value, list):
+            raise ValidationError(
+                f"Parameter '{name}' must be an array of {model_class.__name__}",
+                param_name=name,
+                value=raw_value,
+                constraint='type'
+            )
+        try:
+            return config['model_list_handler'].resolve_many(model_class, raw_value)
+        except ModelHandlerError as e:
+            raise ResolveError(
+                f"Parameter '{name}': {e.message}",
+                errors=[{'param': name, **error} for error in e.errors]
+            )
+
+    @classmethod
+    def compile_param(cls, name: str, config: dict) -> Callable[..., Any]:
+        """将单个参数配置预编译为取值函数
+
+        来源分支、别名与模型处理器在编译期确定，调用时不再做任何分支
+        判断。``_resolve_param`` 也通过它取值。
+
+        Args:
+            name: 参数名
+            config: ``analyze_params`` 产出的参数配置
+
+        Returns:
+            ``(url_params, query_params, body_data, headers, files, request) -> value``
+        """
+        source = config['source']
+        target_type = config['type']
+        param_spec = config.get('param_spec')
+        model_handler = config.get('model_handler')
+        model_list = config.get('model_list')
+        alias = param_spec.alias if param_spec and param_spec.alias else name
+        coerce = cls._coerce_value
+        get_header = cls._get_header_value
+
+        if source == 'path':
+            def extract(url_params, query_params, body_data, headers, files, request):
+                return coerce(name, config, url_params.get(alias) or url_params.get(name))
+        elif source == 'query':
+            def extract(url_params, query_params, body_data, headers, files, request):
+                return coerce(name, config, query_params.get(alias) or query_params.get(name))
+        elif source == 'body' and target_type is DynamicBody:
+            def extract(url_params, query_params, body_data, headers, files, request):
+                return DynamicBody(body_data)
+        elif source == 'body' and model_list is not None and param_spec is None:
+            def extract(url_params, query_params, body_data, headers, files, request):
+                return coerce(name, config, _body_array(body_data))
+        elif source == 'body' and model_handler:
+            def extract(url_params, query_params, body_data, headers, files, request):
+                return model_handler.resolve(target_type, body_data)
+        elif source == 'body':
+            def extract(url_params, query_params, body_data, headers, files, request):
+                return coerce(name, config, body_data.get(alias) or body_data.get(name))
+        elif source == 'header':
+            def extract(url_params, query_params, body_data, headers, files, request):
+                return coerce(name, config, get_header(headers, alias) or get_header(headers, name))
+        elif source == 'raw_body':
+            def extract(url_params, query_params, body_data, headers, files, request):
+                if request is not None and hasattr(request, 'body'):
+                    return request.body if request.body else b''
+                return b''
+        elif source == 'file':
+            def extract(url_params, query_params, body_data, headers, files, request):
+                raw_value = files.get(alias) or files.get(name)
+                if raw_value is not None:
+                    return cls._resolve_file_param(raw_value, param_spec, name)
+                return coerce(name, config, None)
+        else:
+            # auto / 未知来源：依次查找各来源
+            def extract(url_params, query_params, body_data, headers, files, request):
+                return coerce(name, config, (
+                    url_params.get(name) or
+                    query_params.get(name) or
+                    body_data.get(name)
+                ))
+
+        return extract
+
     @classmethod
     def clear_cache(cls) -> None:
-        """清空签名缓存"""
+        """清空签名与参数分析缓存，并重置统计计数"""
         cls._signature_cache.clear()
+        cls._analysis_cache.clear()
+        cls._analysis_hits = 0
+        cls._analysis_misses = 0
+
+    @classmethod
+    def cache_stats(cls) -> Dict[str, int]:
+        """返回参数分析缓存的计数 (``hits``、``misses``、``size``)"""
+        return {
+            'hits': cls._analysis_hits,
+            'misses': cls._analysis_misses,
+            'size': len(cls._analysis_cache),
+        }
 
     @classmethod
     def _resolve_file_param(
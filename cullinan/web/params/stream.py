@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""Cullinan Streaming Model Binding
+
+流式解析超大 JSON 数组请求体为模型实例。
+
+``List[Model]`` 参数会先把整个数组解码到内存；数组很大时可改用
+``stream_models`` 边接收边解析，内存中只保留当前元素。
+
+Example:
+    @post_api(url="/users/bulk")
+    @stream_request_body
+    async def bulk_create(self, request):
+        count = 0
+        async for user in stream_models(request, User):
+            await save(user)
+            count += 1
+        return {'created': count}
+
+Author: Cullinan
+"""
+
+from typing import Any, AsyncIterable, AsyncIterator, Optional, Type, Union
+
+from cullinan.codec.errors import DecodeError
+from cullinan.codec.json_stream import iter_json_array
+
+from .model_handlers import ModelHandlerError, get_model_handler_registry
+from .model_handlers.base import indexed_errors, item_type_error
+from .resolver import ResolveError
+
+
+async def stream_models(
+    source: Union[Any, AsyncIterable[bytes]],
+    model_class: Type,
+    max_item_size: Optional[int] = None,
+) -> AsyncIterator[Any]:
+    """逐个产出 JSON 数组请求体中的模型实例
+
+    解析失败的元素会被跳过并记录错误，数组读完后统一抛出 ``ResolveError``
+    （``errors`` 中的 ``index`` 为出错元素的下标）。
+
+    Args:
+        source: 请求对象（使用其 ``stream()``）或 bytes 块的异步迭代器
+        model_class: 元素模型类（dataclass / Pydantic 等已注册模型）
+        max_item_size: 单个元素的最大字节数，None 表示不限制
+
+    Yields:
+        模型实例
+
+    Raises:
+        ResolveError: 请求体不是合法的 JSON 数组，或有元素解析失败
+        ModelHandlerError: 没有能处理 ``model_class`` 的处理器
+    """
+    handler = get_model_handler_registry().get_handler(model_class)
+    if handler is None:
+        raise ModelHandlerError(
+            f"No handler found for {model_class}",
+            model_class=model_class,
+        )
+
+    chunks = source.stream() if hasattr(source, 'stream') else source
+    errors = []
+    index = 0
+    try:
+        async for item in iter_json_array(chunks, max_item_size):
+            instance = None
+            if not isinstance(item, dict):
+                errors.append(item_type_error(index, item))
+            else:
+                try:
+                    instance = handler.resolve(model_class, item)
+                except ModelHandlerError as e:
+                    errors.extend(indexed_errors(index, e.message, e.errors))
+            index += 1
+            if instance is not None:
+                yield instance
+    except DecodeError as e:
+        errors.append({'index': index, 'error': e.message})
+        raise ResolveError("Invalid JSON array body", errors=errors)
+
+    if errors:
+        failed = len({error['index'] for error in errors})
+        raise ResolveError(
+            f"Failed to resolve {failed} {model_class.__name__} item(s)",
+            errors=errors
+        )
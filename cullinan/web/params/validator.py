@@ -7,7 +7,11 @@ Author: Cullinan
 """
 
 import re
-from typing import Any, List, Tuple
+from functools import lru_cache
+from typing import Any, Callable, List, Pattern, Tuple
+
+# 编译后的校验函数: (value) -> None，失败时抛出 ValidationError
+CompiledValidator = Callable[[Any], None]
 
 
 class ValidationError(Exception):
@@ -115,12 +119,7 @@ class ParamValidator:
             ValidationError: 值为 None 但必填
         """
         if required and value is None:
-            raise ValidationError(
-                f"Parameter '{param_name}' is required",
-                param_name=param_name,
-                value=value,
-                constraint='required'
-            )
+            raise _required_error(param_name)
 
     @classmethod
     def validate_ge(
@@ -139,12 +138,7 @@ class ParamValidator:
         if value is None:
             return
         if value < min_value:
-            raise ValidationError(
-                f"Parameter '{param_name}' must be >= {min_value}, got {value}",
-                param_name=param_name,
-                value=value,
-                constraint=f'ge:{min_value}'
-            )
+            raise _bound_error(param_name, value, 'ge', min_value)
 
     @classmethod
     def validate_le(
@@ -163,12 +157,7 @@ class ParamValidator:
         if value is None:
             return
         if value > max_value:
-            raise ValidationError(
-                f"Parameter '{param_name}' must be <= {max_value}, got {value}",
-                param_name=param_name,
-                value=value,
-                constraint=f'le:{max_value}'
-            )
+            raise _bound_error(param_name, value, 'le', max_value)
 
     @classmethod
     def validate_gt(
@@ -187,12 +176,7 @@ class ParamValidator:
         if value is None:
             return
         if value <= min_value:
-            raise ValidationError(
-                f"Parameter '{param_name}' must be > {min_value}, got {value}",
-                param_name=param_name,
-                value=value,
-                constraint=f'gt:{min_value}'
-            )
+            raise _bound_error(param_name, value, 'gt', min_value)
 
     @classmethod
     def validate_lt(
@@ -211,12 +195,7 @@ class ParamValidator:
         if value is None:
             return
         if value >= max_value:
-            raise ValidationError(
-                f"Parameter '{param_name}' must be < {max_value}, got {value}",
-                param_name=param_name,
-                value=value,
-                constraint=f'lt:{max_value}'
-            )
+            raise _bound_error(param_name, value, 'lt', max_value)
 
     @classmethod
     def validate_min_length(
@@ -235,12 +214,7 @@ class ParamValidator:
         if value is None:
             return
         if len(value) < min_length:
-            raise ValidationError(
-                f"Parameter '{param_name}' length must be >= {min_length}, got {len(value)}",
-                param_name=param_name,
-                value=value,
-                constraint=f'min_length:{min_length}'
-            )
+            raise _length_error(param_name, value, 'min_length', min_length)
 
     @classmethod
     def validate_max_length(
@@ -259,12 +233,7 @@ class ParamValidator:
         if value is None:
             return
         if len(value) > max_length:
-            raise ValidationError(
-                f"Parameter '{param_name}' length must be <= {max_length}, got {len(value)}",
-                param_name=param_name,
-                value=value,
-                constraint=f'max_length:{max_length}'
-            )
+            raise _length_error(param_name, value, 'max_length', max_length)
 
     @classmethod
     def validate_regex(
@@ -284,13 +253,8 @@ class ParamValidator:
             return
         if not isinstance(value, str):
             value = str(value)
-        if not re.match(pattern, value):
-            raise ValidationError(
-                f"Parameter '{param_name}' does not match pattern '{pattern}'",
-                param_name=param_name,
-                value=value,
-                constraint=f'regex:{pattern}'
-            )
+        if _compile_pattern(pattern).match(value) is None:
+            raise _regex_error(param_name, value, pattern)
 
     @classmethod
     def validate_param(cls, param, value: Any, name: str = None) -> None:
@@ -305,18 +269,104 @@ class ParamValidator:
             ValidationError: 校验失败
         """
         param_name = name or param.name
+        compiled = param._compiled_validator
+        if compiled is None or compiled[0] != param_name:
+            compiled = param._compiled_validator = (param_name, cls.compile(param, param_name))
+        compiled[1](value)
+
+    @classmethod
+    def compile(cls, param, name: str = None) -> CompiledValidator:
+        """将 Param 的全部约束编译为单个校验函数
 
-        # 必填校验
-        if param.required and value is None:
-            raise ValidationError(
-                f"Parameter '{param_name}' is required",
-                param_name=param_name,
-                value=value,
-                constraint='required'
-            )
+        约束值与正则在编译期取出 / 预编译，校验时按开销从低到高检查
+        （必填 → 数值范围 → 长度 → 正则），首个失败即抛出，
+        错误信息与 ``validate_*`` 方法一致。
 
-        # 获取并执行所有验证器
-        validators = param.get_validators()
-        if validators:
-            cls.validate(value, validators, param_name)
+        Args:
+            param: Param 实例
+            name: 参数名 (覆盖 param.name)
 
+        Returns:
+            ``(value) -> None``，校验失败抛出 ValidationError
+        """
+        param_name = name or param.name
+        required = param.required
+        ge, le, gt, lt = param.ge, param.le, param.gt, param.lt
+        min_length, max_length = param.min_length, param.max_length
+        check_bounds = not (ge is None and le is None and gt is None and lt is None)
+        check_length = not (min_length is None and max_length is None)
+        pattern = param.regex
+        match = _compile_pattern(pattern).match if pattern is not None else None
+
+        def validate(value: Any) -> None:
+            if value is None:
+                if required:
+                    raise _required_error(param_name)
+                return
+            if check_bounds:
+                if ge is not None and value < ge:
+                    raise _bound_error(param_name, value, 'ge', ge)
+                if le is not None and value > le:
+                    raise _bound_error(param_name, value, 'le', le)
+                if gt is not None and value <= gt:
+                    raise _bound_error(param_name, value, 'gt', gt)
+                if lt is not None and value >= lt:
+                    raise _bound_error(param_name, value, 'lt', lt)
+            if check_length:
+                length = len(value)
+                if min_length is not None and length < min_length:
+                    raise _length_error(param_name, value, 'min_length', min_length)
+                if max_length is not None and length > max_length:
+                    raise _length_error(param_name, value, 'max_length', max_length)
+            if match is not None:
+                text = value if isinstance(value, str) else str(value)
+                if match(text) is None:
+                    raise _regex_error(param_name, text, pattern)
+
+        return validate
+
+
+
+_BOUND_OPERATORS = {'ge': '>=', 'le': '<=', 'gt': '>', 'lt': '<'}
+_LENGTH_OPERATORS = {'min_length': '>=', 'max_length': '<='}
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> Pattern:
+    return re.compile(pattern)
+
+
+def _required_error(param_name: str) -> ValidationError:
+    return ValidationError(
+        f"Parameter '{param_name}' is required",
+        param_name=param_name,
+        value=None,
+        constraint='required'
+    )
+
+
+def _bound_error(param_name: str, value: Any, rule: str, limit: Any) -> ValidationError:
+    return ValidationError(
+        f"Parameter '{param_name}' must be {_BOUND_OPERATORS[rule]} {limit}, got {value}",
+        param_name=param_name,
+        value=value,
+        constraint=f'{rule}:{limit}'
+    )
+
+
+def _length_error(param_name: str, value: Any, rule: str, limit: int) -> ValidationError:
+    return ValidationError(
+        f"Parameter '{param_name}' length must be {_LENGTH_OPERATORS[rule]} {limit}, got {len(value)}",
+        param_name=param_name,
+        value=value,
+        constraint=f'{rule}:{limit}'
+    )
+
+
+def _regex_error(param_name: str, value: str, pattern: str) -> ValidationError:
+    return ValidationError(
+        f"Parameter '{param_name}' does not match pattern '{pattern}'",
+        param_name=param_name,
+        value=value,
+        constraint=f'regex:{pattern}'
+    )
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""Bounded in-memory cache for hot static assets.
+
+Enabled per mount with ``StaticFiles(cache=True, ...)``.  Each entry keeps
+everything the handler needs to serve one file in one content coding — the
+resolved file, its ``stat`` result, ETag, content type and bytes — keyed by
+the file path and coding, so URLs that resolve to the same file (e.g. every
+SPA fallback route) share a single copy.  A small route table maps request
+paths to entries, so a hit touches the disk at most once per
+``revalidate_interval`` (a single ``stat`` to compare ``mtime``/size).
+
+Author: Cullinan
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+
+@dataclass
+class CachedAsset:
+    """Resolved, fully-read static file in one content coding.
+
+    ``stat_result`` always describes ``target`` (the original file); when a
+    precompressed ``variant`` was chosen, ``body`` holds the variant's bytes
+    and ``encoding`` its content coding.
+    """
+
+    target: Path
+    is_spa_fallback: bool
+    stat_result: os.stat_result
+    etag: Optional[str]
+    content_type: str
+    body: bytes
+    validated_at: float
+    encoding: Optional[str] = None
+    variant: Optional[Path] = None
+
+    @property
+    def key(self) -> str:
+        return asset_key(self.target, self.encoding)
+
+    def matches(self, stat_result: os.stat_result) -> bool:
+        return (
+            stat_result.st_mtime_ns == self.stat_result.st_mtime_ns
+            and stat_result.st_size == self.stat_result.st_size
+        )
+
+
+def asset_key(target: Path, encoding: Optional[str]) -> str:
+    """Cache key for ``target`` served in ``encoding`` (``None`` = identity)."""
+    return f"{target}\x00{encoding or ''}"
+
+
+class StaticAssetCache:
+    """LRU cache of :class:`CachedAsset` bounded by entry count and total bytes.
+
+    Args:
+        max_entries: Maximum number of cached files (per content coding);
+            the route table holds up to ``ROUTES_PER_ENTRY`` times as many
+            request paths.
+        max_bytes: Maximum total size of cached bodies.
+        max_file_size: Files larger than this are never cached.
+        revalidate_interval: Seconds before a hit re-checks the file's mtime.
+    """
+
+    ROUTES_PER_ENTRY = 8
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        max_bytes: int,
+        max_file_size: int,
+        revalidate_interval: float,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_file_size = max_file_size
+        self.revalidate_interval = revalidate_interval
+        self._entries: "OrderedDict[str, CachedAsset]" = OrderedDict()
+        # request path (+ accepted codings) -> entry key
+        self._routes: "OrderedDict[str, str]" = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def lookup(self, route: str) -> Optional[CachedAsset]:
+        """Return the entry a request path was last served from (counts hits/misses)."""
+        with self._lock:
+            key = self._routes.get(route)
+            asset = self._entries.get(key) if key is not None else None
+            if asset is None:
+                if key is not None:
+                    del self._routes[route]
+                self._misses += 1
+                return None
+            self._routes.move_to_end(route)
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return asset
+
+    def get(self, key: str) -> Optional[CachedAsset]:
+        """Return the entry for an ``asset_key``, if cached."""
+        with self._lock:
+            asset = self._entries.get(key)
+            if asset is not None:
+                self._entries.move_to_end(key)
+            return asset
+
+    def link(self, route: str, key: str) -> None:
+        """Remember that ``route`` is served from the entry ``key``."""
+        with self._lock:
+            self._routes[route] = key
+            self._routes.move_to_end(route)
+            while len(self._routes) > self.max_entries * self.ROUTES_PER_ENTRY:
+                self._routes.popitem(last=False)
+
+    def admits(self, size: int) -> bool:
+        return size <= self.max_file_size and size <= self.max_bytes
+
+    def put(self, asset: CachedAsset, route: Optional[str] = None) -> None:
+        """Store ``asset`` under its ``key`` and link ``route`` to it."""
+        if not self.admits(len(asset.body)):
+            return
+        key = asset.key
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous.body)
+            self._entries[key] = asset
+            self._bytes += len(asset.body)
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                _key, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted.body)
+        if route is not None:
+            self.link(route, key)
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            asset = self._entries.pop(key, None)
+            if asset is not None:
+                self._bytes -= len(asset.body)
+
+    def needs_revalidation(self, asset: CachedAsset, now: float) -> bool:
+        return now - asset.validated_at >= self.revalidate_interval
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._routes.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return ``hits``, ``misses``, ``entries`` and ``bytes`` counters."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
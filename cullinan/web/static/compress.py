@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+"""Precompressed static asset variants (``.br`` / ``.gz``).
+
+A mount with ``precompressed=True`` serves ``<file>.br`` or ``<file>.gz``
+instead of ``<file>`` when the client's ``Accept-Encoding`` allows it and the
+variant is at least as new as the original.  Variants live next to the
+originals, or under ``precompressed_dir`` mirroring the mount's layout.
+
+``precompress_static_files`` generates those variants ahead of time (it runs
+at registration for mounts with ``precompress=True``).  Gzip uses the
+standard library; Brotli is used when the optional ``brotli`` package is
+installed.
+
+Author: Cullinan
+"""
+
+from __future__ import annotations
+
+import gzip
+import logging
+import mimetypes
+import os
+import tempfile
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from cullinan.web.gateway.compression import load_brotli
+from cullinan.web.gateway.compression import accepted_encodings as negotiate_encodings
+from cullinan.web.static.spec import StaticFiles
+
+logger = logging.getLogger(__name__)
+
+# Preferred first when the client weighs them equally.
+ENCODING_SUFFIXES: Tuple[Tuple[str, str], ...] = (("br", ".br"), ("gzip", ".gz"))
+
+_COMPRESSIBLE_TYPES = frozenset({
+    "application/javascript",
+    "application/json",
+    "application/manifest+json",
+    "application/wasm",
+    "application/xml",
+    "image/svg+xml",
+    "image/x-icon",
+    "image/vnd.microsoft.icon",
+})
+
+
+def is_compressible(path: Path) -> bool:
+    """Return True when ``path``'s media type benefits from compression."""
+    ctype, _encoding = mimetypes.guess_type(str(path))
+    if not ctype:
+        return False
+    return ctype.startswith("text/") or ctype in _COMPRESSIBLE_TYPES
+
+
+def accepted_encodings(header: Optional[str]) -> List[str]:
+    """Return the variant encodings acceptable per ``Accept-Encoding``, best first."""
+    return negotiate_encodings(header, [encoding for encoding, _suffix in ENCODING_SUFFIXES])
+
+
+def variant_path(
+    source: Path,
+    encoding: str,
+    base_dir: Path,
+    variant_dir: Optional[Path],
+) -> Path:
+    """Return where the ``encoding`` variant of ``source`` lives."""
+    suffix = dict(ENCODING_SUFFIXES)[encoding]
+    if variant_dir is None:
+        return source.with_name(source.name + suffix)
+    relative = source.relative_to(base_dir)
+    return variant_dir / relative.parent / (relative.name + suffix)
+
+
+def find_variant(
+    source: Path,
+    source_stat: os.stat_result,
+    encodings: List[str],
+    base_dir: Path,
+    variant_dir: Optional[Path],
+) -> Optional[Tuple[str, Path, os.stat_result]]:
+    """Return ``(encoding, path, stat)`` of the best fresh variant, if any."""
+    for encoding in encodings:
+        candidate = variant_path(source, encoding, base_dir, variant_dir)
+        try:
+            stat_result = candidate.stat()
+        except OSError:
+            continue
+        # A variant older than its source was built from stale content.
+        if stat_result.st_mtime_ns >= source_stat.st_mtime_ns:
+            return encoding, candidate, stat_result
+    return None
+
+
+def precompress_static_files(
+    spec: StaticFiles,
+    *,
+    project_root: Optional[str] = None,
+) -> int:
+    """Write ``.gz`` (and ``.br`` when available) variants for eligible files.
+
+    Files smaller than ``spec.precompress_min_size``, non-compressible media
+    types, and variants that would not be smaller are skipped.  Up-to-date
+    variants are left alone, so restarts are cheap.
+
+    Returns:
+        Number of variant files written.
+    """
+    base_dir = spec.resolve_directory(project_root)
+    variant_dir = spec.resolve_precompressed_directory(project_root)
+    if not base_dir.is_dir():
+        return 0
+
+    brotli = load_brotli()
+    if brotli is None:
+        logger.debug("brotli is not installed; only gzip variants are generated")
+
+    written = 0
+    for root, _dirs, files in os.walk(base_dir):
+        root_path = Path(root)
+        if variant_dir is not None and (root_path == variant_dir or variant_dir in root_path.parents):
+            continue
+        for name in files:
+            source = root_path / name
+            if name.endswith((".gz", ".br")) or not is_compressible(source):
+                continue
+            try:
+                source_stat = source.stat()
+            except OSError:
+                continue
+            if source_stat.st_size < spec.precompress_min_size:
+                continue
+
+            data: Optional[bytes] = None
+            for encoding, _suffix in ENCODING_SUFFIXES:
+                if encoding == "br" and brotli is None:
+                    continue
+                target = variant_path(source, encoding, base_dir, variant_dir)
+                try:
+                    if target.stat().st_mtime_ns >= source_stat.st_mtime_ns:
+                        continue
+                except OSError:
+                    pass
+                if data is None:
+                    data = source.read_bytes()
+                if encoding == "br":
+                    compressed = brotli.compress(data)
+                else:
+                    compressed = gzip.compress(data, compresslevel=9, mtime=0)
+                if len(compressed) >= len(data):
+                    continue
+                _write_atomic(target, compressed)
+                written += 1
+
+    logger.info("└---precompressed %d static asset variant(s) for %s", written, spec.url)
+    return written
+
+
+def _write_atomic(target: Path, data: bytes) -> None:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=str(target.parent), prefix=".cullinan-")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp_name, target)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
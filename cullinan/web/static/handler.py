@@ -15,11 +15,15 @@ import hashlib
 import logging
 import mimetypes
 import os
+import time
+import uuid
 from email.utils import formatdate, parsedate_to_datetime
 from pathlib import Path
-from typing import Awaitable, Callable, Optional, Tuple
+from typing import Awaitable, Callable, List, Optional, Tuple
 
-from cullinan.web.gateway.web_core import WebRequest, WebResponse
+from cullinan.web.gateway.web_core import CachedFileResponse, FileResponse, WebRequest, WebResponse
+from cullinan.web.static.cache import CachedAsset, StaticAssetCache, asset_key
+from cullinan.web.static.compress import accepted_encodings, find_variant, is_compressible
 from cullinan.web.static.spec import StaticFiles
 
 logger = logging.getLogger(__name__)
@@ -111,6 +115,112 @@ def _build_cache_control(spec: StaticFiles) -> Optional[str]:
     return ", ".join(directives)
 
 
+# ----------------------------------------------------------------------
+# Range requests
+# ----------------------------------------------------------------------
+
+# More ranges than this in one request is treated as abuse and answered
+# with the full representation instead.
+_MAX_RANGES = 16
+
+
+def _parse_range_header(value: str, size: int) -> Optional[List[Tuple[int, int]]]:
+    """Parse a ``Range: bytes=...`` header into ``(offset, length)`` pairs.
+
+    Returns ``None`` when the header should be ignored (unsupported unit,
+    malformed syntax, too many ranges) and an empty list when it is
+    syntactically valid but no range overlaps the file (416).  Overlapping
+    or adjacent ranges are coalesced.
+    """
+    unit, _, spec = value.partition("=")
+    if unit.strip().lower() != "bytes" or not spec.strip():
+        return None
+
+    ranges: List[Tuple[int, int]] = []
+    parts = [part.strip() for part in spec.split(",") if part.strip()]
+    if not parts or len(parts) > _MAX_RANGES:
+        return None
+    for part in parts:
+        first, sep, last = part.partition("-")
+        if not sep:
+            return None
+        first, last = first.strip(), last.strip()
+        try:
+            if not first:
+                # Suffix range: the final N bytes.
+                suffix = int(last)
+                if suffix < 0:
+                    return None
+                if suffix == 0 or size == 0:
+                    continue
+                start, end = max(size - suffix, 0), size - 1
+            else:
+                start = int(first)
+                end = int(last) if last else None
+                if start < 0 or (end is not None and end < start):
+                    return None
+                if start >= size:
+                    continue
+                end = size - 1 if end is None else min(end, size - 1)
+        except ValueError:
+            return None
+        ranges.append((start, end))
+
+    ranges.sort()
+    merged: List[Tuple[int, int]] = []
+    for start, end in ranges:
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return [(start, end - start + 1) for start, end in merged]
+
+
+def _if_range_matches(
+    value: str,
+    stat_result: os.stat_result,
+    etag_value: Optional[str],
+) -> bool:
+    """Return True when an ``If-Range`` precondition still holds."""
+    value = value.strip()
+    if value.startswith('"') or value.startswith("W/"):
+        # Only strong validators may be used with If-Range.
+        return etag_value is not None and value == etag_value
+    ts = _parse_http_date(value)
+    return ts is not None and int(stat_result.st_mtime) == int(ts)
+
+
+def _if_none_match(value: str, etag_value: str) -> bool:
+    """Return True when ``If-None-Match`` lists ``etag_value``.
+
+    Uses weak comparison (RFC 9110 §13.1.2): ``W/"x"`` matches ``"x"``, so
+    a validator weakened on the way out (e.g. by ``CompressionMiddleware``)
+    still revalidates.
+    """
+    if value.strip() == "*":
+        return True
+    opaque = _opaque_tag(etag_value)
+    return any(_opaque_tag(part.strip()) == opaque for part in value.split(","))
+
+
+def _opaque_tag(etag_value: str) -> str:
+    return etag_value[2:] if etag_value.startswith("W/") else etag_value
+
+
+def _range_not_satisfiable(
+    spec: StaticFiles,
+    stat_result: os.stat_result,
+    etag_value: Optional[str],
+    size: int,
+    *,
+    vary: bool = False,
+) -> WebResponse:
+    response = WebResponse.error(416, "Range Not Satisfiable")
+    _apply_common_headers(response, spec, stat_result, etag_value, vary=vary)
+    response.set_header("Content-Range", f"bytes */{size}")
+    return response
+
+
 # ----------------------------------------------------------------------
 # Async file IO
 # ----------------------------------------------------------------------
@@ -200,6 +310,9 @@ def _apply_common_headers(
     spec: StaticFiles,
     stat_result: os.stat_result,
     etag_value: Optional[str],
+    *,
+    content_encoding: Optional[str] = None,
+    vary: bool = False,
 ) -> None:
     for name, value in spec.extra_headers:
         response.set_header(name, value)
@@ -214,19 +327,33 @@ def _apply_common_headers(
     if etag_value is not None:
         response.set_header("ETag", etag_value)
 
-    response.set_header("Accept-Ranges", "none")
+    response.set_header("Accept-Ranges", "bytes")
+
+    if content_encoding is not None:
+        response.set_header("Content-Encoding", content_encoding)
+    if vary:
+        response.add_header("Vary", "Accept-Encoding")
 
 
 def _not_modified_response(
     spec: StaticFiles,
     stat_result: os.stat_result,
     etag_value: Optional[str],
+    *,
+    vary: bool = False,
 ) -> WebResponse:
     response = WebResponse(status_code=304)
-    _apply_common_headers(response, spec, stat_result, etag_value)
+    _apply_common_headers(response, spec, stat_result, etag_value, vary=vary)
     return response
 
 
+def _variant_etag(etag_value: Optional[str], encoding: Optional[str]) -> Optional[str]:
+    """Give each content coding its own strong validator (``"<digest>-br"``)."""
+    if etag_value is None or encoding is None:
+        return etag_value
+    return f'{etag_value[:-1]}-{encoding}"'
+
+
 # ----------------------------------------------------------------------
 # Public factory
 # ----------------------------------------------------------------------
@@ -256,6 +383,35 @@ def build_static_handler(
         )
 
     methods = frozenset(spec.methods)
+    variant_dir = spec.resolve_precompressed_directory(project_root)
+    cache: Optional[StaticAssetCache] = None
+    if spec.cache:
+        cache = StaticAssetCache(
+            max_entries=spec.cache_max_entries,
+            max_bytes=spec.cache_max_bytes,
+            max_file_size=spec.cache_max_file_size,
+            revalidate_interval=spec.cache_revalidate_interval,
+        )
+
+    async def _cached_asset(route_key: str) -> Optional[CachedAsset]:
+        """Return a still-valid cache entry, re-checking mtime once per interval."""
+        asset = cache.lookup(route_key)
+        if asset is None:
+            return None
+        now = time.monotonic()
+        if cache.needs_revalidation(asset, now):
+            try:
+                current = await _stat(asset.target)
+                fresh = asset.matches(current)
+                if fresh and asset.variant is not None:
+                    fresh = (await _stat(asset.variant)).st_mtime_ns >= current.st_mtime_ns
+            except OSError:
+                fresh = False
+            if not fresh:
+                cache.discard(asset.key)
+                return None
+            asset.validated_at = now
+        return asset
 
     async def _handler(request: WebRequest) -> WebResponse:
         method = (request.method or "GET").upper()
@@ -263,38 +419,112 @@ def build_static_handler(
             return WebResponse.error(405, f"Method {method} not allowed")
 
         relative_path = _strip_prefix(request.path, spec.url)
-        try:
-            target, is_spa_fallback = await _resolve_target(
-                spec, base_dir, relative_path
+        encodings: List[str] = []
+        if spec.precompressed:
+            encodings = accepted_encodings(
+                request.headers.get("Accept-Encoding") if request.headers else None
             )
-        except OSError as exc:
-            logger.debug(
-                "Filesystem error while resolving %s under %s: %s",
-                relative_path,
-                base_dir,
-                exc,
-            )
-            return WebResponse.error(404, "Not Found")
+        route_key = relative_path
+        if encodings:
+            route_key = f"{relative_path}\x00{','.join(encodings)}"
+
+        asset = await _cached_asset(route_key) if cache is not None else None
+        body: Optional[bytes] = None
+        encoding: Optional[str] = None
+        variant: Optional[Path] = None
+        variant_stat: Optional[os.stat_result] = None
+
+        if asset is not None:
+            target = asset.target
+            stat_result = asset.stat_result
+            etag_value = asset.etag
+            content_type = asset.content_type
+            body = asset.body
+            encoding = asset.encoding
+            variant = asset.variant
+        else:
+            try:
+                target, is_spa_fallback = await _resolve_target(
+                    spec, base_dir, relative_path
+                )
+            except OSError as exc:
+                logger.debug(
+                    "Filesystem error while resolving %s under %s: %s",
+                    relative_path,
+                    base_dir,
+                    exc,
+                )
+                return WebResponse.error(404, "Not Found")
 
-        if target is None:
-            return WebResponse.error(404, "Not Found")
+            if target is None:
+                return WebResponse.error(404, "Not Found")
 
-        try:
-            stat_result = await _stat(target)
-        except FileNotFoundError:
-            return WebResponse.error(404, "Not Found")
-        except OSError:
-            return WebResponse.error(500, "Static file unreadable")
-
-        etag_value: Optional[str] = (
-            _compute_etag(stat_result) if (spec.etag and not spec.no_cache) else None
-        )
+            try:
+                stat_result = await _stat(target)
+            except FileNotFoundError:
+                return WebResponse.error(404, "Not Found")
+            except OSError:
+                return WebResponse.error(500, "Static file unreadable")
+
+            etag_value = (
+                _compute_etag(stat_result) if (spec.etag and not spec.no_cache) else None
+            )
+            content_type = _content_type_for(target)
+            if is_spa_fallback:
+                # SPA bundle entry is always HTML.
+                content_type = "text/html; charset=utf-8"
+
+            if encodings and is_compressible(target):
+                found = find_variant(target, stat_result, encodings, base_dir, variant_dir)
+                if found is not None:
+                    encoding, variant, variant_stat = found
+
+            served_size = variant_stat.st_size if variant_stat is not None else stat_result.st_size
+            if cache is not None and method == "GET":
+                # Another URL (e.g. an SPA route) may already hold this file.
+                shared = cache.get(asset_key(target, encoding))
+                if shared is not None and shared.matches(stat_result) and len(shared.body) == served_size:
+                    cache.link(route_key, shared.key)
+                    body = shared.body
+                    etag_value = shared.etag
+                    content_type = shared.content_type
+            if body is None and cache is not None and method == "GET" and cache.admits(served_size):
+                try:
+                    body = await _read_bytes(variant or target)
+                except OSError as exc:
+                    logger.debug("Failed caching static file %s: %s", variant or target, exc)
+                    body = None
+                if body is not None and len(body) == served_size:
+                    cache.put(CachedAsset(
+                        target=target,
+                        is_spa_fallback=is_spa_fallback,
+                        stat_result=stat_result,
+                        etag=etag_value,
+                        content_type=content_type,
+                        body=body,
+                        validated_at=time.monotonic(),
+                        encoding=encoding,
+                        variant=variant,
+                    ), route_key)
+
+        # Representation details: a precompressed variant changes the bytes
+        # on the wire, so it gets its own ETag, and any compressible asset
+        # varies by Accept-Encoding.
+        vary = spec.precompressed and is_compressible(target)
+        etag_value = _variant_etag(etag_value, encoding)
+        served_path = variant or target
+        if body is not None:
+            size = len(body)
+        elif variant_stat is not None:
+            size = variant_stat.st_size
+        else:
+            size = stat_result.st_size
 
         # Conditional request: If-None-Match
         if etag_value is not None:
             inm = request.headers.get("If-None-Match") if request.headers else None
-            if inm and etag_value in {part.strip() for part in inm.split(",")}:
-                return _not_modified_response(spec, stat_result, etag_value)
+            if inm and _if_none_match(inm, etag_value):
+                return _not_modified_response(spec, stat_result, etag_value, vary=vary)
 
         # Conditional request: If-Modified-Since (only when no ETag match)
         if spec.last_modified and not spec.no_cache:
@@ -304,34 +534,77 @@ def build_static_handler(
             if ims_header:
                 ims_ts = _parse_http_date(ims_header)
                 if ims_ts is not None and int(stat_result.st_mtime) <= int(ims_ts):
-                    return _not_modified_response(spec, stat_result, etag_value)
+                    return _not_modified_response(spec, stat_result, etag_value, vary=vary)
 
-        # Read body (skip for HEAD)
         if method == "HEAD":
-            body: bytes = b""
+            response = WebResponse(status_code=200, content_type=content_type)
+            # On HEAD, Content-Length should still reflect the real size.
+            response.set_header("Content-Length", str(size))
+            _apply_common_headers(
+                response, spec, stat_result, etag_value, content_encoding=encoding, vary=vary,
+            )
+            return response
+
+        # Byte ranges (ignored when If-Range no longer matches)
+        range_header = request.headers.get("Range") if request.headers else None
+        ranges: Optional[List[Tuple[int, int]]] = None
+        if range_header:
+            if_range = request.headers.get("If-Range")
+            if not if_range or _if_range_matches(if_range, stat_result, etag_value):
+                ranges = _parse_range_header(range_header, size)
+            if ranges is not None and not ranges:
+                return _range_not_satisfiable(spec, stat_result, etag_value, size, vary=vary)
+
+        if ranges is not None and len(ranges) > 1:
+            response = FileResponse.byteranges(
+                served_path,
+                ranges,
+                file_size=size,
+                part_content_type=content_type,
+                boundary=uuid.uuid4().hex,
+                chunk_size=spec.chunk_size,
+            )
+        elif body is not None:
+            # Served from memory (cached small file), still as a file response.
+            if ranges is None:
+                response = CachedFileResponse(served_path, body, content_type=content_type)
+            else:
+                offset, length = ranges[0]
+                response = CachedFileResponse(
+                    served_path,
+                    body,
+                    status_code=206,
+                    content_type=content_type,
+                    offset=offset,
+                    length=length,
+                )
+                response.set_header("Content-Range", f"bytes {offset}-{offset + length - 1}/{size}")
+        elif ranges is None:
+            # The body is streamed from disk by the driver, never read whole here.
+            response = FileResponse(
+                served_path,
+                content_type=content_type,
+                file_size=size,
+                chunk_size=spec.chunk_size,
+            )
         else:
-            try:
-                body = await _read_bytes(target)
-            except OSError as exc:
-                logger.error("Failed reading static file %s: %s", target, exc)
-                return WebResponse.error(500, "Static file unreadable")
-
-        content_type = _content_type_for(target)
-        if is_spa_fallback:
-            # SPA bundle entry is always HTML.
-            content_type = "text/html; charset=utf-8"
-
-        response = WebResponse(
-            body=body,
-            status_code=200,
-            content_type=content_type,
+            offset, length = ranges[0]
+            response = FileResponse(
+                served_path,
+                status_code=206,
+                content_type=content_type,
+                offset=offset,
+                length=length,
+                file_size=size,
+                chunk_size=spec.chunk_size,
+            )
+            response.set_header("Content-Range", f"bytes {offset}-{offset + length - 1}/{size}")
+        _apply_common_headers(
+            response, spec, stat_result, etag_value, content_encoding=encoding, vary=vary,
         )
-        # On HEAD, Content-Length should still reflect the real size.
-        if method == "HEAD":
-            response.set_header("Content-Length", str(stat_result.st_size))
-        _apply_common_headers(response, spec, stat_result, etag_value)
         return response
 
     _handler.__cullinan_static_spec__ = spec  # type: ignore[attr-defined]
+    _handler.__cullinan_static_cache__ = cache  # type: ignore[attr-defined]
     _handler.__name__ = f"_static_handler_{spec.url.strip('/').replace('/', '_') or 'root'}"
     return _handler
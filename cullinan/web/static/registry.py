@@ -14,6 +14,7 @@ import logging
 from typing import Iterable, Optional
 
 from cullinan.web.gateway.router import Router
+from cullinan.web.static.compress import precompress_static_files
 from cullinan.web.static.handler import build_static_handler
 from cullinan.web.static.spec import StaticFiles
 
@@ -44,6 +45,11 @@ def install_static_files(
     """
     count = 0
     for spec in specs:
+        if spec.precompress:
+            try:
+                precompress_static_files(spec, project_root=project_root)
+            except OSError as exc:
+                logger.warning("Precompressing static files for %s failed: %s", spec.url, exc)
         handler = build_static_handler(spec, project_root=project_root)
         # Wildcard sub-paths (e.g. /static/**, /assets/**, /**)
         wildcard_pattern = spec.route_pattern()
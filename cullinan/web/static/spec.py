@@ -76,6 +76,27 @@ class StaticFiles:
             of ``directory`` are rejected with ``404``.
         extra_headers: Additional response headers applied to every served
             file.
+        chunk_size: Read size in bytes used when a file has to be streamed
+            through Python (drivers without a zero-copy send path).
+        cache: When ``True``, keeps small, frequently requested files in a
+            per-mount in-memory LRU cache (resolved path, stat, ETag,
+            content type and bytes) so hits skip the filesystem.
+        cache_max_entries: Maximum number of cached files (per content coding).
+        cache_max_bytes: Maximum total bytes held by the cache.
+        cache_max_file_size: Files larger than this are never cached.
+        cache_revalidate_interval: Seconds after which a cached entry is
+            re-checked against the file's mtime/size on its next hit.
+        precompressed: When ``True``, serves a ``.br`` / ``.gz`` variant of a
+            compressible file (with ``Content-Encoding`` and
+            ``Vary: Accept-Encoding``) when the client accepts it and the
+            variant is not older than the original.
+        precompress: When ``True``, generates those variants at startup
+            (implies ``precompressed``).  Brotli needs the optional
+            ``brotli`` package; gzip is always available.
+        precompressed_dir: Directory holding the variants, mirroring the
+            mount's layout.  ``None`` keeps them next to the originals.
+            Relative paths resolve like ``directory``.
+        precompress_min_size: Files smaller than this are not precompressed.
     """
 
     url: str
@@ -90,6 +111,16 @@ class StaticFiles:
     methods: Tuple[str, ...] = ("GET", "HEAD")
     follow_symlinks: bool = False
     extra_headers: Tuple[Tuple[str, str], ...] = field(default_factory=tuple)
+    chunk_size: int = 64 * 1024
+    cache: bool = False
+    cache_max_entries: int = 256
+    cache_max_bytes: int = 16 * 1024 * 1024
+    cache_max_file_size: int = 256 * 1024
+    cache_revalidate_interval: float = 2.0
+    precompressed: bool = False
+    precompress: bool = False
+    precompressed_dir: Optional[str] = None
+    precompress_min_size: int = 1024
 
     def __post_init__(self) -> None:
         # Normalise the URL prefix in-place. Dataclass is frozen, so use
@@ -105,6 +136,18 @@ class StaticFiles:
         if self.max_age is not None and self.max_age < 0:
             raise ValueError("StaticFiles.max_age must be a non-negative integer.")
 
+        if self.chunk_size <= 0:
+            raise ValueError("StaticFiles.chunk_size must be a positive integer.")
+
+        if self.cache_max_entries <= 0 or self.cache_max_bytes <= 0 or self.cache_max_file_size <= 0:
+            raise ValueError("StaticFiles cache limits must be positive integers.")
+
+        if self.cache_revalidate_interval < 0:
+            raise ValueError("StaticFiles.cache_revalidate_interval must be non-negative.")
+
+        if self.precompress:
+            object.__setattr__(self, "precompressed", True)
+
         normalised_methods = tuple(m.upper() for m in self.methods)
         for method in normalised_methods:
             if method not in ("GET", "HEAD"):
@@ -149,6 +192,16 @@ class StaticFiles:
         anchor = Path(project_root) if project_root else Path(os.getcwd())
         return (anchor / directory_path).resolve(strict=False)
 
+    def resolve_precompressed_directory(self, project_root: Optional[str] = None) -> Optional[Path]:
+        """Resolve ``precompressed_dir`` like :meth:`resolve_directory` (``None`` if unset)."""
+        if not self.precompressed_dir:
+            return None
+        directory_path = Path(self.precompressed_dir)
+        if directory_path.is_absolute():
+            return directory_path.resolve(strict=False)
+        anchor = Path(project_root) if project_root else Path(os.getcwd())
+        return (anchor / directory_path).resolve(strict=False)
+
     def route_pattern(self) -> str:
         """Return the wildcard URL pattern used to register the mount.
 
@@ -0,0 +1,70 @@
+"""Response compression example for Cullinan.
+
+Demonstrates:
+
+* adding ``CompressionMiddleware`` to the gateway pipeline from a
+  component's ``on_startup`` hook,
+* a large JSON body compressed with the best coding the client accepts
+  (``zstd`` / ``br`` when their packages are installed, otherwise ``gzip``),
+* a small body left alone because it is under ``minimum_size``,
+* a ``StreamingResponse`` export and an SSE feed compressed chunk by chunk,
+  each chunk flushed so the client sees it immediately,
+* ``Cache-Control: no-transform`` opting a single response out.
+
+The same controllers run under both Tornado and ASGI.
+"""
+
+import asyncio
+
+from cullinan import application, component, configure
+from cullinan.web import EventSourceResponse, StreamingResponse, WebResponse, controller, get_api
+from cullinan.web.gateway import CompressionMiddleware, get_pipeline
+
+
+@component
+class CompressionSetup:
+    def on_startup(self):
+        # Bodies under 500 bytes are not worth compressing
+        get_pipeline().add(CompressionMiddleware(minimum_size=500))
+
+
+@controller(url="/reports")
+class ReportController:
+    @get_api(url="")
+    def report(self):
+        return {"rows": [{"id": i, "name": f"item-{i}", "status": "active"} for i in range(200)]}
+
+    @get_api(url="/summary")
+    def summary(self):
+        return {"rows": 200}
+
+    @get_api(url="/export")
+    def export(self):
+        async def lines():
+            for i in range(200):
+                yield f'{{"id": {i}, "name": "item-{i}"}}\n'
+
+        return StreamingResponse(lines(), content_type="application/x-ndjson")
+
+    @get_api(url="/events")
+    def events(self):
+        async def ticks():
+            for i in range(5):
+                await asyncio.sleep(1)
+                yield {"tick": i}
+
+        return EventSourceResponse(ticks())
+
+    @get_api(url="/raw")
+    def raw(self):
+        response = WebResponse.json({"rows": ["x" * 40] * 50})
+        response.set_header("Cache-Control", "no-transform")
+        return response
+
+
+@configure(user_packages=["examples.compression"], server_port=4086)
+@application
+def main(): ...
+
+
+__all__ = ["main"]
@@ -0,0 +1,3 @@
+from .root import main
+
+__all__ = ["main"]
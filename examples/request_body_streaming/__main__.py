@@ -0,0 +1,4 @@
+from .root import RUNTIME_CONFIG, main
+
+if __name__ == "__main__":
+    main.run(runtime_config=RUNTIME_CONFIG)
@@ -0,0 +1,75 @@
+"""Request body example for Cullinan.
+
+Demonstrates:
+
+* middleware reading ``request.body``: a body that arrives in several ASGI
+  messages is buffered before the middleware pipeline runs, so middleware
+  sees the same request on Tornado and ASGI,
+* ``@stream_request_body`` on an upload handler that hashes the body chunk
+  by chunk; middleware sees ``request.body_loaded`` as ``False`` there,
+* ``stream_models`` decoding a large JSON array one item at a time,
+* ``WebRuntimeConfig(max_request_body_size=...)`` answering oversized
+  bodies with 413.
+"""
+
+import hashlib
+from dataclasses import dataclass
+
+from cullinan import application, configure
+from cullinan.web import Middleware, controller, middleware, post_api
+from cullinan.web.gateway import WebRuntimeConfig, stream_request_body
+from cullinan.web.params import stream_models
+
+# Bodies over 8 MiB are rejected with 413 (enforced by the ASGI driver)
+RUNTIME_CONFIG = WebRuntimeConfig(max_request_body_size=8 * 1024 * 1024)
+
+
+@middleware(priority=50)
+class BodySizeMiddleware(Middleware):
+    def process_request(self, request):
+        # The body is already buffered unless the route streams it
+        if request.body_loaded:
+            request.attributes["body_size"] = len(request.body)
+        return request
+
+    def process_response(self, request, response):
+        size = request.attributes.get("body_size")
+        response.set_header("X-Body-Size", "streamed" if size is None else str(size))
+        return response
+
+
+@dataclass
+class User:
+    name: str
+    age: int
+
+
+@controller(url="/uploads")
+class UploadController:
+    @post_api(url="/echo")
+    def echo(self, request):
+        return {"bytes": len(request.body)}
+
+    @post_api(url="/stream")
+    @stream_request_body
+    async def stream(self, request):
+        digest = hashlib.sha256()
+        size = 0
+        async for chunk in request.stream():
+            digest.update(chunk)
+            size += len(chunk)
+        return {"bytes": size, "sha256": digest.hexdigest()}
+
+    @post_api(url="/users")
+    @stream_request_body
+    async def users(self, request):
+        names = [user.name async for user in stream_models(request, User)]
+        return {"created": len(names), "names": names}
+
+
+@configure(user_packages=["examples.request_body_streaming"], server_port=4085)
+@application
+def main(): ...
+
+
+__all__ = ["RUNTIME_CONFIG", "main"]
@@ -0,0 +1,67 @@
+"""Server-Sent Events example for Cullinan.
+
+Demonstrates:
+
+* a controller method written as an async generator — every ``yield`` becomes
+  one ``text/event-stream`` event,
+* resuming a stream from the ``Last-Event-ID`` header a reconnecting
+  ``EventSource`` client sends (``last_event_id`` parameter),
+* returning ``EventSourceResponse`` explicitly to tune the heartbeat interval
+  and the client's reconnection delay,
+* a blocking sync generator, which Cullinan advances in a worker thread so
+  other connections keep being served.
+
+The same controllers run under both Tornado and ASGI.
+"""
+
+import asyncio
+import time
+
+from cullinan import application, configure
+from cullinan.web import EventSourceResponse, ServerSentEvent, controller, get_api
+
+
+@controller(url="/jobs")
+class JobController:
+    @get_api(url="/{job_id}/events")
+    async def job_events(self, job_id, last_event_id):
+        # A reconnecting client sends the id of the last event it received
+        done = int(last_event_id or 0)
+        for step in range(done + 1, 6):
+            await asyncio.sleep(0.5)
+            yield ServerSentEvent(
+                data={"job": job_id, "progress": step * 20},
+                event="progress",
+                id=step,
+            )
+        yield ServerSentEvent(data="finished", event="done", id=6)
+
+
+@controller(url="/clock")
+class ClockController:
+    @get_api(url="")
+    def clock(self):
+        async def ticks():
+            for _ in range(10):
+                await asyncio.sleep(1)
+                yield {"now": time.strftime("%H:%M:%S")}
+
+        # Ping every 5 s while idle; ask clients to reconnect after 3 s
+        return EventSourceResponse(ticks(), ping_interval=5, retry=3000)
+
+    @get_api(url="/blocking")
+    def blocking(self):
+        def lines():
+            for i in range(3):
+                time.sleep(1)  # stands in for a blocking DB cursor or file read
+                yield f"line {i}"
+
+        return EventSourceResponse(lines())
+
+
+@configure(user_packages=["examples.sse"], server_port=4083)
+@application
+def main(): ...
+
+
+__all__ = ["main"]
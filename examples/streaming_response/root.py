@@ -0,0 +1,79 @@
+"""Streaming response example for Cullinan.
+
+Demonstrates:
+
+* an async generator streamed as CSV, one row per chunk,
+* a blocking sync generator, which Cullinan advances in a worker thread so
+  other requests keep being served,
+* a stream filter (``add_stream_filter``) that rewrites chunks on the way
+  out,
+* a ``finally:`` block in the producer that runs as soon as the client
+  disconnects.
+
+The same controllers run under both Tornado and ASGI.
+"""
+
+import asyncio
+import logging
+import time
+
+from cullinan import application, configure
+from cullinan.web import StreamingResponse, controller, get_api
+
+logger = logging.getLogger(__name__)
+
+
+async def _upper(stream):
+    async for chunk in stream:
+        yield chunk.upper()
+
+
+@controller(url="/exports")
+class ExportController:
+    @get_api(url="/orders.csv")
+    def orders(self):
+        async def rows():
+            yield "id,item,quantity\n"
+            for i in range(1, 6):
+                await asyncio.sleep(0.2)  # stands in for an async DB cursor
+                yield f"{i},widget-{i},{i * 3}\n"
+
+        return StreamingResponse(rows(), content_type="text/csv; charset=utf-8")
+
+    @get_api(url="/log")
+    def log(self):
+        def lines():
+            for i in range(5):
+                time.sleep(0.5)  # stands in for a blocking file or DB read
+                yield f"log line {i}\n"
+
+        return StreamingResponse(lines(), content_type="text/plain; charset=utf-8")
+
+    @get_api(url="/shout")
+    def shout(self):
+        response = StreamingResponse([b"streams ", b"can be ", b"filtered\n"], content_type="text/plain")
+        response.add_stream_filter(_upper)
+        return response
+
+    @get_api(url="/ticks")
+    def ticks(self):
+        async def forever():
+            try:
+                n = 0
+                while True:
+                    await asyncio.sleep(1)
+                    n += 1
+                    yield f"tick {n}\n"
+            finally:
+                # Runs right after the client goes away
+                logger.info("tick stream closed")
+
+        return StreamingResponse(forever(), content_type="text/plain; charset=utf-8")
+
+
+@configure(user_packages=["examples.streaming_response"], server_port=4087)
+@application
+def main(): ...
+
+
+__all__ = ["main"]
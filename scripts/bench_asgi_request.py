@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""Measure the per-request cost of the ASGI adapter on a small JSON route.
+
+Usage:
+    python scripts/bench_asgi_request.py [--requests 2000]
+
+Reports the mean time per request and, under ``tracemalloc``, the median
+peak memory allocated while serving one request.  Tracing slows every
+allocation down, so the timing pass runs with tracing off.  Numbers vary
+with the Python version and machine; compare runs on the same box.
+
+Author: Cullinan
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cullinan.transport.adapter import ASGIAdapter  # noqa: E402
+from cullinan.web.gateway import Dispatcher, Router, WebResponse  # noqa: E402
+
+SCOPE = {
+    'type': 'http',
+    'method': 'GET',
+    'path': '/hello/bench',
+    'query_string': b'',
+    'headers': [(b'host', b'localhost:8000'), (b'accept', b'*/*')],
+    'server': ('localhost', 8000),
+    'client': ('127.0.0.1', 0),
+    'scheme': 'http',
+}
+
+
+def build_app():
+    router = Router()
+
+    async def hello(request):
+        return WebResponse.json({'message': f"Hello, {request.path_params['name']}!"})
+
+    router.add_route('GET', '/hello/{name}', handler=hello)
+    adapter = ASGIAdapter(Dispatcher(router=router), global_headers=[['X-Powered-By', 'cullinan']])
+    return adapter.create_app()
+
+
+async def serve_once(app):
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(_message):
+        pass
+
+    await app(SCOPE, receive, send)
+
+
+async def measure(app, count):
+    for _ in range(50):  # warm caches
+        await serve_once(app)
+
+    start = time.perf_counter()
+    for _ in range(count):
+        await serve_once(app)
+    elapsed = time.perf_counter() - start
+
+    peaks = []
+    tracemalloc.start()
+    try:
+        for _ in range(count):
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            await serve_once(app)
+            peaks.append(tracemalloc.get_traced_memory()[1] - current)
+    finally:
+        tracemalloc.stop()
+    return elapsed / count, peaks
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--requests', type=int, default=2000)
+    args = parser.parse_args()
+
+    per_request, peaks = asyncio.run(measure(build_app(), args.requests))
+    print(f'requests         {args.requests}')
+    print(f'time / request   {per_request * 1e6:.1f} µs')
+    print(f'peak bytes       {statistics.median(peaks):.0f} (median per request)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""Compare JSON engines on a typical API payload.
+
+Usage:
+    python scripts/bench_json.py [--rows 200] [--repeat 2000]
+
+The ``json.dumps(default=str)`` baseline is what ``WebResponse.render_body``
+and the JSON codecs did before the engine abstraction existed.  Two payloads
+are measured: plain JSON types, and rows carrying dataclasses, datetimes and
+UUIDs (the baseline flattens those with ``str()``, so its output is smaller
+and not equivalent).  Engines whose package is not installed are skipped.
+
+Author: Cullinan
+"""
+
+import argparse
+import datetime
+import json
+import os
+import sys
+import timeit
+import uuid
+from dataclasses import dataclass
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cullinan.codec.json_engine import load_json_engine  # noqa: E402
+
+
+@dataclass
+class Row:
+    id: int
+    name: str
+    score: float
+    created_at: datetime.datetime
+    token: uuid.UUID
+
+
+def build_payload(rows, rich):
+    now = datetime.datetime(2024, 1, 1, 12, 0, 0)
+    items = []
+    for i in range(rows):
+        item = {'id': i, 'name': f'user-{i}', 'tags': ['a', 'b', 'c'], 'active': i % 2 == 0}
+        if rich:
+            item['profile'] = Row(i, f'row-{i}', i * 1.5, now, uuid.UUID(int=i))
+        items.append(item)
+    return {'total': rows, 'items': items}
+
+
+def run(title, payload, candidates, repeat):
+    print(f'\n{title}')
+    print(f'{"engine":<24} {"dumps µs":>10} {"loads µs":>10} {"dumps x":>8}')
+    base = None
+    for label, dumps, loads in candidates:
+        encoded = dumps(payload)
+        dump_us = min(timeit.repeat(lambda: dumps(payload), number=repeat, repeat=3)) / repeat * 1e6
+        load_us = min(timeit.repeat(lambda: loads(encoded), number=repeat, repeat=3)) / repeat * 1e6
+        if base is None:
+            base = dump_us
+        print(f'{label:<24} {dump_us:>10.1f} {load_us:>10.1f} {base / dump_us:>7.1f}x')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=200)
+    parser.add_argument('--repeat', type=int, default=2000)
+    args = parser.parse_args()
+
+    def baseline_dumps(obj):
+        return json.dumps(obj, ensure_ascii=False, default=str).encode('utf-8')
+
+    candidates = [('json.dumps(default=str)', baseline_dumps, lambda data: json.loads(data.decode('utf-8')))]
+    for name in ('json', 'ujson', 'msgspec', 'orjson'):
+        try:
+            engine = load_json_engine(name)
+        except ImportError:
+            print(f'{name:<24} not installed')
+            continue
+        candidates.append((f'engine:{name}', engine.dumps, engine.loads))
+
+    run('plain payload', build_payload(args.rows, rich=False), candidates, args.repeat)
+    run('dataclass/datetime/UUID payload', build_payload(args.rows, rich=True), candidates, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -34,6 +34,10 @@ setup(
         'tornado': ['tornado'],
         'asgi': ['uvicorn'],
         'openapi': ['pyyaml'],
+        'brotli': ['brotli'],
+        'orjson': ['orjson'],
+        'msgpack': ['msgpack'],
+        'cbor': ['cbor2'],
         'full': ['tornado', 'uvicorn', 'pyyaml'],
     },
     python_requires='>=3.9'
@@ -6,7 +6,12 @@
 Author: Cullinan
 """
 
+import datetime
+import enum
 import unittest
+import uuid
+from decimal import Decimal
+from typing import Any, Dict, List, Literal, Optional, Set, Tuple, TypeVar
 
 from cullinan.web.params import (
     TypeConverter,
@@ -113,6 +118,84 @@ class TestTypeConverter(unittest.TestCase):
         self.assertFalse(TypeConverter.can_convert("abc", int))
 
 
+class Color(enum.Enum):
+    RED = 'red'
+    GREEN = 'green'
+
+
+class Point:
+    def __init__(self, x: float, y: float):
+        self.x = x
+        self.y = y
+
+
+class TestTypeConverterGenerics(unittest.TestCase):
+    """测试泛型与扩展类型转换"""
+
+    def tearDown(self):
+        TypeConverter.reset()
+
+    def test_convert_sequences(self):
+        """List / Set / Tuple 逐项转换"""
+        self.assertEqual(TypeConverter.convert("1,2,3", List[int]), [1, 2, 3])
+        self.assertEqual(TypeConverter.convert(["a", "b", "a"], Set[str]), {"a", "b"})
+        self.assertEqual(TypeConverter.convert("1,x", Tuple[int, str]), (1, "x"))
+        self.assertEqual(TypeConverter.convert("[1, 2]", Tuple[int, ...]), (1, 2))
+        self.assertEqual(TypeConverter.convert({"1": "2"}, Dict[int, int]), {1: 2})
+        with self.assertRaises(ConversionError):
+            TypeConverter.convert("1,x", List[int])
+        with self.assertRaises(ConversionError):
+            TypeConverter.convert("1", Tuple[int, int])
+
+    def test_convert_literal_and_enum(self):
+        """Literal / Enum 按值或成员名匹配"""
+        self.assertEqual(TypeConverter.convert("b", Literal["a", "b"]), "b")
+        self.assertEqual(TypeConverter.convert("2", Literal[1, 2]), 2)
+        self.assertIs(TypeConverter.convert("red", Color), Color.RED)
+        self.assertIs(TypeConverter.convert("GREEN", Color), Color.GREEN)
+        with self.assertRaises(ConversionError):
+            TypeConverter.convert("c", Literal["a", "b"])
+        with self.assertRaises(ConversionError):
+            TypeConverter.convert("blue", Color)
+
+    def test_convert_stdlib_types(self):
+        """datetime / UUID / Decimal"""
+        self.assertEqual(
+            TypeConverter.convert("2024-01-02T03:04:05Z", datetime.datetime),
+            datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+        )
+        self.assertEqual(TypeConverter.convert("2024-01-02", datetime.date), datetime.date(2024, 1, 2))
+        self.assertEqual(TypeConverter.convert("12:30", datetime.time), datetime.time(12, 30))
+        token = uuid.uuid4()
+        self.assertEqual(TypeConverter.convert(str(token), uuid.UUID), token)
+        self.assertEqual(TypeConverter.convert(0.1, Decimal), Decimal("0.1"))
+        self.assertEqual(TypeConverter.convert("5", Optional[int]), 5)
+        with self.assertRaises(ConversionError):
+            TypeConverter.convert("not-a-uuid", uuid.UUID)
+
+    def test_convert_any_and_typevar_pass_through(self):
+        """Any / TypeVar 原样返回"""
+        T = TypeVar("T")
+        self.assertEqual(TypeConverter.convert("abc", Any), "abc")
+        self.assertEqual(TypeConverter.convert("abc", T), "abc")
+        self.assertEqual(TypeConverter.convert(["1", 2], List[Any]), ["1", 2])
+
+    def test_generic_resolution_cached(self):
+        """参数化泛型只编译一次"""
+        first = TypeConverter.get_converter(List[int])
+        self.assertIs(TypeConverter.get_converter(List[int]), first)
+
+    def test_register_custom_converter(self):
+        """自定义转换函数同样用于泛型元素"""
+        TypeConverter.register(Point, lambda value: Point(*map(float, value.split(":"))))
+        point = TypeConverter.convert("1:2", Point)
+        self.assertEqual((point.x, point.y), (1.0, 2.0))
+        points = TypeConverter.convert(["1:2", point], List[Point])
+        self.assertIs(points[1], point)
+        self.assertTrue(TypeConverter.unregister(Point))
+        self.assertFalse(TypeConverter.unregister(Point))
+
+
 class TestAuto(unittest.TestCase):
     """测试自动类型推断"""
 
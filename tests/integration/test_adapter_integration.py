@@ -159,6 +159,34 @@ def test_asgi_adapter_surfaces_dispatcher_errors_as_http_responses():
     assert _json_body(events)["status"] == 400
 
 
+def test_asgi_request_path_reuses_driver_objects():
+    """Serving requests never asks the adapter for new driver objects."""
+    adapter = ASGIAdapter(dispatcher=_build_dispatcher(), global_headers=[["X-Powered-By", "cullinan"]])
+    app = adapter.create_app()
+    created = []
+    adapter.create_request_adapter = lambda: created.append("request_adapter")
+    adapter.create_response_writer = lambda: created.append("response_writer")
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/hello/bench",
+        "query_string": b"",
+        "headers": [(b"host", b"localhost:8000"), (b"accept", b"*/*")],
+        "server": ("localhost", 8000),
+        "client": ("127.0.0.1", 0),
+        "scheme": "http",
+    }
+
+    async def serve(count):
+        for _ in range(count):
+            events = await _dispatch_asgi(app, scope)
+            assert events[0]["status"] == 200
+
+    asyncio.run(serve(5))
+
+    assert created == []
+
+
 def test_tornado_adapter_creates_catch_all_application():
     tornado = pytest.importorskip("tornado.web")
     adapter = TornadoAdapter(dispatcher=_build_dispatcher(), settings={})
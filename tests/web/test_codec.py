@@ -6,8 +6,15 @@
 Author: Cullinan
 """
 
+import os
 import unittest
 import json
+import datetime
+import enum
+import uuid
+from dataclasses import dataclass
+from decimal import Decimal
+from unittest import mock
 
 from cullinan.codec import (
     BodyCodec,
@@ -20,7 +27,32 @@ from cullinan.codec import (
     CodecRegistry,
     get_codec_registry,
     reset_codec_registry,
+    JsonEngine,
+    get_json_engine,
+    set_json_engine,
+    reset_json_engine,
+    JsonArrayDecoder,
 )
+from cullinan.codec import (
+    MsgpackBodyCodec,
+    MsgpackResponseCodec,
+    CborBodyCodec,
+    CborResponseCodec,
+)
+from cullinan.codec.cbor_codec import load_cbor2
+from cullinan.codec.json_engine import ENGINE_ENV_VAR, StdlibJsonEngine, json_default, load_json_engine
+from cullinan.codec.msgpack_codec import load_msgpack
+from cullinan.web.gateway import ReturnValueHandler, WebRequest
+
+
+def _installed_engines():
+    engines = []
+    for name in ('orjson', 'msgspec', 'ujson', 'json'):
+        try:
+            engines.append(load_json_engine(name))
+        except ImportError:
+            continue
+    return engines
 
 
 class TestJsonBodyCodec(unittest.TestCase):
@@ -58,6 +90,19 @@ class TestJsonBodyCodec(unittest.TestCase):
         result = self.codec.decode(body, charset='utf-8')
         self.assertEqual(result, {"name": "中文"})
 
+    def test_encode_unserializable_raises_encode_error(self):
+        """无法序列化的对象应抛出 EncodeError，而不是被 str() 吞掉"""
+        self.assertEqual(
+            json.loads(self.codec.encode({'day': datetime.date(2024, 5, 1)})),
+            {'day': '2024-05-01'},
+        )
+        for engine in _installed_engines():
+            with self.subTest(engine=engine.name):
+                with mock.patch('cullinan.codec.json_codec.get_json_engine', return_value=engine):
+                    with self.assertRaises(EncodeError):
+                        self.codec.encode({'obj': object()})
+                    self.assertIn(b'object', JsonResponseCodec().encode({'obj': object()}))
+
     def test_supports_content_type(self):
         """Content-Type 支持检测"""
         self.assertTrue(JsonBodyCodec.supports('application/json'))
@@ -165,3 +210,241 @@ class TestCodecRegistry(unittest.TestCase):
         self.assertIn('application/json', content_type)
         self.assertEqual(json.loads(encoded.decode('utf-8')), data)
 
+
+
+class TestJsonEngine(unittest.TestCase):
+    """测试 JSON 引擎"""
+
+    def tearDown(self):
+        reset_json_engine()
+
+    def _engines(self):
+        return _installed_engines()
+
+    def test_engines_agree_on_rich_types(self):
+        """所有引擎对 dataclass/datetime/UUID 等的输出一致"""
+
+        class Color(enum.Enum):
+            RED = 'red'
+
+        @dataclass
+        class Point:
+            x: int
+            at: datetime.datetime
+
+        ident = uuid.UUID('12345678-1234-5678-1234-567812345678')
+        data = {
+            'point': Point(1, datetime.datetime(2024, 5, 1, 12, 30)),
+            'day': datetime.date(2024, 5, 1),
+            'id': ident,
+            'price': Decimal('9.90'),
+            'color': Color.RED,
+            'name': '名字',
+        }
+        expected = {
+            'point': {'x': 1, 'at': '2024-05-01T12:30:00'},
+            'day': '2024-05-01',
+            'id': str(ident),
+            'price': '9.90',
+            'color': 'red',
+            'name': '名字',
+        }
+        for engine in self._engines():
+            with self.subTest(engine=engine.name):
+                encoded = engine.dumps(data)
+                self.assertIsInstance(encoded, bytes)
+                self.assertIn('名字'.encode('utf-8'), encoded)
+                self.assertEqual(json.loads(encoded), expected)
+                self.assertEqual(engine.loads(encoded), expected)
+
+    def test_engine_interface_is_abstract(self):
+        """JsonEngine 子类必须实现 dumps/loads"""
+        with self.assertRaises(TypeError):
+            JsonEngine()
+
+        class DumpsOnly(JsonEngine):
+            def dumps(self, obj, default=json_default):
+                return b'null'
+
+        with self.assertRaises(TypeError):
+            DumpsOnly()
+
+    def test_invalid_json_raises_value_error(self):
+        """非法 JSON 统一抛出 ValueError"""
+        for engine in self._engines():
+            with self.subTest(engine=engine.name):
+                with self.assertRaises(ValueError):
+                    engine.loads(b'{not json')
+
+    def test_set_json_engine(self):
+        """可显式指定引擎"""
+        engine = set_json_engine('stdlib')
+        self.assertEqual(engine.name, 'json')
+        self.assertIs(get_json_engine(), engine)
+        self.assertEqual(JsonResponseCodec().encode({'a': 1}), b'{"a": 1}')
+        with self.assertRaises(ValueError):
+            set_json_engine('yaml')
+
+    def test_default_engine_keeps_stdlib_output(self):
+        """默认使用标准库输出格式，紧凑输出需显式开启"""
+        with mock.patch.dict(os.environ, {ENGINE_ENV_VAR: ''}):
+            reset_json_engine()
+            self.assertEqual(get_json_engine().name, 'json')
+            self.assertEqual(
+                JsonResponseCodec().encode({'a': 1, 'b': [1, 2]}),
+                json.dumps({'a': 1, 'b': [1, 2]}).encode('utf-8'),
+            )
+        self.assertEqual(StdlibJsonEngine(compact=True).dumps({'a': 1, 'b': [1, 2]}), b'{"a":1,"b":[1,2]}')
+
+    def test_auto_engine_picks_fastest_installed(self):
+        """auto 按 orjson → msgspec → ujson → json 顺序选择"""
+        fastest = next(iter(self._engines()))
+        self.assertEqual(load_json_engine('auto').name, fastest.name)
+        with mock.patch.dict(os.environ, {ENGINE_ENV_VAR: 'auto'}):
+            reset_json_engine()
+            self.assertEqual(get_json_engine().name, fastest.name)
+
+
+class TestJsonArrayDecoder(unittest.TestCase):
+    """测试流式 JSON 数组解码"""
+
+    def test_any_chunking(self):
+        """任意切分位置（含字符串内的转义与括号）结果一致"""
+        data = [{"s": 'a"b\\c]},[{', "n": [1, [2, {"k": "]"}]]}, 1, "x", None, True, -2.5, [], {}]
+        raw = json.dumps(data).encode()
+        for size in (1, 2, 3, 5, 8, len(raw)):
+            decoder = JsonArrayDecoder()
+            items = []
+            for i in range(0, len(raw), size):
+                items.extend(decoder.feed(raw[i:i + size]))
+            decoder.close()
+            self.assertEqual(items, data)
+
+    def test_malformed(self):
+        """非数组 / 不完整 / 多余数据抛出 DecodeError"""
+        for raw in (b'{"a": 1}', b'[1,', b'[1,]', b'[,1]', b'[1] x', b'[{"a":}]'):
+            decoder = JsonArrayDecoder()
+            with self.assertRaises(DecodeError, msg=raw):
+                decoder.feed(raw)
+                decoder.close()
+
+
+@unittest.skipIf(load_msgpack() is None, "msgpack is not installed")
+class TestMsgpackCodec(unittest.TestCase):
+    """测试 MessagePack 编解码"""
+
+    def test_roundtrip(self):
+        """编码后可解码回原数据"""
+        data = {"name": "测试", "items": [1, 2, 3], "blob": b"\x00\x01"}
+        encoded = MsgpackResponseCodec().encode(data)
+        self.assertEqual(MsgpackBodyCodec().decode(encoded), data)
+
+    def test_decode_invalid(self):
+        """非法数据抛出 DecodeError"""
+        with self.assertRaises(DecodeError):
+            MsgpackBodyCodec().decode(b"\xc1")
+
+
+@unittest.skipIf(load_cbor2() is None, "cbor2 is not installed")
+class TestCborCodec(unittest.TestCase):
+    """测试 CBOR 编解码"""
+
+    def test_roundtrip(self):
+        """编码后可解码回原数据"""
+        data = {"name": "测试", "items": [1, 2, 3], "blob": b"\x00\x01"}
+        encoded = CborResponseCodec().encode(data)
+        self.assertEqual(CborBodyCodec().decode(encoded), data)
+
+
+class _BinaryResponseCodec(ResponseCodec):
+    content_type = 'application/x-test-binary'
+    accept_types = ['application/x-test-binary']
+    priority = 30
+
+    def encode(self, data, charset='utf-8'):
+        return b"BIN" + json.dumps(data, sort_keys=True, default=json_default).encode()
+
+    def get_content_type(self, charset='utf-8'):
+        return self.content_type
+
+
+class TestResponseNegotiation(unittest.TestCase):
+    """测试响应内容协商"""
+
+    def setUp(self):
+        reset_codec_registry()
+        get_codec_registry().register_response_codec(_BinaryResponseCodec)
+
+    def tearDown(self):
+        reset_codec_registry()
+
+    def test_explicit_type_beats_wildcard(self):
+        """Accept 中显式列出的类型优先于通配符"""
+        registry = get_codec_registry()
+        self.assertIsInstance(registry.get_response_codec('*/*'), JsonResponseCodec)
+        self.assertIsInstance(
+            registry.get_response_codec('application/x-test-binary, */*;q=0.1'),
+            _BinaryResponseCodec,
+        )
+
+    def test_q_values_order_negotiation(self):
+        """按 q 值、具体程度排序，q=0 排除对应编码器"""
+        registry = get_codec_registry()
+        self.assertIsInstance(
+            registry.get_response_codec('application/json;q=0.5, application/x-test-binary'),
+            _BinaryResponseCodec,
+        )
+        self.assertIsInstance(
+            registry.get_response_codec('application/x-test-binary;q=0.2, application/*;q=0.9'),
+            JsonResponseCodec,
+        )
+        self.assertIsInstance(
+            registry.get_response_codec('application/json;q=0, */*'),
+            _BinaryResponseCodec,
+        )
+        self.assertIsNone(registry.get_response_codec('text/html'))
+
+    def test_lookups_are_memoised_and_invalidated(self):
+        """查找结果被缓存并共享实例，注册变化时失效"""
+        registry = get_codec_registry()
+        accept = 'application/x-test-binary'
+        first = registry.get_response_codec(accept)
+        self.assertIs(registry.get_response_codec(accept), first)
+        self.assertIs(registry.get_body_codec('application/json'), registry.get_body_codec('application/json'))
+
+        registry.unregister_response_codec(_BinaryResponseCodec)
+        self.assertIsNone(registry.get_response_codec(accept))
+        registry.register_response_codec(_BinaryResponseCodec)
+        self.assertIsInstance(registry.get_response_codec(accept), _BinaryResponseCodec)
+
+    def test_return_value_handler_uses_negotiated_codec(self):
+        """控制器返回 dict/dataclass 时按 Accept 选择编码"""
+
+        @dataclass
+        class Item:
+            id: int
+            name: str
+
+        handler = ReturnValueHandler()
+        binary = WebRequest(headers={'Accept': 'application/x-test-binary'})
+        response = handler.handle((Item(1, 'a'), 201), binary)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.content_type, 'application/x-test-binary')
+        self.assertEqual(response.render_body(), b'BIN{"id": 1, "name": "a"}')
+
+        default = handler.handle(Item(1, 'a'), WebRequest(headers={'Accept': '*/*'}))
+        self.assertEqual(default.content_type, 'application/json')
+        self.assertEqual(json.loads(default.render_body()), {'id': 1, 'name': 'a'})
+
+    def test_negotiated_responses_vary_on_accept(self):
+        """存在非 JSON 响应编码器时，结构化响应均带 Vary: Accept"""
+        handler = ReturnValueHandler()
+        binary = handler.handle({'id': 1}, WebRequest(headers={'Accept': 'application/x-test-binary'}))
+        self.assertEqual(binary.get_header('Vary'), 'Accept')
+        for request in (WebRequest(headers={'Accept': 'application/json'}), WebRequest(), None):
+            fallback = handler.handle({'id': 1}, request)
+            self.assertEqual(fallback.content_type, 'application/json')
+            self.assertEqual(fallback.get_header('Vary'), 'Accept')
+
+        get_codec_registry().unregister_response_codec(_BinaryResponseCodec)
+        self.assertIsNone(handler.handle({'id': 1}, WebRequest()).get_header('Vary'))
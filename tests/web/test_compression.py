@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import gzip
+import zlib
+
+import pytest
+
+from cullinan.web.gateway import (
+    CompressionMiddleware,
+    Dispatcher,
+    EventSourceResponse,
+    MiddlewarePipeline,
+    Router,
+    StreamingResponse,
+    WebRequest,
+    WebResponse,
+)
+from cullinan.web.gateway.compression import StreamEncoder, accepted_encodings, available_encoders
+
+
+def _dispatch(handler, accept_encoding="gzip", method="GET", **options):
+    router = Router()
+    router.add_route(method, "/r", handler=handler)
+    pipeline = MiddlewarePipeline()
+    pipeline.add(CompressionMiddleware(encodings=["gzip"], **options))
+    dispatcher = Dispatcher(router=router, pipeline=pipeline)
+    headers = {"Accept-Encoding": accept_encoding} if accept_encoding else {}
+    return asyncio.run(dispatcher.dispatch(WebRequest(method=method, path="/r", headers=headers)))
+
+
+async def _drain(response):
+    return b"".join([chunk async for chunk in response.iter_chunks()])
+
+
+def test_accept_encoding_negotiation_honours_q_values_and_wildcards():
+    supported = ["zstd", "br", "gzip"]
+
+    assert accepted_encodings("gzip, br", supported) == ["br", "gzip"]
+    assert accepted_encodings("gzip;q=1.0, br;q=0.5", supported) == ["gzip", "br"]
+    assert accepted_encodings("*;q=0.1, gzip;q=0", supported) == ["zstd", "br"]
+    assert accepted_encodings("identity", supported) == []
+    assert accepted_encodings(None, supported) == []
+
+
+def test_stream_encoders_implement_the_abstract_interface():
+    with pytest.raises(TypeError):
+        StreamEncoder()
+
+    class CompressOnly(StreamEncoder):
+        def compress(self, data):
+            return data
+
+    with pytest.raises(TypeError):
+        CompressOnly()
+
+    encoder = available_encoders()["gzip"]()
+    assert isinstance(encoder, StreamEncoder)
+    body = encoder.compress(b"hello") + encoder.flush() + encoder.finish()
+    assert gzip.decompress(body) == b"hello"
+
+
+def test_large_json_body_is_gzipped_with_vary_and_weak_etag():
+    payload = {"items": [{"id": i, "name": f"item-{i}"} for i in range(2000)]}
+
+    def handler():
+        response = WebResponse.json(payload)
+        response.set_header("ETag", '"v1"')
+        return response
+
+    response = _dispatch(handler)
+
+    assert response.get_header("Content-Encoding") == "gzip"
+    assert response.get_header("Vary") == "Accept-Encoding"
+    assert response.get_header("ETag") == 'W/"v1"'
+    assert response.content_type == "application/json"
+    plain = WebResponse.json(payload).render_body()
+    assert gzip.decompress(response.render_body()) == plain
+    assert len(response.render_body()) < len(plain) // 4
+
+
+def test_small_unlisted_or_unaccepted_bodies_are_left_alone():
+    small = _dispatch(lambda: WebResponse.text("hello"))
+    assert small.get_header("Content-Encoding") is None
+    assert small.get_header("Vary") == "Accept-Encoding"
+    assert small.render_body() == b"hello"
+
+    binary = _dispatch(lambda: WebResponse(body=b"\x00" * 4096, headers={"Content-Type": "image/png"}))
+    assert binary.get_header("Content-Encoding") is None
+    assert binary.get_header("Vary") is None
+
+    identity = _dispatch(lambda: WebResponse.text("x" * 4096), accept_encoding="identity")
+    assert identity.get_header("Content-Encoding") is None
+    assert identity.render_body() == b"x" * 4096
+
+    no_transform = _dispatch(
+        lambda: WebResponse.text("x" * 4096, headers={"Cache-Control": "no-transform"}),
+    )
+    assert no_transform.get_header("Content-Encoding") is None
+
+
+def test_streaming_response_is_compressed_chunk_by_chunk():
+    def handler():
+        return StreamingResponse(
+            (f"row,{i}\n" * 50 for i in range(10)),
+            content_type="text/csv",
+            headers={"Content-Length": "999"},
+        )
+
+    response = _dispatch(handler)
+
+    assert response.get_header("Content-Encoding") == "gzip"
+    assert response.get_header("Content-Length") is None
+    body = asyncio.run(_drain(response))
+    assert gzip.decompress(body) == "".join(f"row,{i}\n" * 50 for i in range(10)).encode()
+
+
+def test_event_stream_chunks_are_flushed_immediately():
+    async def events():
+        yield "first"
+        yield "second"
+
+    response = _dispatch(lambda: EventSourceResponse(events(), ping_interval=None))
+
+    async def first_chunk():
+        stream = response.iter_chunks()
+        chunk = await stream.__anext__()
+        await stream.aclose()
+        return chunk
+
+    decoder = zlib.decompressobj(31)
+    assert decoder.decompress(asyncio.run(first_chunk())) == b"data: first\n\n"
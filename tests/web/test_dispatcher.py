@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import inspect
+from dataclasses import dataclass
+from typing import List
+
+from cullinan.web.gateway import Dispatcher, InvocationPlan, Router, WebRequest, WebRuntime
+from cullinan.web.params import Body, Header, Path, Query
+
+
+def _dispatch(dispatcher, request):
+    return asyncio.run(dispatcher.dispatch(request))
+
+
+def test_param_system_handler_runs_precompiled_plan(monkeypatch):
+    def get_item(
+        item_id: int = Path(),
+        page: int = Query(default=1),
+        token: str = Header(alias="X-Token"),
+        name: str = Body(default="anon"),
+    ):
+        return {"id": item_id, "page": page, "token": token, "name": name}
+
+    router = Router()
+    entry = router.add_route("POST", "/items/{item_id}", handler=get_item)
+    dispatcher = Dispatcher(router=router)
+
+    assert dispatcher.compile_plans() == 1
+    plan = entry.invocation_plan
+    assert isinstance(plan, InvocationPlan)
+    assert plan.names == ("item_id", "page", "token", "name")
+    assert plan.body_mode == "dict"
+    assert plan.fallback is not None
+
+    def _no_reflection(*_args, **_kwargs):
+        raise AssertionError("signature inspected on the hot path")
+
+    monkeypatch.setattr(inspect, "signature", _no_reflection)
+
+    response = _dispatch(dispatcher, WebRequest(
+        method="POST",
+        path="/items/7",
+        query_string="page=3",
+        headers={"x-token": "abc", "Content-Type": "application/json"},
+        body=b'{"name": "widget"}',
+    ))
+
+    assert response.status_code == 200
+    assert response.get_body() == {"id": 7, "page": 3, "token": "abc", "name": "widget"}
+
+
+def test_convention_handler_plan_reads_request_sources():
+    def handler(request, item_id, query_params, body):
+        return {
+            "path": request.path,
+            "id": item_id,
+            "q": query_params,
+            "body": body,
+        }
+
+    router = Router()
+    entry = router.add_route("PUT", "/things/{item_id}", handler=handler)
+    dispatcher = Dispatcher(router=router)
+
+    response = _dispatch(dispatcher, WebRequest(
+        method="PUT",
+        path="/things/9",
+        query_string="a=1",
+        headers={"Content-Type": "application/json"},
+        body=b'{"x": 1}',
+    ))
+
+    assert entry.invocation_plan.fallback is None
+    assert entry.invocation_plan.body_mode == "parsed"
+    assert response.get_body() == {"path": "/things/9", "id": "9", "q": {"a": "1"}, "body": {"x": 1}}
+
+
+def test_param_plan_falls_back_to_convention_on_resolution_error():
+    def handler(item_id: int = Path()):
+        return {"id": item_id}
+
+    router = Router()
+    router.add_route("GET", "/n/{item_id}", handler=handler)
+    dispatcher = Dispatcher(router=router)
+
+    response = _dispatch(dispatcher, WebRequest(method="GET", path="/n/abc"))
+
+    assert response.get_body() == {"id": "abc"}
+
+
+@dataclass
+class _Row:
+    name: str
+    size: int = 0
+
+
+def test_model_list_body_binds_array_and_reports_item_errors():
+    def bulk(rows: List[_Row]):
+        return {"sizes": [row.size for row in rows]}
+
+    router = Router()
+    router.add_route("POST", "/rows", handler=bulk)
+    dispatcher = Dispatcher(router=router)
+    headers = {"Content-Type": "application/json"}
+
+    response = _dispatch(dispatcher, WebRequest(
+        method="POST", path="/rows", headers=headers,
+        body=b'[{"name": "a", "size": "3"}, {"name": "b"}]',
+    ))
+    assert response.get_body() == {"sizes": [3, 0]}
+
+    response = _dispatch(dispatcher, WebRequest(
+        method="POST", path="/rows", headers=headers,
+        body=b'[{"name": "a"}, {"size": 1}, 7]',
+    ))
+    assert response.status_code == 400
+    assert [error["index"] for error in response.get_body()["details"]] == [1, 2]
+
+
+def test_runtime_warmup_compiles_invocation_plans():
+    runtime = WebRuntime()
+    entry = runtime.router.add_route("GET", "/ping", handler=lambda: "pong")
+
+    runtime.warmup()
+
+    assert entry.invocation_plan is not None
+    assert entry.invocation_plan.extractors == ()
+
+
+def test_runtime_activation_pins_controller_instances(monkeypatch):
+    class ItemController:
+        def get(self, item_id):
+            return {"id": item_id, "owner": id(self)}
+
+    singleton = ItemController()
+    lookups = []
+
+    def lookup(controller_cls):
+        lookups.append(controller_cls)
+        return singleton
+
+    monkeypatch.setattr(Dispatcher, "_lookup_controller_instance", staticmethod(lookup))
+    WebRuntime.clear_active()
+    runtime = WebRuntime()
+    entry = runtime.router.add_route(
+        "GET", "/items/{item_id}", handler=ItemController.get, controller_cls=ItemController,
+    )
+
+    runtime.activate()
+    assert entry.controller_instance is singleton
+    assert lookups == [ItemController]
+
+    for _ in range(3):
+        response = _dispatch(runtime.dispatcher, WebRequest(method="GET", path="/items/1"))
+        assert response.get_body() == {"id": "1", "owner": id(singleton)}
+    assert lookups == [ItemController]
+
+    runtime.close()
+    assert entry.controller_instance is None
+    WebRuntime.clear_active()
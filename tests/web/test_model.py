@@ -6,14 +6,19 @@
 Author: Cullinan
 """
 
+import gc
 import unittest
-from dataclasses import dataclass
-from typing import Optional, List
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Optional, List
 
 from cullinan.web.params import (
+    ModelDecoder,
     ModelResolver,
     ModelError,
 )
+from cullinan.web.params.model import get_model_decoder
+from cullinan.web.params.model_handlers import DataclassHandler, ModelHandlerRegistry
 
 
 @dataclass
@@ -176,3 +181,113 @@ class TestModelResolverErrors(unittest.TestCase):
             self.assertIn('message', d)
             self.assertIn('field_errors', d)
 
+
+
+@dataclass
+class OrderLine:
+    sku: str
+    quantity: int = 1
+
+
+@dataclass
+class Order:
+    id: int
+    lines: List[OrderLine]
+    billing: Optional[Address] = None
+    tags: List[str] = field(default_factory=list)
+    total: float = field(default=0.0, init=False)
+
+
+@dataclass
+class Event:
+    name: str
+    payload: Any = None
+
+
+@dataclass
+class TreeNode:
+    value: int
+    children: List['TreeNode'] = field(default_factory=list)
+
+
+class TestModelDecoder(unittest.TestCase):
+    """测试预编译解码器"""
+
+    def test_decoder_is_compiled_once(self):
+        """同一模型复用同一个解码器"""
+        decoder = ModelResolver.get_decoder(Order)
+        self.assertIs(ModelResolver.get_decoder(Order), decoder)
+        self.assertIsInstance(decoder, ModelDecoder)
+        self.assertEqual([plan.name for plan in decoder.fields], ['id', 'lines', 'billing', 'tags'])
+
+    def test_list_and_optional_nested_models(self):
+        """List[dataclass] 与 Optional[dataclass] 字段"""
+        order = ModelResolver.resolve(Order, {
+            'id': '7',
+            'lines': [{'sku': 'a', 'quantity': '2'}, OrderLine(sku='b')],
+            'billing': {'city': 'Beijing', 'street': 'Main Street'},
+        })
+        self.assertEqual(order.id, 7)
+        self.assertEqual(order.lines, [OrderLine('a', 2), OrderLine('b', 1)])
+        self.assertEqual(order.billing, Address('Beijing', 'Main Street'))
+        self.assertEqual(order.tags, [])
+        self.assertEqual(order.total, 0.0)
+
+        self.assertIsNone(ModelResolver.resolve(Order, {'id': 1, 'lines': [], 'billing': None}).billing)
+
+    def test_list_item_error_reports_index(self):
+        """列表元素错误包含下标"""
+        with self.assertRaises(ModelError) as ctx:
+            ModelResolver.resolve(Order, {'id': 1, 'lines': [{'sku': 'a'}, {'quantity': 3}]})
+        error = ctx.exception.field_errors[0]
+        self.assertEqual(error['field'], 'lines')
+        self.assertTrue(error['error'].startswith('[1] '))
+
+    def test_self_referencing_model(self):
+        """自引用模型"""
+        tree = ModelResolver.resolve(TreeNode, {
+            'value': 1,
+            'children': [{'value': 2, 'children': [{'value': 3}]}],
+        })
+        self.assertEqual(tree.children[0].children[0].value, 3)
+
+    def test_any_field_passes_through(self):
+        """Any 字段原样透传"""
+        payload = {'id': '1', 'tags': ['a']}
+        event = ModelResolver.resolve(Event, {'name': 'created', 'payload': payload})
+        self.assertIs(event.payload, payload)
+        self.assertEqual(ModelResolver.resolve(Event, {'name': 'n', 'payload': 'abc'}).payload, 'abc')
+        # 自定义标量转换函数不会收到 Any
+        event = DataclassHandler().resolve(Event, {'name': 'created', 'payload': payload})
+        self.assertIs(event.payload, payload)
+
+    def test_decoder_cache_releases_model_class(self):
+        """模型类被回收后解码器缓存不再持有它"""
+        @dataclass
+        class Node:
+            value: int
+            parent: 'Node' = None
+
+        # 局部类无法按名称解析前向引用；typing 泛型自身有缓存，这里直接引用类
+        Node.__annotations__['parent'] = Node
+        decoder = get_model_decoder(Node, DataclassHandler()._convert_value)
+        self.assertEqual(decoder({'value': '1', 'parent': {'value': 2}}).parent.value, 2)
+
+        ref = weakref.ref(Node)
+        del Node, decoder
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_handler_registry_changes_clear_decoders(self):
+        """处理器注册 / 注销后重新编译解码器"""
+        handler = DataclassHandler()
+        decoder = get_model_decoder(Order, handler._convert_value)
+        self.assertIs(get_model_decoder(Order, handler._convert_value), decoder)
+
+        registry = ModelHandlerRegistry()
+        registry.register(handler)
+        registered = get_model_decoder(Order, handler._convert_value)
+        self.assertIsNot(registered, decoder)
+
+        registry.unregister(handler)
+        self.assertIsNot(get_model_decoder(Order, handler._convert_value), registered)
@@ -0,0 +1,361 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+
+import pytest
+
+from cullinan.codec import DecodeError, reset_json_engine, set_json_engine
+from cullinan.codec.json_engine import StdlibJsonEngine
+from cullinan.transport.adapter import ASGIAdapter
+from cullinan.web.gateway import (
+    Dispatcher,
+    LegacyMiddlewareBridge,
+    MiddlewarePipeline,
+    Router,
+    WebRequest,
+    stream_request_body,
+)
+from cullinan.web.middleware import BodyDecoderMiddleware, MiddlewareChain, get_decoded_body
+from cullinan.web.params import Body
+
+
+def _call(app, method, path, messages, headers=()):
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "headers": list(headers),
+        "query_string": b"",
+        "client": ("127.0.0.1", 9000),
+        "server": ("localhost", 8080),
+        "scheme": "http",
+    }
+    pending = list(messages)
+    events = []
+
+    async def receive():
+        return pending.pop(0)
+
+    async def send(event):
+        events.append(event)
+
+    asyncio.run(app(scope, receive, send))
+    status = events[0]["status"]
+    body = b"".join(event.get("body", b"") for event in events[1:])
+    return status, body
+
+
+def _chunks(*parts):
+    return [
+        {"type": "http.request", "body": part, "more_body": i < len(parts) - 1}
+        for i, part in enumerate(parts)
+    ]
+
+
+def test_multi_message_body_is_joined_for_buffered_handlers():
+    router = Router()
+    router.add_route("POST", "/echo", handler=lambda request: request.body.decode())
+    app = ASGIAdapter(Dispatcher(router=router)).create_app()
+
+    status, body = _call(app, "POST", "/echo", _chunks(b"hel", b"lo ", b"world"))
+
+    assert status == 200
+    assert body == b"hello world"
+
+
+def test_streaming_handler_receives_chunks_incrementally():
+    seen = []
+
+    @stream_request_body
+    async def upload(request):
+        async for chunk in request.stream():
+            seen.append(chunk)
+        return {"chunks": len(seen)}
+
+    router = Router()
+    router.add_route("POST", "/upload", handler=upload)
+    app = ASGIAdapter(Dispatcher(router=router)).create_app()
+
+    status, _ = _call(app, "POST", "/upload", _chunks(b"a" * 10, b"b" * 10, b"c" * 10))
+
+    assert status == 200
+    assert seen == [b"a" * 10, b"b" * 10, b"c" * 10]
+
+
+def _counting_router():
+    router = Router()
+    matches = []
+    match = router.match
+
+    def counting_match(method, path):
+        matches.append(path)
+        return match(method, path)
+
+    router.match = counting_match
+    return router, matches
+
+
+def test_middleware_reads_multi_message_body_before_dispatch():
+    seen = []
+
+    async def audit(request, call_next):
+        seen.append(request.body)
+        return await call_next(request)
+
+    router, matches = _counting_router()
+    router.add_route("POST", "/echo", handler=lambda request: request.body.decode())
+    pipeline = MiddlewarePipeline()
+    pipeline.add(audit)
+    app = ASGIAdapter(Dispatcher(router=router, pipeline=pipeline)).create_app()
+
+    status, body = _call(app, "POST", "/echo", _chunks(b"hel", b"lo"))
+
+    assert status == 200
+    assert body == b"hello"
+    assert seen == [b"hello"]
+    assert matches == ["/echo"]
+
+
+def test_streaming_route_is_matched_once_and_left_unread_for_middleware():
+    loaded = []
+    seen = []
+
+    @stream_request_body
+    async def upload(request):
+        async for chunk in request.stream():
+            seen.append(chunk)
+        return {"chunks": len(seen)}
+
+    async def observe(request, call_next):
+        loaded.append(request.body_loaded)
+        return await call_next(request)
+
+    router, matches = _counting_router()
+    router.add_route("POST", "/upload", handler=upload)
+    pipeline = MiddlewarePipeline()
+    pipeline.add(observe)
+    app = ASGIAdapter(Dispatcher(router=router, pipeline=pipeline)).create_app()
+
+    status, _ = _call(app, "POST", "/upload", _chunks(b"a" * 10, b"b" * 10))
+
+    assert status == 200
+    assert loaded == [False]
+    assert seen == [b"a" * 10, b"b" * 10]
+    assert matches == ["/upload"]
+
+
+def test_legacy_middleware_does_not_buffer_streaming_routes():
+    seen = []
+
+    @stream_request_body
+    async def upload(request):
+        async for chunk in request.stream():
+            seen.append(chunk)
+        return {"chunks": len(seen)}
+
+    chain = MiddlewareChain()
+    chain.add(BodyDecoderMiddleware())
+    pipeline = MiddlewarePipeline()
+    pipeline.add(LegacyMiddlewareBridge(chain))
+    router = Router()
+    router.add_route("POST", "/upload", handler=upload)
+    router.add_route("POST", "/echo", handler=lambda request: get_decoded_body(request))
+    app = ASGIAdapter(Dispatcher(router=router, pipeline=pipeline)).create_app()
+
+    assert _call(app, "POST", "/upload", _chunks(b"a" * 10, b"b" * 10))[0] == 200
+    assert seen == [b"a" * 10, b"b" * 10]
+
+    status, body = _call(
+        app, "POST", "/echo", _chunks(b'{"name": ', b'"widget"}'),
+        headers=[(b"content-type", b"application/json")],
+    )
+    assert status == 200
+    assert body == b'{"name": "widget"}'
+
+
+def test_path_rewritten_by_middleware_is_matched_again():
+    seen = []
+
+    @stream_request_body
+    async def upload(request):
+        async for chunk in request.stream():
+            seen.append(chunk)
+        return {"chunks": len(seen)}
+
+    async def rewrite(request, call_next):
+        request.path = {"/legacy-upload": "/upload", "/upload-v1": "/echo"}.get(request.path, request.path)
+        return await call_next(request)
+
+    router, matches = _counting_router()
+    router.add_route("POST", "/upload", handler=upload)
+    router.add_route("POST", "/legacy-upload", handler=lambda request: request.body)
+    router.add_route("POST", "/upload-v1", handler=upload)
+    router.add_route("POST", "/echo", handler=lambda request: request.body.decode())
+    pipeline = MiddlewarePipeline()
+    pipeline.add(rewrite)
+    app = ASGIAdapter(Dispatcher(router=router, pipeline=pipeline)).create_app()
+
+    # Buffered before the rewrite: the streaming route gets one chunk.
+    status, _ = _call(app, "POST", "/legacy-upload", _chunks(b"a" * 10, b"b" * 10))
+    assert status == 200
+    assert seen == [b"a" * 10 + b"b" * 10]
+    assert matches == ["/legacy-upload", "/upload"]
+
+    # Left unread for a streaming route, then buffered for the rewritten one.
+    matches.clear()
+    assert _call(app, "POST", "/upload-v1", _chunks(b"hel", b"lo")) == (200, b"hello")
+    assert matches == ["/upload-v1", "/echo"]
+
+
+def test_declared_content_length_over_limit_is_rejected_early():
+    router = Router()
+    router.add_route("POST", "/echo", handler=lambda request: "unreachable")
+    app = ASGIAdapter(Dispatcher(router=router), max_body_size=8).create_app()
+
+    status, _ = _call(
+        app, "POST", "/echo", [], headers=[(b"content-length", b"100")],
+    )
+
+    assert status == 413
+
+
+def test_early_413_goes_through_the_response_writer():
+    router = Router()
+    router.add_route("POST", "/echo", handler=lambda request: "unreachable")
+    adapter = ASGIAdapter(
+        Dispatcher(router=router), global_headers=[["X-Powered-By", "cullinan"]], max_body_size=8,
+    )
+    written = []
+    writer = adapter.create_response_writer()
+    write_response = writer.write_response
+
+    async def recording_write(response, send, *args, **kwargs):
+        written.append(response.status_code)
+        await write_response(response, send, *args, **kwargs)
+
+    writer.write_response = recording_write
+    app = adapter.create_app()
+    events = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"123456789", "more_body": False}
+
+    async def send(event):
+        events.append(event)
+
+    for headers in ([(b"content-length", b"100")], []):
+        events.clear()
+        scope = {
+            "type": "http", "method": "POST", "path": "/echo", "headers": headers,
+            "query_string": b"", "server": ("localhost", 8080), "scheme": "http",
+        }
+        asyncio.run(app(scope, receive, send))
+        assert events[0]["status"] == 413
+        assert [b"X-Powered-By", b"cullinan"] in events[0]["headers"]
+
+    assert written == [413, 413]
+
+
+def test_streamed_body_over_limit_returns_413():
+    @stream_request_body
+    async def upload(request):
+        async for _chunk in request.stream():
+            pass
+        return "done"
+
+    router = Router()
+    router.add_route("POST", "/upload", handler=upload)
+    router.add_route("POST", "/echo", handler=lambda request: request.body)
+    app = ASGIAdapter(Dispatcher(router=router), max_body_size=8).create_app()
+
+    assert _call(app, "POST", "/upload", _chunks(b"12345", b"67890"))[0] == 413
+    assert _call(app, "POST", "/echo", _chunks(b"12345", b"67890"))[0] == 413
+    assert _call(app, "POST", "/echo", _chunks(b"1234", b"5678"))[0] == 200
+
+
+def test_web_request_bytes_buffers_stream_once():
+    async def source():
+        yield b"x"
+        yield b"y"
+
+    request = WebRequest(method="POST", path="/", body_stream=source())
+    assert request.body_loaded is False
+
+    assert asyncio.run(request.bytes()) == b"xy"
+    assert request.body_loaded is True
+    assert request.body == b"xy"
+
+
+class _CountingEngine(StdlibJsonEngine):
+    def __init__(self):
+        super().__init__()
+        self.loads_calls = 0
+
+    def loads(self, data):
+        self.loads_calls += 1
+        return super().loads(data)
+
+
+def test_json_body_is_decoded_once_per_request():
+    engine = _CountingEngine()
+    set_json_engine(engine)
+    seen = {}
+
+    def create(name: str = Body(), size: int = Body(default=0)):
+        return {"name": name, "size": size}
+
+    async def inspect_body(request, call_next):
+        response = await call_next(request)
+        seen["json"] = await request.json()
+        seen["decoded"] = get_decoded_body(request)
+        return response
+
+    chain = MiddlewareChain()
+    chain.add(BodyDecoderMiddleware())
+    pipeline = MiddlewarePipeline()
+    pipeline.add(LegacyMiddlewareBridge(chain))
+    pipeline.add(inspect_body)
+    router = Router()
+    router.add_route("POST", "/items", handler=create)
+    dispatcher = Dispatcher(router=router, pipeline=pipeline)
+    request = WebRequest(
+        method="POST",
+        path="/items",
+        headers={"Content-Type": "application/json"},
+        body=b'{"name": "widget", "size": 3, "blob": "' + b"x" * 1_000_000 + b'"}',
+    )
+
+    try:
+        response = asyncio.run(dispatcher.dispatch(request))
+    finally:
+        reset_json_engine()
+
+    assert response.status_code == 200
+    assert response.get_body() == {"name": "widget", "size": 3}
+    assert seen["json"] is seen["decoded"]
+    assert engine.loads_calls == 1
+
+
+def test_decoded_body_uses_codec_for_content_type_and_caches_errors():
+    form = WebRequest(
+        method="POST",
+        path="/",
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+        body=b"a=1&b=2&b=3",
+    )
+    assert form.decoded_body() == {"a": "1", "b": ["2", "3"]}
+
+    array = WebRequest(method="POST", path="/", headers={"Content-Type": "application/json"}, body=b"[1, 2]")
+    assert array.decoded_body() == {"_value": [1, 2]}
+    assert asyncio.run(array.json()) == [1, 2]
+
+    broken = WebRequest(method="POST", path="/", headers={"Content-Type": "application/json"}, body=b"{oops")
+    with pytest.raises(DecodeError):
+        broken.decoded_body()
+    with pytest.raises(DecodeError):
+        broken.decoded_body()
+    with pytest.raises(ValueError):
+        asyncio.run(broken.json())
+
+    broken.body = b'{"fixed": true}'
+    assert broken.decoded_body() == {"fixed": True}
@@ -6,9 +6,12 @@
 Author: Cullinan
 """
 
+import asyncio
+import gc
+import json
 import unittest
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional
 
 from cullinan.web.params import (
     ParamResolver,
@@ -19,6 +22,9 @@ from cullinan.web.params import (
     Header,
     DynamicBody,
     AutoType,
+    DataclassHandler,
+    get_model_handler_registry,
+    stream_models,
 )
 
 
@@ -277,3 +283,147 @@ class TestParamResolverCache(unittest.TestCase):
         ParamResolver.clear_cache()
         self.assertNotIn(func_with_path_params, ParamResolver._signature_cache)
 
+    def test_analysis_cache(self):
+        """参数分析按函数缓存并统计命中"""
+        ParamResolver.clear_cache()
+        config = ParamResolver.analyze_params(func_with_query_params)
+        self.assertIs(ParamResolver.analyze_params(func_with_query_params), config)
+        ParamResolver.resolve(func_with_query_params, request=None, query_params={'page': '2'})
+        self.assertEqual(ParamResolver.cache_stats(), {'hits': 2, 'misses': 1, 'size': 1})
+
+    def test_analysis_cache_weak_keys(self):
+        """函数被回收后缓存项随之移除"""
+        ParamResolver.clear_cache()
+
+        def handler(self, page: Query(int, default=1)):
+            pass
+
+        ParamResolver.analyze_params(handler)
+        self.assertEqual(ParamResolver.cache_stats()['size'], 1)
+        del handler
+        gc.collect()
+        self.assertEqual(ParamResolver.cache_stats()['size'], 0)
+
+    def test_analysis_invalidated_by_registry(self):
+        """模型处理器注册表变更时缓存失效"""
+        registry = get_model_handler_registry()
+        config = ParamResolver.analyze_params(func_with_dataclass)
+
+        class CustomHandler(DataclassHandler):
+            priority = 99
+            name = 'custom'
+
+        handler = CustomHandler()
+        registry.register(handler)
+        try:
+            self.assertEqual(ParamResolver.cache_stats()['size'], 0)
+            updated = ParamResolver.analyze_params(func_with_dataclass)
+            self.assertIsNot(updated, config)
+            self.assertIs(updated['user']['model_handler'], handler)
+        finally:
+            registry.unregister(handler)
+        self.assertIsNot(ParamResolver.analyze_params(func_with_dataclass)['user']['model_handler'], handler)
+
+
+
+@dataclass
+class LineItem:
+    sku: str
+    qty: int = 1
+
+
+def func_with_model_list(self, items: List[LineItem]):
+    pass
+
+
+def func_with_model_list_field(self, order_id: Body(int), items: List[LineItem] = Body()):
+    pass
+
+
+class TestParamResolverModelList(unittest.TestCase):
+    """测试 List[Model] 批量绑定"""
+
+    def test_analyze_model_list(self):
+        """List[Model] 绑定整个请求体"""
+        config = ParamResolver.analyze_params(func_with_model_list)
+        self.assertEqual(config['items']['source'], 'body')
+        self.assertIs(config['items']['model_list'], LineItem)
+
+    def test_resolve_json_array_body(self):
+        """JSON 数组请求体解析为模型列表（含解码层的 _value 包装）"""
+        items = [{'sku': 'a', 'qty': '2'}, {'sku': 'b'}]
+        for body_data in (items, {'_value': items}):
+            result = ParamResolver.resolve(func_with_model_list, request=None, body_data=body_data)
+            self.assertEqual(result['items'], [LineItem('a', 2), LineItem('b', 1)])
+
+        extract = ParamResolver.compile_param('items', ParamResolver.analyze_params(func_with_model_list)['items'])
+        self.assertEqual(extract({}, {}, {'_value': items}, {}, {}, None), [LineItem('a', 2), LineItem('b', 1)])
+
+    def test_per_index_errors_collected(self):
+        """所有元素的错误汇总到一个 ResolveError"""
+        body = {'_value': [{'sku': 'a'}, {'qty': 3}, 'oops', {}]}
+        with self.assertRaises(ResolveError) as ctx:
+            ParamResolver.resolve(func_with_model_list, request=None, body_data=body)
+        errors = ctx.exception.errors
+        self.assertEqual([e['index'] for e in errors], [1, 2, 3])
+        self.assertTrue(all(e['param'] == 'items' for e in errors))
+        self.assertEqual(errors[0]['field'], 'sku')
+
+    def test_body_field_model_list(self):
+        """Body() 声明的 List[Model] 取请求体中的同名字段"""
+        result = ParamResolver.resolve(
+            func_with_model_list_field,
+            request=None,
+            body_data={'order_id': '9', 'items': [{'sku': 'x', 'qty': 4}]},
+        )
+        self.assertEqual(result['order_id'], 9)
+        self.assertEqual(result['items'], [LineItem('x', 4)])
+
+    def test_object_body_rejected(self):
+        """请求体不是数组时报错"""
+        with self.assertRaises(ResolveError) as ctx:
+            ParamResolver.resolve(func_with_model_list, request=None, body_data={'sku': 'a'})
+        self.assertEqual(ctx.exception.errors[0]['param'], 'items')
+
+
+class TestStreamModels(unittest.TestCase):
+    """测试流式解析 JSON 数组请求体"""
+
+    @staticmethod
+    def _collect(chunks, model_class, **kwargs):
+        async def source():
+            for chunk in chunks:
+                yield chunk
+
+        async def run():
+            return [item async for item in stream_models(source(), model_class, **kwargs)]
+
+        return asyncio.run(run())
+
+    def test_stream_chunked_array(self):
+        """任意切分的数组逐个解析为模型"""
+        raw = json.dumps([{'sku': f's{i}', 'qty': i} for i in range(100)]).encode()
+        chunks = [raw[i:i + 7] for i in range(0, len(raw), 7)]
+        result = self._collect(chunks, LineItem)
+        self.assertEqual(len(result), 100)
+        self.assertEqual(result[42], LineItem('s42', 42))
+
+    def test_stream_errors_raised_after_array(self):
+        """失败元素被跳过，数组读完后统一抛出 ResolveError"""
+        produced = []
+
+        async def run():
+            async def source():
+                yield b'[{"sku": "a"}, {"qty": 1}, {"sku": "c"}]'
+            async for item in stream_models(source(), LineItem):
+                produced.append(item)
+
+        with self.assertRaises(ResolveError) as ctx:
+            asyncio.run(run())
+        self.assertEqual(produced, [LineItem('a'), LineItem('c')])
+        self.assertEqual([e['index'] for e in ctx.exception.errors], [1])
+
+    def test_stream_item_size_limit(self):
+        """超过 max_item_size 的元素报错"""
+        with self.assertRaises(ResolveError):
+            self._collect([b'[{"sku": "' + b'x' * 100 + b'"}]'], LineItem, max_item_size=32)
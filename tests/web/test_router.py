@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+from cullinan.web.gateway import Router, WebRuntime
+
+
+def _build_router() -> Router:
+    router = Router()
+    router.add_route("GET", "/api/users", handler=lambda: "list")
+    router.add_route("GET", "/api/users/{id}", handler=lambda: "get")
+    router.add_route("GET", "/api/users/me", handler=lambda: "me")
+    router.add_route("GET", "/api/users/{id}/posts/{post_id}", handler=lambda: "post")
+    router.add_route("GET", "/api/files/{num:\\d+}/raw", handler=lambda: "raw")
+    router.add_route("GET", "/api/files/**", handler=lambda: "files")
+    router.add_route("*", "/any", handler=lambda: "any")
+    router.add_route("GET", "/a/{x}/c", handler=lambda: "axc")
+    router.add_route("GET", "/a/b/d", handler=lambda: "abd")
+    return router
+
+
+_CASES = [
+    ("GET", "/api/users"),
+    ("GET", "/api/users/42"),
+    ("GET", "/api/users/me"),
+    ("GET", "/api/users/42/posts/7"),
+    ("GET", "/api/files/12/raw"),
+    ("GET", "/api/files/abc/raw"),
+    ("GET", "/api/files/x/y/z"),
+    ("DELETE", "/any"),
+    ("GET", "/a/b/c"),
+    ("GET", "/a/b/d"),
+    ("GET", "/missing"),
+    ("POST", "/api/users"),
+]
+
+
+def _describe(match):
+    if match is None:
+        return None
+    return match.entry.path, match.entry.method, match.path_params
+
+
+def test_compiled_matcher_agrees_with_trie_walk():
+    router = _build_router()
+    expected = [_describe(router.match(method, path)) for method, path in _CASES]
+
+    router.freeze()
+    assert router.is_frozen is True
+    actual = [_describe(router.match(method, path)) for method, path in _CASES]
+
+    assert actual == expected
+    assert actual[8] == ("/a/{x}/c", "GET", {"x": "b"})
+    assert actual[6] == ("/api/files/**", "GET", {"_wildcard": "x/y/z"})
+
+
+def test_compiled_matcher_returns_independent_params():
+    router = _build_router()
+    router.freeze()
+
+    first = router.match("GET", "/api/users/1")
+    first.path_params["id"] = "mutated"
+    second = router.match("GET", "/api/users/1")
+
+    assert second.path_params == {"id": "1"}
+
+
+def test_compiled_matcher_handles_deep_paths_and_many_routes():
+    router = Router()
+    for i in range(2000):
+        router.add_route("GET", f"/svc{i}/items/{{item}}", handler=lambda: None)
+    deep = "/".join(f"{{p{i}}}" for i in range(200))
+    router.add_route("GET", "/deep/" + deep, handler=lambda: None)
+    router.freeze()
+
+    match = router.match("GET", "/svc1999/items/abc")
+    assert match is not None and match.path_params == {"item": "abc"}
+
+    deep_path = "/deep/" + "/".join(str(i) for i in range(200))
+    match = router.match("GET", deep_path)
+    assert match is not None
+    assert match.path_params["p0"] == "0"
+    assert match.path_params["p199"] == "199"
+
+
+def test_add_route_after_freeze_drops_compiled_matcher():
+    router = _build_router()
+    router.freeze()
+
+    router.add_route("GET", "/late", handler=lambda: "late")
+
+    assert router.is_frozen is False
+    assert router.match("GET", "/late") is not None
+
+
+def test_runtime_warmup_freezes_router():
+    runtime = WebRuntime()
+    runtime.router.add_route("GET", "/health", handler=lambda: "ok")
+
+    runtime.warmup()
+
+    assert runtime.router.is_frozen is True
+
+
+def test_static_routes_are_served_from_exact_match_index():
+    router = _build_router()
+
+    assert router.static_route_count() == 4
+    match = router.match("get", "/api/users/me")
+    assert match.entry.path == "/api/users/me"
+    assert match.path_params == {}
+    assert router.match("PATCH", "/any").entry.method == "*"
+    # Non-canonical spellings still resolve through the trie.
+    assert router.match("GET", "api//users").entry.path == "/api/users"
+
+
+def test_match_cache_counts_hits_and_evicts_least_recent():
+    router = Router(match_cache_size=2)
+    router.add_route("GET", "/users/{id}", handler=lambda: None)
+    router.add_route("GET", "/health", handler=lambda: None)
+
+    router.match("GET", "/health")
+    assert router.match_cache_stats()["misses"] == 0
+
+    first = router.match("GET", "/users/1")
+    first.path_params["id"] = "mutated"
+    assert router.match("GET", "/users/1").path_params == {"id": "1"}
+    router.match("GET", "/users/2")
+    router.match("GET", "/users/3")
+
+    stats = router.match_cache_stats()
+    assert stats == {"hits": 1, "misses": 3, "size": 2, "capacity": 2}
+
+    router.match("GET", "/users/1")
+    assert router.match_cache_stats()["misses"] == 4
+
+    router.add_route("GET", "/users/{id}/posts", handler=lambda: None)
+    assert router.match_cache_stats()["size"] == 0
@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import socket
+import threading
+import time
+
+import pytest
+
+from cullinan.transport.adapter import ASGIAdapter, TornadoAdapter
+from cullinan.web.gateway import (
+    Dispatcher,
+    EventSourceResponse,
+    Router,
+    ServerSentEvent,
+)
+
+
+def _run_asgi(app, path, headers=(), on_send=None, disconnect_after=None):
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "headers": list(headers),
+        "query_string": b"",
+        "client": ("127.0.0.1", 9000),
+        "server": ("localhost", 8080),
+        "scheme": "http",
+    }
+    events = []
+    received = []
+    gone = None
+
+    async def receive():
+        nonlocal gone
+        if received:
+            if gone is None:
+                gone = asyncio.Event()
+            await gone.wait()
+            return {"type": "http.disconnect"}
+        received.append(True)
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(event):
+        events.append(event)
+        if on_send is not None:
+            on_send(event)
+        if disconnect_after is not None and len(events) > disconnect_after and gone is not None:
+            gone.set()
+        await asyncio.sleep(0)
+
+    asyncio.run(app(scope, receive, send))
+    return events
+
+
+def _app(router):
+    return ASGIAdapter(Dispatcher(router=router)).create_app()
+
+
+def test_server_sent_event_encoding():
+    event = ServerSentEvent(data="line1\nline2", event="update", id=7, retry=1000)
+
+    assert event.encode() == b"id: 7\nevent: update\nretry: 1000\ndata: line1\ndata: line2\n\n"
+    assert ServerSentEvent(data={"a": 1}).encode() == b'data: {"a": 1}\n\n'
+    assert ServerSentEvent(comment="hi").encode() == b": hi\n\n"
+
+
+def test_server_sent_event_splits_only_on_sse_line_breaks():
+    payload = "a\x0cb\x0bc\x1cd\x85e\u2028f"
+    assert ServerSentEvent(data=payload).encode() == f"data: {payload}\n\n".encode("utf-8")
+    assert ServerSentEvent(data="a\r\nb\rc\nd").encode() == b"data: a\ndata: b\ndata: c\ndata: d\n\n"
+    assert ServerSentEvent(data="").encode() == b"data: \n\n"
+    assert ServerSentEvent(comment="x\ry").encode() == b": x\n: y\n\n"
+
+
+@pytest.mark.parametrize("fields", [
+    {"id": "1\nevent: evil"},
+    {"id": "1\r2"},
+    {"id": "1\x002"},
+    {"event": "e\r\ndata: inj"},
+    {"event": "e\ndata: inj"},
+])
+def test_server_sent_event_rejects_field_injection(fields):
+    with pytest.raises(ValueError):
+        ServerSentEvent(data="x", **fields)
+
+
+def test_async_generator_handler_is_served_as_event_stream():
+    async def events():
+        yield {"progress": 50}
+        yield ServerSentEvent(data="done", event="finished", id="2")
+
+    router = Router()
+    router.add_route("GET", "/jobs/events", handler=events)
+
+    sent = _run_asgi(_app(router), "/jobs/events")
+
+    headers = {name.lower(): value for name, value in sent[0]["headers"]}
+    assert headers[b"content-type"] == b"text/event-stream; charset=utf-8"
+    assert headers[b"cache-control"] == b"no-cache"
+    body = b"".join(e.get("body", b"") for e in sent[1:])
+    assert body == b'data: {"progress": 50}\n\nid: 2\nevent: finished\ndata: done\n\n'
+
+
+def test_idle_stream_sends_heartbeat_pings():
+    async def slow():
+        await asyncio.sleep(0.05)
+        yield "tick"
+
+    router = Router()
+    router.add_route(
+        "GET", "/ticks", handler=lambda: EventSourceResponse(slow(), ping_interval=0.01),
+    )
+
+    chunks = [e["body"] for e in _run_asgi(_app(router), "/ticks")[1:] if e.get("body")]
+
+    assert b": ping\n\n" in chunks
+    assert chunks[-1] == b"data: tick\n\n"
+
+
+def test_last_event_id_is_available_for_resume():
+    async def events(last_event_id):
+        start = int(last_event_id or 0) + 1
+        for i in range(start, start + 2):
+            yield ServerSentEvent(data=i, id=i)
+
+    router = Router()
+    router.add_route("GET", "/feed", handler=events)
+
+    sent = _run_asgi(_app(router), "/feed", headers=[(b"last-event-id", b"5")])
+
+    body = b"".join(e.get("body", b"") for e in sent[1:])
+    assert body == b"id: 6\ndata: 6\n\nid: 7\ndata: 7\n\n"
+
+
+def test_producer_is_only_advanced_after_previous_event_was_sent():
+    produced = []
+    ahead_at_send = []
+
+    async def events():
+        for i in range(5):
+            produced.append(i)
+            yield i
+
+    def on_send(event):
+        if event.get("body"):
+            ahead_at_send.append(len(produced) - len(ahead_at_send) - 1)
+
+    router = Router()
+    router.add_route("GET", "/numbers", handler=events)
+    _run_asgi(_app(router), "/numbers", on_send=on_send)
+
+    assert produced == [0, 1, 2, 3, 4]
+    assert ahead_at_send == [0, 0, 0, 0, 0]
+
+
+def test_client_disconnect_closes_the_producer():
+    closed = []
+
+    async def forever():
+        try:
+            i = 0
+            while True:
+                i += 1
+                yield i
+                await asyncio.sleep(0)
+        finally:
+            closed.append(True)
+
+    router = Router()
+    router.add_route("GET", "/forever", handler=forever)
+
+    sent = _run_asgi(_app(router), "/forever", disconnect_after=3)
+
+    assert closed == [True]
+    assert len(sent) < 50
+
+
+def test_sync_generator_is_advanced_off_the_event_loop():
+    loop_threads = []
+    producer_threads = []
+
+    def blocking_events():
+        for i in range(3):
+            producer_threads.append(threading.get_ident())
+            time.sleep(0.01)
+            yield i
+
+    def handler():
+        loop_threads.append(threading.get_ident())
+        return EventSourceResponse(blocking_events(), ping_interval=None)
+
+    router = Router()
+    router.add_route("GET", "/blocking", handler=handler)
+
+    sent = _run_asgi(_app(router), "/blocking")
+
+    body = b"".join(e.get("body", b"") for e in sent[1:])
+    assert body == b"data: 0\n\ndata: 1\n\ndata: 2\n\n"
+    assert producer_threads and loop_threads[0] not in producer_threads
+
+
+# ----------------------------------------------------------------------
+# Tornado adapter
+# ----------------------------------------------------------------------
+
+
+def _tornado_case(router):
+    tornado_testing = pytest.importorskip("tornado.testing")
+    app = TornadoAdapter(Dispatcher(router=router)).create_app()
+
+    class _Case(tornado_testing.AsyncHTTPTestCase):
+        def get_app(self):
+            return app
+
+        def runTest(self):
+            pass
+
+    case = _Case()
+    case.setUp()
+    return case
+
+
+def test_tornado_idle_stream_sends_heartbeat_pings():
+    async def slow():
+        await asyncio.sleep(0.05)
+        yield "tick"
+
+    router = Router()
+    router.add_route(
+        "GET", "/ticks", handler=lambda: EventSourceResponse(slow(), ping_interval=0.01),
+    )
+    case = _tornado_case(router)
+    try:
+        response = case.fetch("/ticks")
+    finally:
+        case.tearDown()
+
+    assert response.code == 200
+    assert response.headers["Content-Type"] == "text/event-stream; charset=utf-8"
+    assert response.headers["Cache-Control"] == "no-cache"
+    assert response.body.startswith(b": ping\n\n")
+    assert response.body.endswith(b"data: tick\n\n")
+
+
+def test_tornado_last_event_id_is_available_for_resume():
+    async def events(last_event_id):
+        start = int(last_event_id or 0) + 1
+        for i in range(start, start + 2):
+            yield ServerSentEvent(data=i, id=i)
+
+    router = Router()
+    router.add_route("GET", "/feed", handler=events)
+    case = _tornado_case(router)
+    try:
+        resumed = case.fetch("/feed", headers={"Last-Event-ID": "5"})
+        fresh = case.fetch("/feed")
+    finally:
+        case.tearDown()
+
+    assert resumed.body == b"id: 6\ndata: 6\n\nid: 7\ndata: 7\n\n"
+    assert fresh.body == b"id: 1\ndata: 1\n\nid: 2\ndata: 2\n\n"
+
+
+def test_tornado_client_disconnect_closes_the_producer():
+    closed = []
+    produced = []
+
+    async def forever():
+        try:
+            while True:
+                produced.append(1)
+                yield "x" * 1024
+                await asyncio.sleep(0.001)
+        finally:
+            closed.append(True)
+
+    router = Router()
+    router.add_route("GET", "/forever", handler=forever)
+    case = _tornado_case(router)
+    try:
+        port = case.get_http_port()
+
+        def client():
+            with socket.create_connection(("127.0.0.1", port)) as sock:
+                sock.sendall(b"GET /forever HTTP/1.1\r\nHost: localhost\r\n\r\n")
+                sock.recv(4096)
+
+        async def scenario():
+            await asyncio.get_running_loop().run_in_executor(None, client)
+            for _ in range(500):
+                if closed:
+                    return
+                await asyncio.sleep(0.01)
+
+        case.io_loop.run_sync(scenario)
+    finally:
+        case.tearDown()
+
+    assert closed == [True]
+    assert len(produced) < 5000
@@ -15,7 +15,8 @@ import pytest
 
 from cullinan.web import StaticFiles
 from cullinan.web.gateway import Dispatcher, Router, WebRequest
-from cullinan.web.static.handler import _safe_join, _looks_like_asset
+from cullinan.web.gateway import FileResponse
+from cullinan.web.static.handler import _looks_like_asset, _parse_range_header, _safe_join
 from cullinan.web.static.registry import install_static_files
 
 
@@ -196,6 +197,36 @@ def test_etag_round_trip_returns_304(site: Path):
     assert second.get_header("ETag") == etag
 
 
+def test_weakened_etag_round_trip_returns_304(site: Path):
+    from cullinan.web.gateway import CompressionMiddleware
+
+    (site / "static" / "big.css").write_text("body { color: red; }\n" * 100, encoding="utf-8")
+    router = Router()
+    install_static_files(
+        [StaticFiles(url="/static", directory="static", cache=True)], router=router, project_root=str(site)
+    )
+    dispatcher = Dispatcher(router=router)
+    dispatcher.pipeline.add(CompressionMiddleware())
+
+    gzip_headers = [("Accept-Encoding", "gzip")]
+    miss = _get(dispatcher, "/static/big.css", headers=gzip_headers)
+    hit = _get(dispatcher, "/static/big.css", headers=gzip_headers)
+    # Cached and uncached files are the same kind of response: neither is
+    # re-encoded by the middleware, so both keep the strong validator.
+    assert isinstance(miss, FileResponse) and isinstance(hit, FileResponse)
+    assert miss.get_header("Content-Encoding") is None
+    assert hit.get_header("Content-Encoding") is None
+    assert hit.get_header("ETag") == miss.get_header("ETag")
+    assert hit.render_body() == miss.render_body()
+
+    # A validator weakened downstream (proxy, compression) still revalidates.
+    weak = "W/" + hit.get_header("ETag")
+    revalidated = _get(dispatcher, "/static/big.css", headers=gzip_headers + [("If-None-Match", weak)])
+    assert revalidated.status_code == 304
+    assert _get(dispatcher, "/static/big.css", headers=[("If-None-Match", '"other", ' + weak)]).status_code == 304
+    assert _get(dispatcher, "/static/big.css", headers=[("If-None-Match", "*")]).status_code == 304
+
+
 def test_cache_control_emitted_with_max_age(site: Path):
     dispatcher = _make_dispatcher(
         [StaticFiles(url="/static", directory="static", max_age=3600)], site
@@ -245,6 +276,330 @@ def test_extra_headers_applied(site: Path):
     assert response.get_header("X-Hello") == "world"
 
 
+# ----------------------------------------------------------------------
+# Streaming and Range requests
+# ----------------------------------------------------------------------
+
+
+def test_parse_range_header():
+    assert _parse_range_header("bytes=0-4", 11) == [(0, 5)]
+    assert _parse_range_header("bytes=-3", 11) == [(8, 3)]
+    assert _parse_range_header("bytes=6-", 11) == [(6, 5)]
+    assert _parse_range_header("bytes=0-2, 2-4, 9-20", 11) == [(0, 5), (9, 2)]
+    assert _parse_range_header("bytes=50-60", 11) == []
+    assert _parse_range_header("items=0-1", 11) is None
+    assert _parse_range_header("bytes=4-1", 11) is None
+    assert _parse_range_header("bytes=" + ",".join(["0-1"] * 17), 11) is None
+
+
+def test_get_returns_file_response_with_known_length(site: Path):
+    dispatcher = _make_dispatcher(
+        [StaticFiles(url="/static", directory="static")], site
+    )
+    response = _get(dispatcher, "/static/hello.txt")
+    assert isinstance(response, FileResponse)
+    assert response.get_header("Content-Length") == "11"
+    assert response.get_header("Accept-Ranges") == "bytes"
+
+
+def test_single_range_returns_206(site: Path):
+    dispatcher = _make_dispatcher(
+        [StaticFiles(url="/static", directory="static")], site
+    )
+    response = _get(dispatcher, "/static/hello.txt", headers=[("Range", "bytes=6-")])
+    assert response.status_code == 206
+    assert response.render_body() == b"world"
+    assert response.get_header("Content-Range") == "bytes 6-10/11"
+    assert response.get_header("Content-Length") == "5"
+
+
+def test_multi_range_returns_multipart_byteranges(site: Path):
+    dispatcher = _make_dispatcher(
+        [StaticFiles(url="/static", directory="static")], site
+    )
+    response = _get(dispatcher, "/static/hello.txt", headers=[("Range", "bytes=0-1,-2")])
+    assert response.status_code == 206
+    content_type = response.content_type
+    assert content_type.startswith("multipart/byteranges; boundary=")
+    boundary = content_type.split("boundary=", 1)[1]
+    body = response.render_body()
+    assert int(response.get_header("Content-Length")) == len(body)
+    assert b"Content-Range: bytes 0-1/11\r\n\r\nhe\r\n" in body
+    assert b"Content-Range: bytes 9-10/11\r\n\r\nld\r\n" in body
+    assert body.endswith(f"--{boundary}--\r\n".encode())
+
+
+def test_unsatisfiable_range_returns_416(site: Path):
+    dispatcher = _make_dispatcher(
+        [StaticFiles(url="/static", directory="static")], site
+    )
+    response = _get(dispatcher, "/static/hello.txt", headers=[("Range", "bytes=100-")])
+    assert response.status_code == 416
+    assert response.get_header("Content-Range") == "bytes */11"
+
+
+def test_stale_if_range_serves_full_file(site: Path):
+    dispatcher = _make_dispatcher(
+        [StaticFiles(url="/static", directory="static")], site
+    )
+    response = _get(
+        dispatcher,
+        "/static/hello.txt",
+        headers=[("Range", "bytes=0-1"), ("If-Range", '"stale"')],
+    )
+    assert response.status_code == 200
+    assert response.render_body() == b"hello world"
+
+
+def _asgi_static_get(site: Path, path: str, *, chunk_size=None, extensions=None, headers=()):
+    from cullinan.transport.adapter import ASGIAdapter
+
+    kwargs = {"chunk_size": chunk_size} if chunk_size else {}
+    dispatcher = _make_dispatcher(
+        [StaticFiles(url="/static", directory="static", **kwargs)], site
+    )
+    app = ASGIAdapter(dispatcher=dispatcher).create_app()
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "headers": list(headers),
+        "query_string": b"",
+        "client": ("127.0.0.1", 9000),
+        "server": ("localhost", 8080),
+        "scheme": "http",
+    }
+    if extensions is not None:
+        scope["extensions"] = extensions
+    messages_in = [{"type": "http.request", "body": b"", "more_body": False}]
+    messages_out: list = []
+
+    async def receive():
+        return messages_in.pop(0)
+
+    async def send(message):
+        if message["type"] == "http.response.zerocopysend":
+            message = dict(message)
+            handle = message.pop("file")
+            handle.seek(message["offset"])
+            message["data"] = handle.read(message["count"])
+        messages_out.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    return messages_out
+
+
+def test_asgi_streams_large_file_in_chunks(site: Path):
+    payload = os.urandom(10_000)
+    (site / "static" / "video.bin").write_bytes(payload)
+
+    messages = _asgi_static_get(site, "/static/video.bin", chunk_size=4096)
+
+    start = messages[0]
+    assert (b"content-length", b"10000") in [(k.lower(), v) for k, v in start["headers"]]
+    chunks = [m["body"] for m in messages[1:]]
+    assert [len(c) for c in chunks] == [4096, 4096, 1808, 0]
+    assert b"".join(chunks) == payload
+
+
+def test_asgi_uses_zero_copy_extensions_when_offered(site: Path):
+    messages = _asgi_static_get(
+        site,
+        "/static/hello.txt",
+        extensions={"http.response.pathsend": {}},
+    )
+    assert messages[1] == {
+        "type": "http.response.pathsend",
+        "path": str((site / "static" / "hello.txt").resolve()),
+    }
+
+    messages = _asgi_static_get(
+        site,
+        "/static/hello.txt",
+        extensions={"http.response.zerocopysend": {}},
+        headers=[(b"range", b"bytes=6-")],
+    )
+    assert messages[0]["status"] == 206
+    assert messages[1]["type"] == "http.response.zerocopysend"
+    assert (messages[1]["offset"], messages[1]["count"], messages[1]["data"]) == (6, 5, b"world")
+    assert messages[-1] == {"type": "http.response.body", "body": b"", "more_body": False}
+
+
+# ----------------------------------------------------------------------
+# Hot-asset cache
+# ----------------------------------------------------------------------
+
+
+def _cached_dispatcher(site: Path, **cache_options):
+    spec = StaticFiles(url="/", directory="spa", spa=True, cache=True, **cache_options)
+    router = Router()
+    install_static_files([spec], router=router, project_root=str(site))
+    handler = router.match("GET", "/").entry.handler
+    return Dispatcher(router=router), handler.__cullinan_static_cache__
+
+
+def test_cache_serves_hits_without_touching_disk(site: Path, monkeypatch):
+    from cullinan.web.static import handler as static_handler
+
+    dispatcher, cache = _cached_dispatcher(site, cache_revalidate_interval=60)
+    assert _get(dispatcher, "/settings").render_body() == b"<!doctype html><title>SPA</title>"
+
+    def _no_disk(*_args, **_kwargs):
+        raise AssertionError("filesystem touched on a cache hit")
+
+    monkeypatch.setattr(static_handler, "_resolve_target", _no_disk)
+    monkeypatch.setattr(static_handler, "_stat", _no_disk)
+    monkeypatch.setattr(static_handler, "_read_bytes", _no_disk)
+
+    response = _get(dispatcher, "/settings")
+    assert response.status_code == 200
+    assert b"SPA" in response.render_body()
+    assert response.get_header("ETag") is not None
+    assert _get(dispatcher, "/settings", headers=[("Range", "bytes=0-8")]).render_body() == b"<!doctype"
+    assert cache.stats()["hits"] == 2
+
+
+def test_cache_shares_one_copy_across_spa_routes(site: Path, monkeypatch):
+    from cullinan.web.static import handler as static_handler
+
+    dispatcher, cache = _cached_dispatcher(site, cache_revalidate_interval=60)
+    for path in ("/settings", "/about", "/"):
+        assert _get(dispatcher, path).render_body() == b"<!doctype html><title>SPA</title>"
+    assert cache.stats()["entries"] == 1
+
+    def _no_read(*_args, **_kwargs):
+        raise AssertionError("cached file read again for a new route")
+
+    monkeypatch.setattr(static_handler, "_read_bytes", _no_read)
+    response = _get(dispatcher, "/profile", headers=[("Range", "bytes=0-8")])
+    assert response.status_code == 206
+    assert response.render_body() == b"<!doctype"
+    assert asyncio.run(_collect(response.iter_chunks())) == b"<!doctype"
+    assert response.zero_copy is False
+    assert cache.stats()["entries"] == 1
+
+
+async def _collect(chunks):
+    return b"".join([chunk async for chunk in chunks])
+
+
+def test_cache_revalidates_by_mtime(site: Path):
+    dispatcher, cache = _cached_dispatcher(site, cache_revalidate_interval=0)
+    assert _get(dispatcher, "/assets/main.js").render_body() == b"/* bundle */"
+
+    target = site / "spa" / "assets" / "main.js"
+    target.write_text("/* rebuilt bundle */", encoding="utf-8")
+    stat = target.stat()
+    os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert _get(dispatcher, "/assets/main.js").render_body() == b"/* rebuilt bundle */"
+
+
+def test_cache_is_bounded_by_entries_and_bytes(site: Path):
+    (site / "spa" / "big.bin").write_bytes(b"x" * 64)
+    dispatcher, cache = _cached_dispatcher(
+        site, cache_max_entries=2, cache_max_bytes=60, cache_max_file_size=40,
+    )
+
+    _get(dispatcher, "/big.bin")
+    assert cache.stats()["entries"] == 0
+
+    _get(dispatcher, "/")
+    _get(dispatcher, "/assets/main.js")
+    _get(dispatcher, "/about")
+    stats = cache.stats()
+    assert stats["entries"] <= 2
+    assert stats["bytes"] <= 60
+
+
+# ----------------------------------------------------------------------
+# Precompressed variants
+# ----------------------------------------------------------------------
+
+
+def test_accepted_encodings_honours_q_values():
+    from cullinan.web.static.compress import accepted_encodings
+
+    assert accepted_encodings("gzip, deflate, br") == ["br", "gzip"]
+    assert accepted_encodings("gzip;q=1.0, br;q=0.5") == ["gzip", "br"]
+    assert accepted_encodings("br;q=0, *") == ["gzip"]
+    assert accepted_encodings("identity") == []
+    assert accepted_encodings(None) == []
+
+
+def test_serves_fresh_gzip_sibling_with_vary_and_distinct_etag(site: Path):
+    import gzip
+
+    source = site / "static" / "app.js"
+    (site / "static" / "app.js.gz").write_bytes(gzip.compress(source.read_bytes()))
+    dispatcher = _make_dispatcher(
+        [StaticFiles(url="/static", directory="static", precompressed=True)], site
+    )
+
+    plain = _get(dispatcher, "/static/app.js")
+    encoded = _get(dispatcher, "/static/app.js", headers=[("Accept-Encoding", "br, gzip")])
+
+    assert plain.get_header("Content-Encoding") is None
+    assert plain.get_header("Vary") == "Accept-Encoding"
+    assert encoded.get_header("Content-Encoding") == "gzip"
+    assert encoded.get_header("Vary") == "Accept-Encoding"
+    assert "javascript" in encoded.content_type
+    assert gzip.decompress(encoded.render_body()) == b"console.log(1);"
+    assert encoded.get_header("ETag") != plain.get_header("ETag")
+
+    revalidated = _get(
+        dispatcher,
+        "/static/app.js",
+        headers=[("Accept-Encoding", "gzip"), ("If-None-Match", encoded.get_header("ETag"))],
+    )
+    assert revalidated.status_code == 304
+
+
+def test_stale_variant_is_ignored(site: Path):
+    source = site / "static" / "app.js"
+    variant = site / "static" / "app.js.gz"
+    variant.write_bytes(b"stale")
+    stat = source.stat()
+    os.utime(variant, ns=(stat.st_atime_ns, stat.st_mtime_ns - 1_000_000_000))
+    dispatcher = _make_dispatcher(
+        [StaticFiles(url="/static", directory="static", precompressed=True)], site
+    )
+
+    response = _get(dispatcher, "/static/app.js", headers=[("Accept-Encoding", "gzip")])
+    assert response.get_header("Content-Encoding") is None
+    assert response.render_body() == b"console.log(1);"
+
+
+def test_precompress_writes_variants_into_cache_directory(site: Path):
+    import gzip
+    from cullinan.web.static.compress import precompress_static_files
+
+    (site / "static" / "big.css").write_text("body { color: red; }\n" * 200, encoding="utf-8")
+    spec = StaticFiles(
+        url="/static",
+        directory="static",
+        precompress=True,
+        precompressed_dir="build/precompressed",
+        cache=True,
+    )
+    assert spec.precompressed is True
+
+    dispatcher = _make_dispatcher([spec], site)
+    variant = site / "build" / "precompressed" / "big.css.gz"
+    assert variant.is_file()
+    # Too small to be worth compressing.
+    assert not (site / "build" / "precompressed" / "hello.txt.gz").exists()
+    # Up-to-date variants are not rewritten.
+    assert precompress_static_files(spec, project_root=str(site)) == 0
+
+    for _ in range(2):
+        response = _get(dispatcher, "/static/big.css", headers=[("Accept-Encoding", "gzip")])
+        assert response.get_header("Content-Encoding") == "gzip"
+        assert gzip.decompress(response.render_body()).startswith(b"body { color: red; }")
+    identity = _get(dispatcher, "/static/big.css")
+    assert identity.get_header("Content-Encoding") is None
+
+
 # ----------------------------------------------------------------------
 # SPA fallback
 # ----------------------------------------------------------------------
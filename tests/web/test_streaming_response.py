@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from cullinan.transport.adapter import ASGIAdapter, TornadoAdapter
+from cullinan.web.gateway import Dispatcher, Router, StreamingResponse
+
+
+def _run_asgi(app, path):
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "headers": [],
+        "query_string": b"",
+        "client": ("127.0.0.1", 9000),
+        "server": ("localhost", 8080),
+        "scheme": "http",
+    }
+    events = []
+    received = []
+
+    async def receive():
+        if received:
+            # Body already delivered: block like a server until the client leaves.
+            await asyncio.Event().wait()
+        received.append(True)
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(event):
+        events.append(event)
+
+    asyncio.run(app(scope, receive, send))
+    return events
+
+
+def test_asgi_sends_each_chunk_as_its_own_message():
+    produced = []
+
+    async def rows():
+        for i in range(3):
+            produced.append(i)
+            yield f"row{i}\n"
+
+    router = Router()
+    router.add_route("GET", "/export", handler=lambda: StreamingResponse(rows(), content_type="text/csv"))
+    app = ASGIAdapter(Dispatcher(router=router)).create_app()
+
+    events = _run_asgi(app, "/export")
+
+    start = events[0]
+    header_names = [name.lower() for name, _ in start["headers"]]
+    assert start["status"] == 200
+    assert b"content-length" not in header_names
+    assert (b"content-type", b"text/csv") in [(n.lower(), v) for n, v in start["headers"]]
+    assert [e["body"] for e in events[1:]] == [b"row0\n", b"row1\n", b"row2\n", b""]
+    assert [e["more_body"] for e in events[1:]] == [True, True, True, False]
+
+
+def test_asgi_streams_sync_iterables_and_ends_body_on_error():
+    def chunks():
+        yield b"first"
+        raise RuntimeError("producer failed")
+
+    router = Router()
+    router.add_route("GET", "/sync", handler=lambda: StreamingResponse([b"a", "b", b""]))
+    router.add_route("GET", "/broken", handler=lambda: StreamingResponse(chunks()))
+    app = ASGIAdapter(Dispatcher(router=router)).create_app()
+
+    assert [e["body"] for e in _run_asgi(app, "/sync")[1:]] == [b"a", b"b", b""]
+    broken = _run_asgi(app, "/broken")
+    assert [e["body"] for e in broken[1:]] == [b"first", b""]
+    assert broken[-1]["more_body"] is False
+
+
+def test_sync_iterators_are_advanced_off_the_event_loop():
+    loop_thread = threading.get_ident()
+    producer_threads = []
+    closed = []
+
+    def slow_rows():
+        try:
+            for i in range(3):
+                producer_threads.append(threading.get_ident())
+                time.sleep(0.02)
+                yield f"row{i}"
+        finally:
+            closed.append(True)
+
+    async def main():
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(1)
+                await asyncio.sleep(0.005)
+
+        task = asyncio.ensure_future(ticker())
+        chunks = [chunk async for chunk in StreamingResponse(slow_rows()).iter_chunks()]
+        task.cancel()
+        return chunks, ticks
+
+    chunks, ticks = asyncio.run(main())
+
+    assert chunks == [b"row0", b"row1", b"row2"]
+    assert loop_thread not in producer_threads
+    assert len(ticks) > 3
+    assert closed == [True]
+
+
+def test_streaming_response_is_single_use_and_not_renderable():
+    response = StreamingResponse([b"x"])
+
+    with pytest.raises(RuntimeError):
+        response.render_body()
+
+    async def drain():
+        return [chunk async for chunk in response.iter_chunks()]
+
+    assert asyncio.run(drain()) == [b"x"]
+    with pytest.raises(RuntimeError):
+        asyncio.run(drain())
+
+
+def test_tornado_writer_flushes_after_every_chunk():
+    writer = TornadoAdapter(Dispatcher()).create_response_writer()
+
+    class FakeHandler:
+        def __init__(self):
+            self._finished = False
+            self.headers = {}
+            self.status_code = None
+            self.pending = b""
+            self.flushed = []
+
+        def set_header(self, name, value):
+            self.headers[name] = value
+
+        def add_header(self, name, value):
+            self.headers[name] = value
+
+        def set_status(self, status):
+            self.status_code = status
+
+        def write(self, chunk):
+            self.pending += chunk
+
+        async def flush(self):
+            self.flushed.append(self.pending)
+            self.pending = b""
+
+        def finish(self):
+            self._finished = True
+
+    handler = FakeHandler()
+    response = StreamingResponse(iter([b"a", b"bc"]), status_code=206)
+    asyncio.run(writer.write_streaming_response(response, handler))
+
+    assert handler.status_code == 206
+    assert handler.flushed == [b"a", b"bc"]
+    assert handler._finished is True
+    assert "Content-Length" not in handler.headers
+
+
+def test_tornado_writer_closes_producer_on_client_disconnect():
+    import tornado.iostream
+
+    writer = TornadoAdapter(Dispatcher()).create_response_writer()
+    closed = []
+
+    async def rows():
+        try:
+            for i in range(10):
+                yield f"row{i}"
+        finally:
+            closed.append(True)
+
+    class DisconnectingHandler:
+        _finished = False
+
+        def set_header(self, name, value):
+            pass
+
+        add_header = set_header
+
+        def set_status(self, status):
+            pass
+
+        def write(self, chunk):
+            pass
+
+        async def flush(self):
+            raise tornado.iostream.StreamClosedError()
+
+    async def main():
+        await writer.write_streaming_response(StreamingResponse(rows()), DisconnectingHandler())
+        # Closed by the writer itself, not by the loop's shutdown_asyncgens()
+        return list(closed)
+
+    assert asyncio.run(main()) == [True]
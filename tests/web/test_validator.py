@@ -6,12 +6,15 @@
 Author: Cullinan
 """
 
+import re
 import unittest
+from unittest import mock
 
 from cullinan.web.params import (
     ParamValidator,
     ValidationError,
     Param,
+    ParamResolver,
     Query,
 )
 
@@ -181,3 +184,69 @@ class TestParamValidatorWithParam(unittest.TestCase):
         param = Query(int, name="page", default=1)
         ParamValidator.validate_param(param, None)  # 不抛出，因为有默认值 = 不必填
 
+
+
+class TestParamValidatorCompiled(unittest.TestCase):
+    """测试预编译校验函数"""
+
+    def test_same_errors_as_rules(self):
+        """编译后的错误与逐条规则校验一致"""
+        param = Query(str, name="code", min_length=2, max_length=4, regex=r"^[a-z]+$")
+        validate = ParamValidator.compile(param)
+        for value in ("a", "abcde", "AB1"):
+            with self.assertRaises(ValidationError) as compiled:
+                validate(value)
+            with self.assertRaises(ValidationError) as rules:
+                ParamValidator.validate(value, param.get_validators(), "code")
+            self.assertEqual(compiled.exception.message, rules.exception.message)
+            self.assertEqual(compiled.exception.constraint, rules.exception.constraint)
+        validate("abc")
+
+    def test_short_circuit_order(self):
+        """按 数值 → 长度 → 正则 顺序报告首个失败"""
+        validate = ParamValidator.compile(Param(int, name="n", ge=0, le=10, regex=r"^\d$"))
+        with self.assertRaises(ValidationError) as ctx:
+            validate(50)
+        self.assertEqual(ctx.exception.constraint, "le:10")
+        with self.assertRaises(ValidationError) as ctx:
+            validate(None)
+        self.assertEqual(ctx.exception.constraint, "required")
+
+    def test_regex_compiled_once(self):
+        """校验时不再编译正则"""
+        validate = ParamValidator.compile(Query(str, name="slug", regex=r"^[a-z-]+$"))
+        with mock.patch.object(re, "compile", side_effect=AssertionError("recompiled")), \
+                mock.patch.object(re, "match", side_effect=AssertionError("recompiled")):
+            validate("hello-world")
+            with self.assertRaises(ValidationError):
+                validate("Hello")
+
+    def test_constraint_change_invalidates_cached_validator(self):
+        """修改约束后 validate_param 使用新约束"""
+        param = Query(int, name="age", le=10)
+        with self.assertRaises(ValidationError):
+            ParamValidator.validate_param(param, 50)
+
+        param.le = 100
+        ParamValidator.validate_param(param, 50)
+        self.assertEqual(param.get_validators(), [("le", 100)])
+
+        param.required = False
+        ParamValidator.validate_param(param, None)
+
+        param.regex = r"^\d$"
+        with self.assertRaises(ValidationError) as ctx:
+            ParamValidator.validate_param(param, 12)
+        self.assertEqual(ctx.exception.constraint, "regex:^\\d$")
+
+    def test_resolver_precompiles_validator(self):
+        """参数分析阶段生成校验函数"""
+        def handler(self, size: int = Query(default=10, ge=1, le=100)):
+            pass
+
+        config = ParamResolver.analyze_params(handler)["size"]
+        self.assertTrue(callable(config["validator"]))
+        extract = ParamResolver.compile_param("size", config)
+        self.assertEqual(extract({}, {"size": "20"}, {}, {}, {}, None), 20)
+        with self.assertRaises(ValidationError):
+            extract({}, {"size": "500"}, {}, {}, {}, None)
@@ -1,11 +1,16 @@
 # -*- coding: utf-8 -*-
 
 import asyncio
+import pickle
+from http.cookies import SimpleCookie
+
+import pytest
 
 from cullinan.transport.adapter import ASGIAdapter, TornadoAdapter
 from cullinan.web.gateway import (
     Dispatcher,
     HeaderPolicy,
+    QueryParams,
     Router,
     WebRequest,
     WebResponse,
@@ -29,6 +34,51 @@ def test_web_headers_are_case_insensitive_and_multi_value():
     assert headers.get_all("set-cookie") == ["a=1", "b=2"]
 
 
+def test_web_headers_index_tracks_set_remove_and_copy():
+    headers = WebHeaders([("A", "1"), ("X-Test", "a"), ("B", "2"), ("x-test", "b")])
+
+    headers.set("X-TEST", "c")
+    assert headers.items() == [("A", "1"), ("B", "2"), ("X-TEST", "c")]
+    assert headers.get_all("x-test") == ["c"]
+
+    clone = headers.copy()
+    clone.add("x-test", "d")
+    assert headers.get_all("X-Test") == ["c"]
+    assert clone.get("X-Test") == "d"
+
+    headers.remove("a")
+    assert "A" not in headers
+    assert headers.get("a", "missing") == "missing"
+    assert headers.get_all("a") == []
+    assert headers.keys() == ["B", "X-TEST"]
+
+    headers.remove("absent")
+    assert len(headers) == 2
+
+
+def test_query_params_are_parsed_once_into_read_only_multi_dict():
+    request = WebRequest(query_string="tag=a&page=1&tag=b&empty=")
+    params = request.query_params
+
+    assert params is request.query_params
+    assert params == {"tag": "b", "page": "1", "empty": ""}
+    assert params.get_first("tag") == "a"
+    assert params.get_all("tag") == ["a", "b"]
+    assert params.get_all("missing") == []
+    assert request.query_params_multi["tag"] == ["a", "b"]
+
+    with pytest.raises(TypeError):
+        params["tag"] = "c"
+    with pytest.raises(TypeError):
+        params.update(page="2")
+    with pytest.raises(TypeError):
+        request.query_params_multi["tag"] = ["c"]
+
+    clone = pickle.loads(pickle.dumps(params))
+    assert isinstance(clone, QueryParams)
+    assert clone.get_all("tag") == ["a", "b"]
+
+
 def test_response_freeze_blocks_mutation_and_emits_cookies():
     response = WebResponse.json({"ok": True})
     response.set_cookie("sid", "abc", http_only=True, secure=True)
@@ -68,6 +118,63 @@ def test_dispatcher_applies_header_policy_and_return_value_handler():
     assert b'"status": "ok"' in response.render_body()
 
 
+def test_header_policy_recomputes_headers_when_reconfigured():
+    policy = HeaderPolicy(default_security_headers={"X-Frame-Options": "DENY"})
+    response = policy.apply(WebRequest(), WebResponse.text("ok").set_header("x-frame-options", "SAMEORIGIN"))
+    assert response.header_map.get_all("X-Frame-Options") == ["SAMEORIGIN"]
+    assert response.get_header("Access-Control-Allow-Origin") is None
+
+    policy.allow_origins = "https://example.com"
+    response = policy.apply(WebRequest(), WebResponse.text("ok"))
+    assert response.get_header("X-Frame-Options") == "DENY"
+    assert response.get_header("Access-Control-Allow-Origin") == "https://example.com"
+
+
+def test_header_policy_security_headers_cannot_go_stale():
+    policy = HeaderPolicy(default_security_headers={"X-Frame-Options": "DENY"})
+    policy.apply(WebRequest(), WebResponse.text("ok"))
+
+    # In-place edits stay supported and drop the precomputed headers
+    policy.default_security_headers["X-Frame-Options"] = "SAMEORIGIN"
+    policy.default_security_headers.update({"Referrer-Policy": "no-referrer"})
+    response = policy.apply(WebRequest(), WebResponse.text("ok"))
+    assert response.get_header("X-Frame-Options") == "SAMEORIGIN"
+    assert response.get_header("Referrer-Policy") == "no-referrer"
+
+    del policy.default_security_headers["X-Frame-Options"]
+    response = policy.apply(WebRequest(), WebResponse.text("ok"))
+    assert response.get_header("X-Frame-Options") is None
+    assert response.get_header("Referrer-Policy") == "no-referrer"
+
+    policy.set_security_header("X-Frame-Options", "DENY")
+    policy.remove_security_header("Referrer-Policy")
+    response = policy.apply(WebRequest(), WebResponse.text("ok"))
+    assert response.get_header("X-Frame-Options") == "DENY"
+    assert response.get_header("Referrer-Policy") is None
+
+    policy.default_security_headers.clear()
+    assert policy.apply(WebRequest(), WebResponse.text("ok")).get_header("X-Frame-Options") is None
+    assert isinstance(policy.default_security_headers, dict)
+
+
+def test_asgi_writer_prepends_pre_encoded_global_headers():
+    adapter = ASGIAdapter(Dispatcher(), global_headers=[["X-Powered-By", "cullinan"], ["broken"], ("X-Num", 1)])
+    events = []
+
+    async def send(event):
+        events.append(event)
+
+    writer = adapter.create_response_writer()
+    asyncio.run(writer.write_response(WebResponse.text("ok"), send))
+    asyncio.run(writer.write_response(WebResponse.text("ok"), send))
+
+    first, second = events[0]["headers"], events[2]["headers"]
+    assert first[:2] == [[b"X-Powered-By", b"cullinan"], [b"X-Num", b"1"]]
+    assert first == second
+    assert first is not second
+    assert [b"content-length", b"2"] in first
+
+
 def test_runtime_switch_is_atomic_and_drains_previous_runtime():
     # Ensure no leftover _active_runtime from other tests.
     WebRuntime.clear_active()
@@ -140,6 +247,120 @@ def test_asgi_adapter_preserves_multi_headers_and_writes_cookies():
     assert any(name.lower() == "set-cookie" and "sid=abc" in value for name, value in header_pairs)
 
 
+def test_asgi_request_decodes_headers_and_cookies_on_demand():
+    adapter = ASGIAdapter(Dispatcher())
+    request = asyncio.run(
+        adapter.create_request_adapter().build_request(
+            {
+                "type": "http",
+                "method": "GET",
+                "path": "/health",
+                "headers": [(b"host", b"api.example"), (b"cookie", b"sid=abc; bad cookie; mode=dark")],
+                "query_string": b"verbose=1",
+                "server": ("localhost", 8080),
+            },
+            b"",
+        )
+    )
+
+    assert request._headers is None
+    assert request._cookies is None
+    assert request._full_url is None
+    assert request.full_url == "http://localhost:8080/health?verbose=1"
+    assert request._headers is None
+
+    assert request.authority == "api.example"
+    assert request.cookie("mode") == "dark"
+    assert request.cookies.get("sid") == "abc"
+    assert request.headers is request.headers
+
+
+_COOKIE_HEADERS = [
+    [],
+    [b"sid=abc; mode=dark"],
+    [b'sid="quoted value"; theme=light'],
+    [b"sid=abc; bad cookie; mode=dark"],
+    [b"token=a=b=c"],
+    [b"  spaced = v ;k=v2 "],
+    [b"novalue"],
+    [b"first=1", b"second=2"],
+]
+
+
+def _legacy_web_request_cookies(cookie_header):
+    # WebRequest before lazy parsing: SimpleCookie only
+    if not cookie_header:
+        return {}
+    cookie = SimpleCookie()
+    cookie.load(cookie_header)
+    return {name: morsel.value for name, morsel in cookie.items()}
+
+
+def _legacy_asgi_request(scope):
+    # The ASGI adapter before lazy parsing: decoded every header, split the
+    # last Cookie header on ';'/'=' and always built full_url with the query.
+    headers = [(n.decode("latin-1"), v.decode("latin-1")) for n, v in scope["headers"]]
+    query_string = scope["query_string"].decode("latin-1")
+    host, port = scope["server"]
+    full_url = f'{scope["scheme"]}://{host}:{port}{scope["path"]}'
+    if query_string:
+        full_url += f"?{query_string}"
+    cookies = {}
+    cookie_header = ""
+    for name, value in headers:
+        if name.lower() == "cookie":
+            cookie_header = value
+    if cookie_header:
+        for part in cookie_header.split(";"):
+            part = part.strip()
+            if "=" in part:
+                k, v = part.split("=", 1)
+                cookies[k.strip()] = v.strip()
+    return WebRequest(
+        path=scope["path"], headers=headers, query_string=query_string,
+        scheme=scope["scheme"], server_host=host, server_port=port,
+        full_url=full_url, cookies=cookies,
+    )
+
+
+def test_lazy_cookies_and_full_url_match_legacy_web_request():
+    for values in _COOKIE_HEADERS:
+        for query_string in ("", "verbose=1"):
+            headers = [("Cookie", value.decode("latin-1")) for value in values]
+            request = WebRequest(
+                path="/items", headers=headers, query_string=query_string,
+                server_host="api.example", server_port=8080,
+            )
+            expected = _legacy_web_request_cookies(headers[-1][1] if headers else None)
+            assert request.cookies.as_dict() == expected, values
+            assert request._full_url is None
+            assert request.full_url == "http://api.example:8080/items"
+
+    assert WebRequest(full_url="https://api.example/items?x=1").full_url == "https://api.example/items?x=1"
+
+
+def test_asgi_lazy_cookies_and_full_url_match_legacy_adapter():
+    adapter = ASGIAdapter(Dispatcher()).create_request_adapter()
+    for values in _COOKIE_HEADERS:
+        for query_string in (b"", b"verbose=1&tag=a"):
+            scope = {
+                "type": "http",
+                "method": "GET",
+                "path": "/items",
+                "headers": [(b"host", b"api.example")] + [(b"cookie", value) for value in values],
+                "query_string": query_string,
+                "server": ("localhost", 8080),
+                "scheme": "http",
+            }
+            request = asyncio.run(adapter.build_request(scope, b""))
+            legacy = _legacy_asgi_request(scope)
+
+            assert request._cookies is None
+            assert request.cookies.as_dict() == legacy.cookies.as_dict(), values
+            assert request.full_url == legacy.full_url
+            assert request.headers.items() == legacy.headers.items()
+
+
 def test_tornado_writer_preserves_duplicate_set_cookie_headers():
     writer = TornadoAdapter(Dispatcher()).create_response_writer()
     response = WebResponse.text("ok")